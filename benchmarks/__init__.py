@@ -0,0 +1 @@
+"""Offline performance benchmarks for dart_digest hot paths."""
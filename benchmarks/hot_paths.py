@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from benchmarks import synthetic
+from dart_digest.article_writer import ArticleWriter, _build_user_prompt
+from dart_digest.columnar import DisclosureBatch
+from dart_digest.config import Settings
+from dart_digest.dart_client import parse_disclosures
+from dart_digest.market_filter import CompanyUniverse, MarketFilter
+from dart_digest.open_dart_client import parse_list_page, parse_list_page_batch
+from dart_digest.pipeline import DigestPipeline
+from dart_digest.scoring import score_batch, score_disclosures
+
+
+DEFAULT_SIZES = (100, 1000, 10000)
+DEFAULT_THRESHOLD = 0.20
+
+
+@dataclass
+class BenchResult:
+    name: str
+    size: int
+    repeat: int
+    min_s: float
+    median_s: float
+    per_item_us: float
+
+
+def bench_settings(workdir: Path, company_count: int = 2000) -> Settings:
+    return Settings(
+        rss_url="https://example.com/rss.xml",
+        db_path=workdir / "bench.db",
+        company_map_path=synthetic.write_company_map(workdir / "companies.csv", company_count),
+        target_markets=("KOSPI", "KOSDAQ"),
+        dart_api_key=None,
+        timezone="Asia/Seoul",
+        top_n_max=2,
+        second_pick_min_score=78.0,
+        second_pick_min_gap=6.0,
+        openai_api_key=None,
+        openai_model="gpt-4.1-mini",
+        slack_webhook_url=None,
+        slack_channel=None,
+        notify_on_skip=False,
+        require_slack_webhook=False,
+        dry_run=True,
+        score_cache_persist=False,
+    )
+
+
+def build_cases(settings: Settings) -> dict[str, Callable[[int], Callable[[], object]]]:
+    # Each case maps a size to a zero-argument callable that performs the timed work.
+    universe = CompanyUniverse.from_csv(settings.company_map_path)
+    market_filter = MarketFilter(universe, settings.target_markets)
+    pipeline = DigestPipeline(settings)
+    writer = ArticleWriter(settings)
+    run_dt = datetime(2026, 2, 27, 18, 10, 0)
+
+    def parse_rss(size: int) -> Callable[[], object]:
+        xml = synthetic.make_rss_xml(size)
+        return lambda: parse_disclosures(xml)
+
+    def parse_opendart(size: int) -> Callable[[], object]:
+        pages = synthetic.make_opendart_pages(size)
+        return lambda: [item for page in pages for item in parse_list_page(page, "20260227", "Y")]
+
+    def market_filter_case(size: int) -> Callable[[], object]:
+        disclosures = synthetic.make_disclosures(size)
+        return lambda: market_filter.filter(disclosures)
+
+    def score(size: int) -> Callable[[], object]:
+        disclosures = synthetic.make_disclosures(size)
+        return lambda: score_disclosures(disclosures)
+
+    def columnar(size: int) -> Callable[[], object]:
+        # OpenDART pages -> DisclosureBatch -> filter -> score, with no per-row objects.
+        pages = synthetic.make_opendart_pages(size)
+
+        def work() -> object:
+            batch = DisclosureBatch()
+            for page in pages:
+                parse_list_page_batch(page, "20260227", "Y", into=batch)
+            return score_batch(market_filter.filter(batch))
+
+        return work
+
+    def pick_top(size: int) -> Callable[[], object]:
+        scored = synthetic.make_scored(size)
+        return lambda: pipeline._pick_top(scored)
+
+    def write_template(size: int) -> Callable[[], object]:
+        # Render one two-pick article per pair of scored items.
+        scored = synthetic.make_scored(size)
+        pairs = [scored[idx : idx + 2] for idx in range(0, len(scored) - 1, 2)]
+        return lambda: [writer._write_template(pair, run_dt, {}) for pair in pairs]
+
+    def render_article(size: int) -> Callable[[], object]:
+        # Template plus LLM prompt per pair with related news, as one run renders them.
+        scored = synthetic.make_scored(size)
+        news_map = synthetic.make_news_map(scored)
+        pairs = [scored[idx : idx + 2] for idx in range(0, len(scored) - 1, 2)]
+
+        def work() -> object:
+            for item in scored:
+                item.issue_context = None
+            return [
+                (
+                    writer._write_template(pair, run_dt, news_map),
+                    _build_user_prompt(pair, run_dt, news_map),
+                )
+                for pair in pairs
+            ]
+
+        return work
+
+    return {
+        "parse_disclosures": parse_rss,
+        "parse_list_page": parse_opendart,
+        "market_filter": market_filter_case,
+        "score_disclosures": score,
+        "columnar_path": columnar,
+        "pick_top": pick_top,
+        "write_template": write_template,
+        "render_article": render_article,
+    }
+
+
+def time_case(name: str, size: int, work: Callable[[], object], repeat: int) -> BenchResult:
+    timings: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        work()
+        timings.append(time.perf_counter() - started)
+
+    median = statistics.median(timings)
+    return BenchResult(
+        name=name,
+        size=size,
+        repeat=repeat,
+        min_s=round(min(timings), 6),
+        median_s=round(median, 6),
+        per_item_us=round(median / max(size, 1) * 1_000_000, 3),
+    )
+
+
+def run_suite(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeat: int = 5,
+    only: set[str] | None = None,
+) -> dict:
+    results: list[BenchResult] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = build_cases(bench_settings(Path(tmp)))
+        for name, prepare in cases.items():
+            if only and name not in only:
+                continue
+            for size in sizes:
+                results.append(time_case(name, size, prepare(size), repeat))
+
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    base_index = {(r["name"], r["size"]): r for r in baseline.get("results", [])}
+    rows: list[dict] = []
+    for result in current.get("results", []):
+        base = base_index.get((result["name"], result["size"]))
+        if base is None or base["median_s"] <= 0:
+            continue
+        ratio = result["median_s"] / base["median_s"]
+        rows.append(
+            {
+                "name": result["name"],
+                "size": result["size"],
+                "baseline_s": base["median_s"],
+                "current_s": result["median_s"],
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1.0 + threshold,
+            }
+        )
+    return rows
+
+
+def _print_results(report: dict) -> None:
+    print(f"{'case':<20} {'size':>8} {'median_s':>12} {'per_item_us':>12}")
+    for row in report["results"]:
+        print(
+            f"{row['name']:<20} {row['size']:>8} {row['median_s']:>12.6f} "
+            f"{row['per_item_us']:>12.3f}"
+        )
+
+
+def _print_comparison(rows: list[dict]) -> None:
+    print(f"{'case':<20} {'size':>8} {'baseline_s':>12} {'current_s':>12} {'ratio':>7}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:<20} {row['size']:>8} {row['baseline_s']:>12.6f} "
+            f"{row['current_s']:>12.6f} {row['ratio']:>7.3f}{flag}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark dart_digest hot paths offline.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run the benchmark suite.")
+    run_parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated input sizes (default: 100,1000,10000).",
+    )
+    run_parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per case.")
+    run_parser.add_argument("--only", help="Comma-separated case names to run.")
+    run_parser.add_argument("--output", help="Write results JSON to this path.")
+
+    cmp_parser = sub.add_parser("compare", help="Compare results against a baseline.")
+    cmp_parser.add_argument("baseline", help="Baseline results JSON.")
+    cmp_parser.add_argument("current", help="Current results JSON.")
+    cmp_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown ratio before flagging a regression (default: 0.20).",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        sizes = tuple(int(x) for x in args.sizes.split(",") if x.strip())
+        only = {x.strip() for x in args.only.split(",")} if args.only else None
+        report = run_suite(sizes=sizes, repeat=max(1, args.repeat), only=only)
+        _print_results(report)
+        if args.output:
+            Path(args.output).write_text(
+                json.dumps(report, ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    rows = compare(baseline, current, threshold=args.threshold)
+    _print_comparison(rows)
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
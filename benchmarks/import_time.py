@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_MODULE = "dart_digest.cli"
+DEFAULT_BUDGET_MS = 60.0
+# Importing the CLI must not drag in the network stack or the pipeline.
+DEFAULT_FORBIDDEN = ("requests", "urllib3", "dart_digest.pipeline", "dart_digest.article_writer")
+
+_CHILD = (
+    "import json, sys\n"
+    "before = set(sys.modules)\n"
+    "import {module}\n"
+    "print(json.dumps(sorted(set(sys.modules) - before)))\n"
+)
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    # `-X importtime` lines: "import time: self [us] | cumulative | <indent>package".
+    rows: list[tuple[str, int, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure(module: str = DEFAULT_MODULE) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD.format(module=module)],
+        capture_output=True,
+        text=True,
+        cwd=ROOT_DIR,
+        check=True,
+    )
+    loaded = set(json.loads(completed.stdout.strip().splitlines()[-1]))
+    rows = [row for row in parse_importtime(completed.stderr) if row[0] in loaded]
+    return {
+        "module": module,
+        "total_us": sum(cumulative for _, _, cumulative, depth in rows if depth == 0),
+        "modules": sorted(loaded),
+        "top": sorted(
+            (
+                {"name": name, "self_us": self_us, "cumulative_us": cumulative}
+                for name, self_us, cumulative, _ in rows
+            ),
+            key=lambda row: row["self_us"],
+            reverse=True,
+        ),
+    }
+
+
+def check(
+    module: str = DEFAULT_MODULE,
+    repeat: int = 5,
+    budget_ms: float = DEFAULT_BUDGET_MS,
+    forbidden: tuple[str, ...] = DEFAULT_FORBIDDEN,
+) -> dict:
+    # Best of N: the first run also pays for writing .pyc files and a cold page cache.
+    runs = [measure(module) for _ in range(max(1, repeat))]
+    best = min(runs, key=lambda run: run["total_us"])
+    leaked = sorted(name for name in forbidden if name in best["modules"])
+    best["budget_ms"] = budget_ms
+    best["forbidden_loaded"] = leaked
+    best["ok"] = best["total_us"] / 1000 <= budget_ms and not leaked
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Guard the import-time budget of the CLI.")
+    parser.add_argument("--module", default=DEFAULT_MODULE)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules (self time) to list.")
+    parser.add_argument(
+        "--forbid",
+        default=",".join(DEFAULT_FORBIDDEN),
+        help="Comma-separated modules that must not be imported (empty to disable).",
+    )
+    args = parser.parse_args(argv)
+
+    forbidden = tuple(name.strip() for name in args.forbid.split(",") if name.strip())
+    report = check(args.module, args.repeat, args.budget_ms, forbidden)
+
+    print(
+        f"import {report['module']}: {report['total_us'] / 1000:.1f} ms "
+        f"(budget {report['budget_ms']:.1f} ms, {len(report['modules'])} modules)"
+    )
+    for row in report["top"][: args.top]:
+        print(f"  {row['self_us'] / 1000:8.2f} ms  {row['name']}")
+    for name in report["forbidden_loaded"]:
+        print(f"FORBIDDEN {name} was imported")
+    if report["total_us"] / 1000 > report["budget_ms"]:
+        print("OVER BUDGET")
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+from benchmarks import synthetic
+from benchmarks.hot_paths import bench_settings
+from dart_digest.server import ScoringService, make_server
+
+
+DEFAULT_ENDPOINTS = ("score", "score-batch", "classify")
+
+
+def make_requests(endpoint: str, count: int, batch_size: int, seed: int = 29) -> list[tuple]:
+    # (method, path, body) triples; distinct titles so the score cache does not hide the work.
+    rng = random.Random(seed)
+    per_request = batch_size if endpoint == "score-batch" else 1
+    disclosures = synthetic.make_disclosures(count * per_request)
+    if endpoint == "classify":
+        return [
+            ("GET", f"/classify-company?name={quote(item.company_name)}", None)
+            if rng.random() < 0.5
+            else ("POST", "/classify-company", {"name": item.company_name})
+            for item in disclosures
+        ]
+    items = [{"title": item.title, "description": item.description} for item in disclosures]
+    if endpoint == "score":
+        return [("POST", "/score", item) for item in items]
+    return [
+        ("POST", "/score", {"items": items[start : start + batch_size]})
+        for start in range(0, len(items), batch_size)
+    ]
+
+
+def run_load(
+    base_url: str,
+    requests: list[tuple],
+    concurrency: int = 8,
+) -> dict:
+    url = urlsplit(base_url)
+    latencies: list[float] = []
+    errors: list[str] = []
+    lock = threading.Lock()
+    queue = iter(requests)
+
+    def worker() -> None:
+        # One keep-alive connection per worker, as a pooled client would use.
+        conn = http.client.HTTPConnection(url.hostname, url.port, timeout=30)
+        local: list[float] = []
+        try:
+            while True:
+                with lock:
+                    job = next(queue, None)
+                if job is None:
+                    break
+                method, path, body = job
+                data = None if body is None else json.dumps(body, ensure_ascii=False).encode()
+                headers = {} if data is None else {"Content-Type": "application/json"}
+                started = time.perf_counter()
+                try:
+                    conn.request(method, path, body=data, headers=headers)
+                    response = conn.getresponse()
+                    response.read()
+                    status = response.status
+                except (OSError, http.client.HTTPException) as exc:
+                    conn.close()
+                    status = type(exc).__name__
+                local.append(time.perf_counter() - started)
+                if status != 200:
+                    with lock:
+                        errors.append(f"{method} {path}: {status}")
+        finally:
+            conn.close()
+            with lock:
+                latencies.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(max(1, concurrency))]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "concurrency": concurrency,
+        "wall_seconds": round(wall, 3),
+        "rps": round(len(latencies) / wall, 1) if wall else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+def run_suite(
+    base_url: str | None = None,
+    endpoints: tuple[str, ...] = DEFAULT_ENDPOINTS,
+    count: int = 2000,
+    concurrency: int = 8,
+    batch_size: int = 50,
+) -> dict:
+    # Without --url, a server on a synthetic 2000-company universe runs in-process.
+    with tempfile.TemporaryDirectory() as tmp:
+        server = None
+        if base_url is None:
+            service = ScoringService.from_settings(bench_settings(Path(tmp)))
+            server = make_server(service, "127.0.0.1", 0)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        try:
+            results = {}
+            for endpoint in endpoints:
+                requests = make_requests(endpoint, count, batch_size)
+                results[endpoint] = run_load(base_url, requests, concurrency)
+                if endpoint == "score-batch":
+                    results[endpoint]["items_per_second"] = round(
+                        results[endpoint]["rps"] * batch_size, 1
+                    )
+        finally:
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+    return {"url": base_url, "results": results}
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    # `values` must be sorted; nearest-rank.
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the dart-digest scoring service.")
+    parser.add_argument("--url", help="Running server (default: start one in-process).")
+    parser.add_argument(
+        "--endpoints",
+        default=",".join(DEFAULT_ENDPOINTS),
+        help="Comma-separated subset of: score, score-batch, classify.",
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per endpoint.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=50, help="Items per score-batch call.")
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args(argv)
+
+    endpoints = tuple(name.strip() for name in args.endpoints.split(",") if name.strip())
+    unknown = sorted(set(endpoints) - set(DEFAULT_ENDPOINTS))
+    if unknown:
+        parser.error(f"unknown endpoint(s): {', '.join(unknown)}")
+    report = run_suite(
+        args.url, endpoints, max(1, args.requests), args.concurrency, max(1, args.batch_size)
+    )
+
+    print(f"{'endpoint':<12} {'requests':>8} {'errors':>6} {'rps':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, row in report["results"].items():
+        print(
+            f"{name:<12} {row['requests']:>8} {row['errors']:>6} {row['rps']:>9.1f} "
+            f"{row['p50_ms']:>8.2f} {row['p99_ms']:>8.2f}"
+        )
+    if args.output:
+        out_path = Path(args.output)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    errors = sum(row["errors"] for row in report["results"].values())
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks import synthetic
+from dart_digest.columnar import DisclosureBatch, ScoredBatch
+from dart_digest.models import Disclosure
+from dart_digest.scoring import _build_scored, _score_input, _to_input, score_batch
+
+
+DEFAULT_SIZES = (10_000, 100_000)
+
+
+# The models as they were before slots: a __dict__ per instance, market and ticker in
+# a free-form raw dict, and a fresh reasons list per scored item.
+@dataclass
+class LegacyDisclosure:
+    company_name: str
+    title: str
+    link: str
+    receipt_no: str
+    published_at: datetime
+    description: str
+    raw: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class LegacyScoredDisclosure:
+    disclosure: LegacyDisclosure
+    market: str
+    event_type: str
+    event_score: float
+    financial_score: float
+    persistence_score: float
+    confidence_score: float
+    market_bonus: float
+    total_score: float
+    reasons: list[str]
+    issue_context: Any = None
+
+
+def build_legacy(sources: list[Disclosure]) -> list[LegacyScoredDisclosure]:
+    items = []
+    for source in sources:
+        disclosure = LegacyDisclosure(
+            company_name=source.company_name,
+            title=source.title,
+            link=source.link,
+            receipt_no=source.receipt_no,
+            published_at=source.published_at,
+            description=source.description,
+            raw={"market": source.market, "ticker": source.ticker},
+        )
+        items.append(LegacyScoredDisclosure(disclosure, *_score_input(_to_input(source))))
+    return items
+
+
+def build_current(sources: list[Disclosure]) -> list:
+    items = []
+    for source in sources:
+        disclosure = Disclosure(
+            company_name=source.company_name,
+            title=source.title,
+            link=source.link,
+            receipt_no=source.receipt_no,
+            published_at=source.published_at,
+            description=source.description,
+            market=source.market,
+            ticker=source.ticker,
+        )
+        items.append(_build_scored(disclosure, _score_input(_to_input(source))))
+    return items
+
+
+def build_columnar(sources: list[Disclosure]) -> ScoredBatch:
+    batch = DisclosureBatch()
+    for source in sources:
+        batch.append(
+            source.company_name,
+            source.title,
+            source.link,
+            source.receipt_no,
+            source.published_at,
+            source.description,
+            source.market,
+            source.ticker,
+        )
+    return score_batch(batch)
+
+
+def bytes_per_item(build: Callable[[list[Disclosure]], Any], sources: list[Disclosure]) -> float:
+    # Only what the scored items keep alive: the input strings are shared by all
+    # builds and allocated before tracing starts.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        items = build(sources)
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del items
+    return retained / max(1, len(sources))
+
+
+def run_suite(sizes: tuple[int, ...] = DEFAULT_SIZES) -> dict:
+    rows = []
+    for size in sizes:
+        sources = synthetic.make_disclosures(size)
+        for source in sources:
+            source.ticker = source.receipt_no[-6:]
+        legacy = bytes_per_item(build_legacy, sources)
+        current = bytes_per_item(build_current, sources)
+        columnar = bytes_per_item(build_columnar, sources)
+        rows.append(
+            {
+                "size": size,
+                "legacy_bytes_per_item": round(legacy, 1),
+                "slotted_bytes_per_item": round(current, 1),
+                "columnar_bytes_per_item": round(columnar, 1),
+                "saved": round(1 - current / legacy, 3) if legacy else 0.0,
+            }
+        )
+    return {"results": rows}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Bytes retained per scored disclosure: legacy, slotted and columnar."
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated synthetic disclosure counts.",
+    )
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args(argv)
+
+    report = run_suite(tuple(int(size) for size in args.sizes.split(",") if size.strip()))
+    print(
+        f"{'size':>8} {'legacy B/item':>14} {'slotted B/item':>15} {'saved':>7} "
+        f"{'columnar B/item':>16}"
+    )
+    for row in report["results"]:
+        print(
+            f"{row['size']:>8} {row['legacy_bytes_per_item']:>14.1f} "
+            f"{row['slotted_bytes_per_item']:>15.1f} {row['saved']:>7.1%} "
+            f"{row['columnar_bytes_per_item']:>16.1f}"
+        )
+    if args.output:
+        out_path = Path(args.output)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
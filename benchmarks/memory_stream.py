@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tempfile
+import time
+import tracemalloc
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable
+
+from benchmarks import synthetic
+from benchmarks.hot_paths import bench_settings
+from dart_digest.config import Settings
+from dart_digest.dart_client import fetch_today_rss, parse_disclosures
+from dart_digest.market_filter import CompanyUniverse, MarketFilter
+from dart_digest.pipeline import DigestPipeline
+from dart_digest.score_cache import ScoreCache
+from dart_digest.scoring import score_disclosures
+from dart_digest.selection import SelectionRules, TopKSelector
+from dart_digest.storage import Storage
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+# The materialized path needs memory proportional to its input; past this it is skipped.
+DEFAULT_MATERIALIZED_MAX = 100_000
+
+
+def run_pipeline(settings: Settings) -> int:
+    # The real run: fetch (recorded feed) -> FETCHED checkpoint -> streamed
+    # filter/dedup/score -> top-K -> template article, nothing published.
+    result = DigestPipeline(settings).run(force=True)
+    assert result.metrics is not None
+    stages = {stage.name: stage for stage in result.metrics.stages}
+    return stages["score"].items_out if "score" in stages else 0
+
+
+def run_materialized(settings: Settings) -> int:
+    # The list-per-stage shape the pipeline had before streaming, for comparison.
+    storage = Storage(settings.db_path)
+    market_filter = MarketFilter(
+        CompanyUniverse.from_csv(settings.company_map_path), settings.fetch_markets
+    )
+    disclosures = parse_disclosures(fetch_today_rss(settings.rss_url))
+    market_disclosures = market_filter.filter(disclosures)
+    processed = storage.processed_among([item.receipt_no for item in market_disclosures])
+    candidates = [item for item in market_disclosures if item.receipt_no not in processed]
+    scored = score_disclosures(candidates, cache=ScoreCache(max_entries=settings.score_cache_size))
+    for start in range(0, len(scored), settings.stream_batch_size):
+        storage.mark_processed_many(scored[start : start + settings.stream_batch_size])
+    selector = TopKSelector(SelectionRules.from_settings(settings))
+    selector.extend(scored)
+    selector.select()
+    return len(scored)
+
+
+def measure(
+    run: Callable[[Settings], int],
+    count: int,
+    batch_size: int,
+    cache_size: int | None = None,
+) -> dict:
+    # Fresh database per run so dedup never short-circuits the work being measured. The
+    # feed is generated before tracing starts; reading and parsing it is traced.
+    with tempfile.TemporaryDirectory() as tmp:
+        feed_path = Path(tmp) / "feed.xml"
+        feed_path.write_text(synthetic.make_rss_xml(count), encoding="utf-8")
+        settings = replace(
+            bench_settings(Path(tmp)),
+            rss_url=feed_path.resolve().as_uri(),
+            stream_batch_size=batch_size,
+            news_enabled=False,
+        )
+        if cache_size is not None:
+            # The score LRU is a fixed cost that grows until full; a small one shows the
+            # flat part sooner.
+            settings = replace(settings, score_cache_size=max(1, cache_size))
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            scored = run(settings)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return {
+            "size": count,
+            "scored": scored,
+            "peak_bytes": peak,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+
+def run_suite(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    batch_size: int = 1000,
+    materialized_max: int = DEFAULT_MATERIALIZED_MAX,
+) -> dict:
+    rows: list[dict] = []
+    for size in sizes:
+        rows.append({"mode": "pipeline", **measure(run_pipeline, size, batch_size)})
+        if size <= materialized_max:
+            rows.append({"mode": "materialized", **measure(run_materialized, size, batch_size)})
+    return {"batch_size": batch_size, "results": rows}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Peak traced memory of a DigestPipeline run by input (feed) size."
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated synthetic disclosure counts.",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--materialized-max",
+        type=int,
+        default=DEFAULT_MATERIALIZED_MAX,
+        help="Largest size also run through the materialized path (0 to skip it).",
+    )
+    parser.add_argument("--output", help="Write results JSON to this path.")
+    args = parser.parse_args(argv)
+
+    sizes = tuple(int(size) for size in args.sizes.split(",") if size.strip())
+    report = run_suite(sizes, max(1, args.batch_size), args.materialized_max)
+    print(f"{'mode':<13} {'size':>10} {'peak MiB':>10} {'seconds':>9}")
+    for row in report["results"]:
+        print(
+            f"{row['mode']:<13} {row['size']:>10} "
+            f"{row['peak_bytes'] / 2**20:>10.1f} {row['seconds']:>9.2f}"
+        )
+    if args.output:
+        out_path = Path(args.output)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
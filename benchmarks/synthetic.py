@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import csv
+import random
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Iterator
+from xml.sax.saxutils import escape
+
+from dart_digest.models import Disclosure, ScoredDisclosure
+from dart_digest.news_client import NewsItem
+from dart_digest.scoring import score_disclosures
+
+
+REPORT_NAMES = (
+    "유상증자결정",
+    "전환사채권발행결정",
+    "회사합병 결정",
+    "회사분할 결정",
+    "단일판매ㆍ공급계약 체결",
+    "영업실적등에대한전망(공정공시)",
+    "연결재무제표기준영업(잠정)실적(공정공시)",
+    "감사보고서제출",
+    "최대주주변경",
+    "자기주식취득결정",
+    "현금ㆍ현물배당결정",
+    "임시주주총회 소집결의",
+    "기타경영사항(자율공시)",
+    "[기재정정]주요사항보고서(유상증자결정)",
+)
+DESCRIPTION_TEMPLATES = (
+    "{amount}억원 규모, 매출액 대비 {pct}% 수준",
+    "계약금액 {amount}억원, 최근 매출액 대비 {pct}%",
+    "영업이익 {pct}% 증가, 당기순이익 흑자전환",
+    "신사업 진출 및 설비 증설 투자 {amount}억원",
+    "원가상승과 수요둔화로 영업이익 {pct}% 감소",
+    "",
+)
+NEWS_HEADLINES = (
+    "{company}, 영업이익 증가에 흑자전환 기대",
+    "{company} 유상증자 결정…주주가치 희석 우려",
+    "{company}, 대규모 공급계약 수주로 신사업 진출",
+    "{company} 원가상승·환율 부담에 실적 둔화",
+    "{company} 이사회, 배당 확대 검토",
+)
+MARKETS = ("KOSPI", "KOSDAQ", "KONEX")
+BASE_DATE = datetime(2026, 2, 27, 9, 0, 0)
+
+
+def company_name(idx: int) -> str:
+    return f"합성기업{idx:05d}"
+
+
+def receipt_no(idx: int) -> str:
+    return f"20260227{idx:06d}"
+
+
+def make_company_rows(count: int, seed: int = 7) -> list[tuple[str, str, str]]:
+    rng = random.Random(seed)
+    return [
+        (company_name(idx), f"{idx:06d}", rng.choice(MARKETS)) for idx in range(count)
+    ]
+
+
+def write_company_map(path: Path, count: int, seed: int = 7) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8", newline="") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(["company_name", "ticker", "market"])
+        writer.writerows(make_company_rows(count, seed))
+    return path
+
+
+def _fields(idx: int, rng: random.Random, company_count: int) -> tuple[str, str, str, datetime]:
+    company = company_name(rng.randrange(company_count))
+    report = rng.choice(REPORT_NAMES)
+    description = rng.choice(DESCRIPTION_TEMPLATES).format(
+        amount=rng.randrange(10, 50_000),
+        pct=rng.randrange(1, 150),
+    )
+    published_at = BASE_DATE + timedelta(seconds=idx * 7)
+    return company, report, description, published_at
+
+
+def make_rss_xml(count: int, company_count: int = 2000, seed: int = 11) -> str:
+    rng = random.Random(seed)
+    items: list[str] = []
+    for idx in range(count):
+        company, report, description, published_at = _fields(idx, rng, company_count)
+        items.append(
+            "<item>"
+            f"<title>{escape(company)} ({escape(report)})</title>"
+            f"<link>https://dart.fss.or.kr/dsaf001/main.do?rcpNo={receipt_no(idx)}</link>"
+            f"<description>{escape(description)}</description>"
+            f"<pubDate>{format_datetime(published_at)}</pubDate>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n<rss><channel>'
+        + "".join(items)
+        + "</channel></rss>"
+    )
+
+
+def make_opendart_pages(
+    count: int,
+    page_count: int = 100,
+    company_count: int = 2000,
+    seed: int = 13,
+) -> list[dict]:
+    rng = random.Random(seed)
+    rows: list[dict] = []
+    for idx in range(count):
+        company, report, description, published_at = _fields(idx, rng, company_count)
+        rows.append(
+            {
+                "corp_cls": rng.choice(("Y", "K")),
+                "corp_name": company,
+                "corp_code": f"{idx:08d}",
+                "stock_code": f"{idx:06d}",
+                "report_nm": report,
+                "rcept_no": receipt_no(idx),
+                "flr_nm": company,
+                "rcept_dt": published_at.strftime("%Y%m%d"),
+                "rm": description[:20],
+            }
+        )
+
+    total_page = max(1, -(-count // page_count))
+    return [
+        {
+            "status": "000",
+            "message": "정상",
+            "page_no": page_no,
+            "page_count": page_count,
+            "total_count": count,
+            "total_page": total_page,
+            "list": rows[(page_no - 1) * page_count : page_no * page_count],
+        }
+        for page_no in range(1, total_page + 1)
+    ]
+
+
+def iter_disclosures(
+    count: int,
+    company_count: int = 2000,
+    seed: int = 17,
+) -> Iterator[Disclosure]:
+    # Lazy, so a million-item stream never exists as a list.
+    rng = random.Random(seed)
+    for idx in range(count):
+        company, report, description, published_at = _fields(idx, rng, company_count)
+        yield Disclosure(
+            company_name=company,
+            title=f"{company} ({report})",
+            link=f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={receipt_no(idx)}",
+            receipt_no=receipt_no(idx),
+            published_at=published_at,
+            description=description,
+            market=rng.choice(("KOSPI", "KOSDAQ")),
+        )
+
+
+def make_disclosures(count: int, company_count: int = 2000, seed: int = 17) -> list[Disclosure]:
+    return list(iter_disclosures(count, company_count, seed))
+
+
+def make_scored(count: int, seed: int = 19) -> list[ScoredDisclosure]:
+    return score_disclosures(make_disclosures(count, seed=seed))
+
+
+def make_news_map(
+    scored: list[ScoredDisclosure],
+    per_item: int = 3,
+    seed: int = 23,
+) -> dict[str, list[NewsItem]]:
+    rng = random.Random(seed)
+    return {
+        item.disclosure.receipt_no: [
+            NewsItem(
+                title=rng.choice(NEWS_HEADLINES).format(company=item.disclosure.company_name),
+                link=f"https://news.example.com/{item.disclosure.receipt_no}/{idx}",
+                source="합성뉴스",
+                published_at="2026-02-27",
+                published_ts=BASE_DATE.timestamp(),
+            )
+            for idx in range(per_item)
+        ]
+        for item in scored
+    }
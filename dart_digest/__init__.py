@@ -1,5 +1,7 @@
 """DART disclosure digest package."""
 
+__version__ = "0.1.0"
+
 __all__ = [
     "config",
     "pipeline",
@@ -1,15 +1,125 @@
 from __future__ import annotations
 
 import json
+import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 
 import requests
+from urllib3.exceptions import ReadTimeoutError
 
+from dart_digest import metrics
+from dart_digest.circuit_breaker import CircuitBreaker
 from dart_digest.config import Settings
+from dart_digest.deadline import DELIVERY_RESERVE_SECONDS, Deadline
+from dart_digest.llm_cache import ResponseCache
 from dart_digest.models import ScoredDisclosure
-from dart_digest.news_client import NewsItem, search_related_news
+from dart_digest.news_client import (
+    FETCH_TIMEOUT_SECONDS,
+    NewsCache,
+    NewsItem,
+    search_related_news,
+)
+from dart_digest.openai_batch import BatchJob, run_batch, write_jobs
+
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = (
+    "당신은 한국 증권업계 셀사이드 애널리스트 출신의 경제부 베테랑 기자다. "
+    "DART 공시를 바탕으로 중장기 가치 영향 중심의 심층 기사만 작성한다. "
+    "사실과 추론을 분리하고, 투자권유처럼 보이는 단정 표현을 피한다."
+)
+TEMPERATURE = 0.2
+DISCLAIMER = (
+    "\n\n---\n"
+    "본 콘텐츠는 정보 제공 목적이며, 특정 종목의 매수·매도 추천이 아닙니다. "
+    "투자 판단과 책임은 투자자 본인에게 있습니다."
+)
+# Below these budgets the step is skipped rather than started and cut off.
+MIN_NEWS_SECONDS = 2.0
+MIN_LLM_SECONDS = 5.0
+
+_FUNDING_KEYWORDS = frozenset({"유상증자", "전환사채", "신주인수권부사채"})
+_AUDIT_KEYWORDS = frozenset({"감사의견", "의견거절", "부적정", "한정"})
+_CONTRACT_KEYWORDS = frozenset({"공급계약", "수주", "단일판매"})
+_RESTRUCTURING_KEYWORDS = frozenset({"합병", "분할", "인수", "영업양수", "영업양도"})
+_NEGATIVE_KEYWORDS = _FUNDING_KEYWORDS | _AUDIT_KEYWORDS | frozenset(
+    {"상장폐지", "영업정지", "회생", "적자전환", "영업손실", "당기순손실"}
+)
+_POSITIVE_KEYWORDS = frozenset(
+    {"무상증자", "배당", "자기주식취득", "소각", "공급계약", "수주", "실적개선", "흑자"}
+)
+_PROFITABILITY_KEYWORDS = frozenset(
+    {
+        "적자전환",
+        "흑자전환",
+        "영업손실확대",
+        "순손실확대",
+        "영업이익감소",
+        "순이익감소",
+        "영업이익증가",
+        "순이익증가",
+    }
+)
+# Ordered: the first three matches are quoted in the article.
+_PLAN_KEYWORDS = (
+    "신사업",
+    "신규사업",
+    "사업다각화",
+    "사업전환",
+    "진출",
+    "투자",
+    "증설",
+    "신제품",
+    "고도화",
+    "플랫폼",
+)
+_HEADWIND_KEYWORDS = (
+    "수요둔화",
+    "원가상승",
+    "판가하락",
+    "재고",
+    "가동률",
+    "경쟁심화",
+    "환율",
+    "금리",
+    "손상차손",
+    "충당금",
+)
+
+# Every keyword any signal looks at; one membership scan per text yields its hit-set.
+_ALL_KEYWORDS = tuple(
+    sorted(
+        _NEGATIVE_KEYWORDS
+        | _POSITIVE_KEYWORDS
+        | _CONTRACT_KEYWORDS
+        | _RESTRUCTURING_KEYWORDS
+        | _PROFITABILITY_KEYWORDS
+        | frozenset(_PLAN_KEYWORDS)
+        | frozenset(_HEADWIND_KEYWORDS)
+    )
+)
+# News titles only feed the issue signals and the per-title summary.
+_NEWS_CORPUS_KEYWORDS = tuple(
+    sorted(_PROFITABILITY_KEYWORDS | frozenset(_PLAN_KEYWORDS) | frozenset(_HEADWIND_KEYWORDS))
+)
+_NEWS_TITLE_KEYWORDS = tuple(
+    sorted(_FUNDING_KEYWORDS | {"적자전환", "흑자전환", "공급계약", "수주"})
+)
+
+
+@dataclass
+class GenerationStats:
+    outcome: str = "template_only"
+    first_token_seconds: float | None = None
+    llm_seconds: float | None = None
+    estimated_input_tokens: int | None = None
+    actual_input_tokens: int | None = None
 
 
 @dataclass
@@ -17,42 +127,142 @@ class IssueContext:
     profitability_signal: str
     company_plan_signal: str
     core_business_headwind: str
+    # Keyword hits of the disclosure title/description and of each related news title.
+    disclosure_hits: frozenset[str] = frozenset()
+    news_title_hits: tuple[frozenset[str], ...] = ()
+    news_key: tuple[str, ...] = ()
 
 
 class ArticleWriter:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        news_cache: NewsCache | None = None,
+        response_cache: ResponseCache | None = None,
+        news_breaker: CircuitBreaker | None = None,
+        openai_breaker: CircuitBreaker | None = None,
+    ) -> None:
         self.settings = settings
+        self.news_cache = news_cache
+        self.response_cache = response_cache
+        self.news_breaker = news_breaker
+        self.openai_breaker = openai_breaker
+        self.last_generation = GenerationStats()
 
-    def write(self, selected: list[ScoredDisclosure], run_dt: datetime) -> str:
+    def write(
+        self,
+        selected: list[ScoredDisclosure],
+        run_dt: datetime,
+        deadline: Deadline | None = None,
+        news_map: dict[str, list[NewsItem]] | None = None,
+    ) -> str:
         if not selected:
             return "오늘은 분석 대상 공시가 없습니다."
+        deadline = deadline or Deadline()
+
+        if news_map is None:
+            news_map = self.collect_news(selected, deadline)
+        else:
+            # Shared with other output profiles; take just this selection's entries.
+            news_map = {
+                item.disclosure.receipt_no: news_map.get(item.disclosure.receipt_no, [])
+                for item in selected
+            }
 
-        news_map = self._collect_related_news(selected)
-
-        article = ""
-        if self.settings.openai_api_key:
-            article = self._write_with_openai(selected, run_dt, news_map)
-
-        if not article:
-            article = self._write_template(selected, run_dt, news_map)
+        self.last_generation = GenerationStats()
+        llm_budget = deadline.timeout(
+            self.settings.openai_total_timeout_seconds, reserve=DELIVERY_RESERVE_SECONDS
+        )
+        if (
+            llm_budget < min(MIN_LLM_SECONDS, self.settings.openai_total_timeout_seconds)
+            and not self.settings.openai_replay
+        ):
+            self.last_generation.outcome = "deadline_skipped"
+            metrics.set_counter("degraded_llm_skipped", 1)
+        if self.last_generation.outcome == "deadline_skipped" or not (
+            self.settings.openai_api_key or self.settings.openai_replay
+        ):
+            with metrics.stage("template", items_in=len(selected)) as stage:
+                article = self._write_template(selected, run_dt, news_map)
+                stage.items_out = 1
+            self._record_generation()
+            return article
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dart-template") as pool:
+            # Render the template alongside the LLM call so the fallback is ready at the deadline.
+            fallback = pool.submit(self._write_template, selected, run_dt, news_map)
+            with metrics.stage("openai", items_in=len(selected)) as stage:
+                article = self._write_with_openai(selected, run_dt, news_map, llm_budget)
+                stage.items_out = 1 if article else 0
+            template = fallback.result()
+
+        if article and _passes_fact_gate(article, selected):
+            self._record_generation()
+            return article
+
+        if article:
+            self.last_generation.outcome = "fact_gate_failed"
+        self._record_generation()
+        return template
+
+    def collect_news(
+        self,
+        selected: list[ScoredDisclosure],
+        deadline: Deadline | None = None,
+    ) -> dict[str, list[NewsItem]]:
+        deadline = deadline or Deadline()
+        news_budget = deadline.timeout(
+            self.settings.news_deadline_seconds, reserve=DELIVERY_RESERVE_SECONDS
+        )
+        if news_budget < min(MIN_NEWS_SECONDS, self.settings.news_deadline_seconds):
+            logger.warning(
+                "Skipping related news: %.1fs left in the run budget", deadline.remaining()
+            )
+            metrics.set_counter("degraded_news_skipped", 1)
+            return {item.disclosure.receipt_no: [] for item in selected}
 
-        if not _passes_fact_gate(article, selected):
-            return self._write_template(selected, run_dt, news_map)
-        return article
+        with metrics.stage("news", items_in=len(selected)) as stage:
+            news_map = self._collect_related_news(selected, news_budget)
+            stage.items_out = sum(len(items) for items in news_map.values())
+        return news_map
 
     def _collect_related_news(
         self,
         selected: list[ScoredDisclosure],
+        budget: float | None = None,
     ) -> dict[str, list[NewsItem]]:
-        news_map: dict[str, list[NewsItem]] = {}
-        for item in selected:
-            disclosure = item.disclosure
-            news_map[disclosure.receipt_no] = search_related_news(
-                company_name=disclosure.company_name,
-                disclosure_title=disclosure.title,
+        budget = self.settings.news_deadline_seconds if budget is None else budget
+        news_map: dict[str, list[NewsItem]] = {
+            item.disclosure.receipt_no: [] for item in selected
+        }
+        if not selected or not self.settings.news_enabled:
+            return news_map
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.settings.news_max_workers, len(selected)),
+            thread_name_prefix="dart-news",
+        )
+        futures = {
+            executor.submit(
+                search_related_news,
+                company_name=item.disclosure.company_name,
+                disclosure_title=item.disclosure.title,
                 event_type=item.event_type,
                 max_items=2,
-            )
+                cache=self.news_cache,
+                breaker=self.news_breaker,
+                timeout=min(FETCH_TIMEOUT_SECONDS, budget),
+            ): item.disclosure.receipt_no
+            for item in selected
+        }
+        try:
+            # Searches still running at the deadline are abandoned and keep an empty list.
+            done, _ = wait(futures, timeout=budget)
+            for future in done:
+                if future.exception() is None:
+                    news_map[futures[future]] = future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         return news_map
 
     def _write_with_openai(
@@ -60,51 +270,244 @@ class ArticleWriter:
         selected: list[ScoredDisclosure],
         run_dt: datetime,
         news_map: dict[str, list[NewsItem]],
+        budget: float | None = None,
     ) -> str:
-        system_prompt = (
-            "당신은 한국 증권업계 셀사이드 애널리스트 출신의 경제부 베테랑 기자다. "
-            "DART 공시를 바탕으로 중장기 가치 영향 중심의 심층 기사만 작성한다. "
-            "사실과 추론을 분리하고, 투자권유처럼 보이는 단정 표현을 피한다."
+        user_prompt, prompt_hash = self._prepare_prompt(selected, run_dt, news_map)
+        self.last_generation.estimated_input_tokens = estimate_tokens(
+            SYSTEM_PROMPT
+        ) + estimate_tokens(user_prompt)
+
+        if self.response_cache is not None:
+            cached = self.response_cache.get(prompt_hash)
+            if cached is not None:
+                self.last_generation.outcome = "cache_hit"
+                return cached
+        if self.settings.openai_replay:
+            # Replay mode never calls the API; a cache miss falls back to the template.
+            self.last_generation.outcome = "replay_miss"
+            return ""
+
+        if self.openai_breaker is not None and not self.openai_breaker.allow():
+            self.last_generation.outcome = "circuit_open"
+            return ""
+
+        article = self._request_openai(SYSTEM_PROMPT, user_prompt, TEMPERATURE, budget)
+        if self.openai_breaker is not None:
+            if self.last_generation.outcome == "completed":
+                self.openai_breaker.record_success()
+            else:
+                self.openai_breaker.record_failure()
+        if self.response_cache is not None and _passes_fact_gate(article, selected):
+            self.response_cache.put(prompt_hash, self.settings.openai_model, article)
+        return article
+
+    def write_batch(
+        self,
+        requests_by_key: dict[str, tuple[list[ScoredDisclosure], datetime]],
+        job_path: Path,
+    ) -> dict[str, str]:
+        news_maps: dict[str, dict[str, list[NewsItem]]] = {}
+        with metrics.stage("news", items_in=len(requests_by_key)) as stage:
+            for key, (selected, _run_dt) in requests_by_key.items():
+                news_maps[key] = self._collect_related_news(selected)
+            stage.items_out = sum(
+                len(items) for news_map in news_maps.values() for items in news_map.values()
+            )
+
+        articles: dict[str, str] = {}
+        jobs: list[BatchJob] = []
+        hashes: dict[str, str] = {}
+        for key, (selected, run_dt) in requests_by_key.items():
+            user_prompt, prompt_hash = self._prepare_prompt(selected, run_dt, news_maps[key])
+            cached = self.response_cache.get(prompt_hash) if self.response_cache else None
+            if cached is not None:
+                articles[key] = cached
+                continue
+            hashes[key] = prompt_hash
+            jobs.append(
+                BatchJob(
+                    custom_id=key,
+                    body=self._request_payload(SYSTEM_PROMPT, user_prompt, TEMPERATURE),
+                )
+            )
+
+        if jobs and self.settings.openai_api_key and not self.settings.openai_replay:
+            with metrics.stage("openai_batch", items_in=len(jobs)) as stage:
+                write_jobs(jobs, job_path)
+                try:
+                    if self.openai_breaker is None:
+                        bodies = self._run_batch(job_path)
+                    else:
+                        bodies = self.openai_breaker.call(self._run_batch, job_path)
+                except (requests.RequestException, RuntimeError, TimeoutError, ValueError) as exc:
+                    logger.warning("OpenAI batch failed, using templates: %s", exc)
+                    bodies = {}
+
+                for key, body in bodies.items():
+                    if key not in hashes:
+                        continue
+                    article = _extract_output_text(body)
+                    if self.response_cache is not None and _passes_fact_gate(
+                        article, requests_by_key[key][0]
+                    ):
+                        self.response_cache.put(hashes[key], self.settings.openai_model, article)
+                    articles[key] = article
+                stage.items_out = len(bodies)
+
+        for key, (selected, run_dt) in requests_by_key.items():
+            article = articles.get(key, "")
+            if not _passes_fact_gate(article, selected):
+                articles[key] = self._write_template(selected, run_dt, news_maps[key])
+        return articles
+
+    def _run_batch(self, job_path: Path) -> dict[str, dict]:
+        return run_batch(
+            job_path,
+            api_key=self.settings.openai_api_key,
+            base_url=self.settings.openai_base_url,
+            poll_seconds=self.settings.openai_batch_poll_seconds,
+            timeout_seconds=self.settings.openai_batch_timeout_seconds,
         )
 
-        payload = {
+    def _prepare_prompt(
+        self,
+        selected: list[ScoredDisclosure],
+        run_dt: datetime,
+        news_map: dict[str, list[NewsItem]],
+    ) -> tuple[str, str]:
+        user_prompt = _build_user_prompt(
+            selected,
+            run_dt,
+            news_map,
+            token_budget=self.settings.prompt_token_budget,
+        )
+        prompt_hash = ResponseCache.key_for(
+            self.settings.openai_model, SYSTEM_PROMPT, user_prompt, TEMPERATURE
+        )
+        return user_prompt, prompt_hash
+
+    def _request_payload(self, system_prompt: str, user_prompt: str, temperature: float) -> dict:
+        return {
             "model": self.settings.openai_model,
             "input": [
                 {"role": "system", "content": system_prompt},
-                {
-                    "role": "user",
-                    "content": _build_user_prompt(selected, run_dt, news_map),
-                },
+                {"role": "user", "content": user_prompt},
             ],
-            "temperature": 0.2,
+            "temperature": temperature,
+        }
+
+    def _request_openai(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        budget: float | None = None,
+    ) -> str:
+        stats = self.last_generation
+        payload = {
+            **self._request_payload(system_prompt, user_prompt, temperature),
+            "stream": True,
         }
 
+        total_timeout = self.settings.openai_total_timeout_seconds
+        if budget is not None:
+            total_timeout = min(total_timeout, budget)
+        first_token_timeout = min(self.settings.openai_first_token_timeout_seconds, total_timeout)
+        started = time.monotonic()
+        total_deadline = started + total_timeout
+        chunks: list[str] = []
+        completed: dict = {}
+        received = 0
+
         try:
             response = requests.post(
-                "https://api.openai.com/v1/responses",
+                f"{self.settings.openai_base_url}/responses",
                 headers={
                     "Authorization": f"Bearer {self.settings.openai_api_key}",
                     "Content-Type": "application/json",
                 },
                 json=payload,
-                timeout=40,
+                stream=True,
+                timeout=(min(10.0, first_token_timeout), first_token_timeout),
             )
-            response.raise_for_status()
-        except requests.RequestException:
+            with response:
+                response.raise_for_status()
+                for raw_line in response.iter_lines():
+                    now = time.monotonic()
+                    if now > total_deadline:
+                        stats.outcome = "total_timeout"
+                        return ""
+                    if not chunks and now - started > first_token_timeout:
+                        stats.outcome = "first_token_timeout"
+                        return ""
+                    # The read timeout applies per socket read; shrink it to what is left so
+                    # a stream that goes silent cannot outlive the total budget.
+                    _set_read_timeout(
+                        response,
+                        total_deadline - now
+                        if chunks
+                        else min(total_deadline, started + first_token_timeout) - now,
+                    )
+
+                    received += len(raw_line)
+                    line = raw_line.decode("utf-8") if isinstance(raw_line, bytes) else raw_line
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+
+                    event = json.loads(data)
+                    event_type = event.get("type")
+                    if event_type == "response.output_text.delta":
+                        if not chunks:
+                            stats.first_token_seconds = round(now - started, 3)
+                        chunks.append(event.get("delta", ""))
+                    elif event_type == "response.completed":
+                        completed = event.get("response") or {}
+                        break
+                    elif event_type in {"error", "response.failed", "response.incomplete"}:
+                        stats.outcome = "api_error"
+                        return ""
+        except requests.Timeout:
+            stats.outcome = "first_token_timeout" if not chunks else "total_timeout"
             return ""
-
-        data = response.json()
-
-        try:
-            output = data.get("output", [])
-            text_chunks: list[str] = []
-            for item in output:
-                for content in item.get("content", []):
-                    if content.get("type") == "output_text":
-                        text_chunks.append(content.get("text", ""))
-            return "\n".join([chunk.strip() for chunk in text_chunks if chunk.strip()]).strip()
-        except (TypeError, AttributeError):
+        except requests.RequestException as exc:
+            # A read timeout mid-stream surfaces as ConnectionError(ReadTimeoutError).
+            if _is_read_timeout(exc):
+                stats.outcome = "first_token_timeout" if not chunks else "total_timeout"
+            else:
+                stats.outcome = "http_error"
+            return ""
+        except (ValueError, AttributeError):
+            stats.outcome = "bad_stream"
             return ""
+        finally:
+            stats.llm_seconds = round(time.monotonic() - started, 3)
+            metrics.record_http(received)
+
+        stats.outcome = "completed"
+        usage = completed.get("usage") or {}
+        if usage.get("input_tokens") is not None:
+            stats.actual_input_tokens = int(usage["input_tokens"])
+        logger.info(
+            "OpenAI input tokens: estimated=%s actual=%s",
+            stats.estimated_input_tokens,
+            stats.actual_input_tokens,
+        )
+        return "".join(chunks).strip() or _extract_output_text(completed)
+
+    def _record_generation(self) -> None:
+        stats = self.last_generation
+        metrics.set_counter(f"openai_outcome_{stats.outcome}", 1)
+        if stats.first_token_seconds is not None:
+            metrics.set_counter("openai_first_token_seconds", stats.first_token_seconds)
+        if stats.llm_seconds is not None:
+            metrics.set_counter("openai_seconds", stats.llm_seconds)
+        if stats.estimated_input_tokens is not None:
+            metrics.set_counter("openai_input_tokens_estimated", stats.estimated_input_tokens)
+        if stats.actual_input_tokens is not None:
+            metrics.set_counter("openai_input_tokens_actual", stats.actual_input_tokens)
 
     def _write_template(
         self,
@@ -119,7 +522,7 @@ class ArticleWriter:
         for rank, item in enumerate(selected, start=1):
             disclosure = item.disclosure
             news_items = news_map.get(disclosure.receipt_no, [])
-            issue_ctx = _build_issue_context(item, news_items)
+            issue_ctx = _issue_context(item, news_items)
             sentiment, sentiment_reason = _investor_impact(item, issue_ctx)
 
             body_blocks.append(
@@ -149,12 +552,6 @@ class ArticleWriter:
                 )
             )
 
-        disclaimer = (
-            "\n\n---\n"
-            "본 콘텐츠는 정보 제공 목적이며, 특정 종목의 매수·매도 추천이 아닙니다. "
-            "투자 판단과 책임은 투자자 본인에게 있습니다."
-        )
-
         return "\n\n".join(
             [
                 f"# {headline}",
@@ -162,18 +559,43 @@ class ArticleWriter:
                 "\n".join(summary_lines),
                 *body_blocks,
             ]
-        ) + disclaimer
+        ) + DISCLAIMER
+
+
+NEWS_FIELDS = ("title", "source", "published_at", "link")
+SHORT_REPORT_CHARS = 3000
+
+
+def shorten_article(article: str, max_chars: int = SHORT_REPORT_CHARS) -> str:
+    # Keeps the report within a single Slack message when the run is out of time.
+    if len(article) <= max_chars:
+        return article
+    cut = article.rfind("\n", 0, max_chars)
+    if cut <= 0:
+        cut = max_chars
+    return (
+        article[:cut].rstrip()
+        + "\n\n(실행 시간 제약으로 요약본만 전송합니다. 전체 리포트는 저장소에 보관됩니다.)"
+        + DISCLAIMER
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    # Hangul syllables are roughly one token each; other text averages about four characters per token.
+    hangul = sum(1 for ch in text if "\uac00" <= ch <= "\ud7a3")
+    return hangul + -(-(len(text) - hangul) // 4)
 
 
 def _build_user_prompt(
     selected: list[ScoredDisclosure],
     run_dt: datetime,
     news_map: dict[str, list[NewsItem]],
+    token_budget: int = 0,
 ) -> str:
     facts = []
     for idx, item in enumerate(selected, start=1):
         d = item.disclosure
-        issue_ctx = _build_issue_context(item, news_map.get(d.receipt_no, []))
+        issue_ctx = _issue_context(item, news_map.get(d.receipt_no, []))
         sentiment, sentiment_reason = _investor_impact(item, issue_ctx)
         facts.append(
             {
@@ -185,33 +607,46 @@ def _build_user_prompt(
                 "market": item.market,
                 "market_bonus": item.market_bonus,
                 "score": item.total_score,
-                "reasons": item.reasons,
+                "reasons": list(item.reasons),
                 "description": d.description,
-                "issue_context": {
-                    "profitability_signal": issue_ctx.profitability_signal,
-                    "company_plan_signal": issue_ctx.company_plan_signal,
-                    "core_business_headwind": issue_ctx.core_business_headwind,
-                },
-                "investor_view": {
-                    "label": sentiment,
-                    "reason": sentiment_reason,
-                },
+                "profitability_signal": issue_ctx.profitability_signal,
+                "company_plan_signal": issue_ctx.company_plan_signal,
+                "core_business_headwind": issue_ctx.core_business_headwind,
+                "investor_view": sentiment,
+                "investor_view_reason": sentiment_reason,
                 "related_news": [
-                    {
-                        "title": n.title,
-                        "source": n.source,
-                        "published_at": n.published_at,
-                        "link": n.link,
-                    }
+                    [n.title, n.source, n.published_at, n.link]
                     for n in news_map.get(d.receipt_no, [])
                 ],
             }
         )
 
+    prompt = _render_user_prompt(run_dt, facts)
+    for reduce in _PROMPT_REDUCTIONS:
+        if not token_budget or estimate_tokens(prompt) <= token_budget:
+            break
+        facts = [reduce(dict(fact)) for fact in facts]
+        prompt = _render_user_prompt(run_dt, facts)
+    return prompt
+
+
+def _render_user_prompt(run_dt: datetime, facts: list[dict]) -> str:
+    # Keys are listed once in "fields"; each row holds the values in the same order.
+    fields = list(facts[0]) if facts else []
+    encoded = json.dumps(
+        {
+            "fields": fields,
+            "news_fields": list(NEWS_FIELDS),
+            "rows": [[fact[key] for key in fields] for fact in facts],
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
     return (
-        f"기준시각: {run_dt.isoformat(timespec='seconds')}\n"
-        "아래 공시 후보를 대상으로 심층 기사 작성:\n"
-        f"```json\n{json.dumps(facts, ensure_ascii=False, indent=2)}\n```\n"
+        f"기준일: {run_dt.strftime('%Y-%m-%d')}\n"
+        "아래 공시 후보를 대상으로 심층 기사 작성 "
+        "(rows의 각 행은 fields 순서의 값이며, related_news 항목은 news_fields 순서):\n"
+        f"```json\n{encoded}\n```\n"
         "요구사항:\n"
         "1) 제목 1개, 핵심요약 2줄, 본문(사실/해석 분리)을 포함\n"
         "2) 공시명/접수번호를 나열하지 말고, 왜 경영/가치에 중요한지 구체적으로 설명\n"
@@ -224,15 +659,91 @@ def _build_user_prompt(
     )
 
 
+def _drop_news_sources(fact: dict) -> dict:
+    fact["related_news"] = [[n[0], "", n[2], n[3]] for n in fact["related_news"]]
+    return fact
+
+
+def _trim_reasons(fact: dict) -> dict:
+    fact["reasons"] = fact["reasons"][:1]
+    return fact
+
+
+def _trim_description(fact: dict) -> dict:
+    fact["description"] = fact["description"][:300]
+    return fact
+
+
+def _shorten_news_titles(fact: dict) -> dict:
+    fact["related_news"] = [[n[0][:40], n[1], n[2], n[3]] for n in fact["related_news"]]
+    return fact
+
+
+def _drop_reasons(fact: dict) -> dict:
+    fact["reasons"] = []
+    return fact
+
+
+def _shorten_description(fact: dict) -> dict:
+    fact["description"] = fact["description"][:80]
+    return fact
+
+
+def _drop_news(fact: dict) -> dict:
+    fact["related_news"] = []
+    return fact
+
+
+# Applied cumulatively, least important fields first, until the prompt fits the budget.
+_PROMPT_REDUCTIONS = (
+    _drop_news_sources,
+    _trim_reasons,
+    _trim_description,
+    _shorten_news_titles,
+    _drop_reasons,
+    _shorten_description,
+    _drop_news,
+)
+
+
+def _set_read_timeout(response: requests.Response, seconds: float) -> None:
+    connection = getattr(getattr(response, "raw", None), "connection", None)
+    sock = getattr(connection, "sock", None)
+    if sock is not None:
+        sock.settimeout(max(0.01, seconds))
+
+
+def _is_read_timeout(exc: BaseException) -> bool:
+    seen: BaseException | None = exc
+    while seen is not None:
+        if isinstance(seen, ReadTimeoutError) or any(
+            isinstance(arg, ReadTimeoutError) for arg in seen.args
+        ):
+            return True
+        seen = seen.__cause__ or seen.__context__
+    return False
+
+
+def _extract_output_text(data: dict) -> str:
+    try:
+        text_chunks: list[str] = []
+        for item in data.get("output", []):
+            for content in item.get("content", []):
+                if content.get("type") == "output_text":
+                    text_chunks.append(content.get("text", ""))
+        return "\n".join([chunk.strip() for chunk in text_chunks if chunk.strip()]).strip()
+    except (TypeError, AttributeError):
+        return ""
+
+
 def _build_headline(selected: list[ScoredDisclosure]) -> str:
     first = selected[0]
     if len(selected) == 1:
         return f"{first.disclosure.company_name} 공시 심층: 장기 가치에 미치는 실질 영향"
-    second = selected[1]
-    return (
-        f"오늘의 핵심 공시 2선: {first.disclosure.company_name}·"
-        f"{second.disclosure.company_name}의 장기 가치 재평가 포인트"
-    )
+    names = "·".join(item.disclosure.company_name for item in selected[:3])
+    if len(selected) > 3:
+        names += " 외"
+    return f"오늘의 핵심 공시 {len(selected)}선: {names}의 장기 가치 재평가 포인트"
 
 
 def _build_summary(selected: list[ScoredDisclosure]) -> list[str]:
@@ -276,31 +787,30 @@ def _detailed_rationale(item: ScoredDisclosure, issue_ctx: IssueContext) -> str:
 
 
 def _expert_insight(item: ScoredDisclosure, issue_ctx: IssueContext) -> str:
-    title = item.disclosure.title
-    text = f"{title} {item.disclosure.description}".replace(" ", "")
+    hits = issue_ctx.disclosure_hits
 
-    if any(k in text for k in ["유상증자", "전환사채", "신주인수권부사채"]):
+    if hits & _FUNDING_KEYWORDS:
         return (
             "회계/자본시장 관점에서 핵심은 희석효과와 자금 사용처의 질이다. "
             "조달 자체보다 조달금이 ROIC를 높이는 투자로 연결되는지, 기존 주주가치 훼손을 상쇄할 만큼 "
             "현금흐름 개선이 가능한지가 장기 밸류에이션의 분기점이다."
         )
 
-    if any(k in text for k in ["감사의견", "의견거절", "부적정", "한정"]):
+    if hits & _AUDIT_KEYWORDS:
         return (
             "핵심은 손익 숫자보다 신뢰성 프리미엄의 훼손 여부다. "
             "감사 이슈는 자금조달 비용과 거래상대방 신뢰에 연쇄적으로 영향을 주기 때문에, "
             "이후 해소 공시의 속도와 강도가 기업가치 회복 속도를 좌우한다."
         )
 
-    if any(k in text for k in ["공급계약", "수주", "단일판매"]):
+    if hits & _CONTRACT_KEYWORDS:
         return (
             "수주 공시는 매출 증가 자체보다 수익성의 질이 중요하다. "
             "계약 단가·원가 구조·납기 리스크를 감안했을 때 실제 영업현금흐름으로 이어지는지 확인해야 하며, "
             "백로그가 이익 가시성으로 전환되는 속도가 장기 주가의 핵심 변수다."
         )
 
-    if any(k in text for k in ["합병", "분할", "인수", "영업양수", "영업양도"]):
+    if hits & _RESTRUCTURING_KEYWORDS:
         return (
             "사업재편 공시는 EPS 효과만 보면 왜곡될 수 있다. "
             "진짜 포인트는 사업 포트폴리오의 리스크/수익 구조가 개선되는지, "
@@ -321,36 +831,8 @@ def _expert_insight(item: ScoredDisclosure, issue_ctx: IssueContext) -> str:
 
 
 def _investor_impact(item: ScoredDisclosure, issue_ctx: IssueContext) -> tuple[str, str]:
-    text = f"{item.disclosure.title} {item.disclosure.description}".replace(" ", "")
-
-    negative = [
-        "유상증자",
-        "전환사채",
-        "신주인수권부사채",
-        "감사의견",
-        "의견거절",
-        "부적정",
-        "한정",
-        "상장폐지",
-        "영업정지",
-        "회생",
-        "적자전환",
-        "영업손실",
-        "당기순손실",
-    ]
-    positive = [
-        "무상증자",
-        "배당",
-        "자기주식취득",
-        "소각",
-        "공급계약",
-        "수주",
-        "실적개선",
-        "흑자",
-    ]
-
-    has_neg = any(k in text for k in negative)
-    has_pos = any(k in text for k in positive)
+    has_neg = bool(issue_ctx.disclosure_hits & _NEGATIVE_KEYWORDS)
+    has_pos = bool(issue_ctx.disclosure_hits & _POSITIVE_KEYWORDS)
     if "적자전환" in issue_ctx.profitability_signal:
         return (
             "부정적",
@@ -387,10 +869,10 @@ def _related_news_summary(
         )
 
     lines: list[str] = []
-    for news in news_items[:2]:
+    for news, title_hits in zip(news_items[:2], issue_ctx.news_title_hits):
         source = news.source or "출처 미상"
         date = news.published_at or "날짜 미상"
-        summary = _summarize_news_title(news.title, company_name, issue_ctx)
+        summary = _summarize_news_title(title_hits, company_name, issue_ctx)
         lines.append(
             f"- [{news.title}]({news.link}) ({source}, {date}) - {summary}"
         )
@@ -401,87 +883,84 @@ def _related_news_summary(
     return "\n".join(lines)
 
 
+def _issue_context(item: ScoredDisclosure, news_items: list[NewsItem]) -> IssueContext:
+    # Template and prompt rendering share one context per item and news set.
+    news_key = tuple(n.title for n in news_items)
+    issue_ctx = item.issue_context
+    if issue_ctx is None or issue_ctx.news_key != news_key:
+        issue_ctx = _build_issue_context(item, news_items)
+        item.issue_context = issue_ctx
+    return issue_ctx
+
+
 def _build_issue_context(item: ScoredDisclosure, news_items: list[NewsItem]) -> IssueContext:
     disclosure = item.disclosure
-    text = f"{disclosure.title} {disclosure.description}".replace(" ", "")
-    news_title_text = " ".join([n.title for n in news_items]).replace(" ", "")
-    corpus = f"{text} {news_title_text}"
-
-    profitability_signal = _profitability_signal(corpus)
-    company_plan_signal = _company_plan_signal(corpus)
-    core_business_headwind = _core_business_headwind(corpus)
+    disclosure_hits = _keyword_hits(f"{disclosure.title} {disclosure.description}")
+    corpus_hits = disclosure_hits | _keyword_hits(
+        " ".join([n.title for n in news_items]), _NEWS_CORPUS_KEYWORDS
+    )
 
     return IssueContext(
-        profitability_signal=profitability_signal,
-        company_plan_signal=company_plan_signal,
-        core_business_headwind=core_business_headwind,
+        profitability_signal=_profitability_signal(corpus_hits),
+        company_plan_signal=_company_plan_signal(corpus_hits),
+        core_business_headwind=_core_business_headwind(corpus_hits),
+        disclosure_hits=disclosure_hits,
+        # Only the first two news items are summarized in the article.
+        news_title_hits=tuple(
+            _keyword_hits(n.title, _NEWS_TITLE_KEYWORDS) for n in news_items[:2]
+        ),
+        news_key=tuple(n.title for n in news_items),
     )
 
 
-def _profitability_signal(corpus: str) -> str:
-    if "적자전환" in corpus:
+def _keyword_hits(text: str, keywords: tuple[str, ...] = _ALL_KEYWORDS) -> frozenset[str]:
+    compact = text.replace(" ", "")
+    return frozenset([kw for kw in keywords if kw in compact])
+
+
+def _profitability_signal(hits: frozenset[str]) -> str:
+    if "적자전환" in hits:
         return "적자전환(흑자→적자) 신호가 확인됨 (이익체력 약화 신호)"
-    if "흑자전환" in corpus:
+    if "흑자전환" in hits:
         return "흑자전환(적자→흑자) 신호가 확인됨 (수익구조 개선 신호)"
-    if any(k in corpus for k in ["영업손실확대", "순손실확대"]):
+    if hits & {"영업손실확대", "순손실확대"}:
         return "손실 폭이 확대된 정황이 확인됨"
-    if any(k in corpus for k in ["영업이익감소", "순이익감소"]):
+    if hits & {"영업이익감소", "순이익감소"}:
         return "이익 감소 신호가 확인됨"
-    if any(k in corpus for k in ["영업이익증가", "순이익증가"]):
+    if hits & {"영업이익증가", "순이익증가"}:
         return "이익 증가 신호가 확인됨"
     return "명시적 손익 전환 신호는 제한적이며 추가 확인 필요"
 
 
-def _company_plan_signal(corpus: str) -> str:
-    plan_keywords = [
-        "신사업",
-        "신규사업",
-        "사업다각화",
-        "사업전환",
-        "진출",
-        "투자",
-        "증설",
-        "신제품",
-        "고도화",
-        "플랫폼",
-    ]
-    matched = [kw for kw in plan_keywords if kw in corpus]
+def _company_plan_signal(hits: frozenset[str]) -> str:
+    matched = [kw for kw in _PLAN_KEYWORDS if kw in hits]
     if matched:
-        return f"{', '.join(list(dict.fromkeys(matched))[:3])} 중심의 확장 계획이 언급됨"
+        return f"{', '.join(matched[:3])} 중심의 확장 계획이 언급됨"
     return "향후 사업 계획은 포괄적으로 제시됐거나 구체성이 제한적임"
 
 
-def _core_business_headwind(corpus: str) -> str:
-    headwind_keywords = [
-        "수요둔화",
-        "원가상승",
-        "판가하락",
-        "재고",
-        "가동률",
-        "경쟁심화",
-        "환율",
-        "금리",
-        "손상차손",
-        "충당금",
-    ]
-    matched = [kw for kw in headwind_keywords if kw in corpus]
+def _core_business_headwind(hits: frozenset[str]) -> str:
+    matched = [kw for kw in _HEADWIND_KEYWORDS if kw in hits]
     if matched:
-        return f"주력 사업에서 {', '.join(list(dict.fromkeys(matched))[:3])} 부담이 포착됨"
+        return f"주력 사업에서 {', '.join(matched[:3])} 부담이 포착됨"
     return "주력 사업의 난관은 공시에 정량적으로 충분히 드러나지 않아 후속 설명이 필요함"
 
 
-def _summarize_news_title(title: str, company_name: str, issue_ctx: IssueContext) -> str:
-    compact = title.replace(" ", "")
-    if "적자전환" in compact:
+def _summarize_news_title(
+    title_hits: frozenset[str],
+    company_name: str,
+    issue_ctx: IssueContext,
+) -> str:
+    if "적자전환" in title_hits:
         return (
             f"{company_name}의 손익이 흑자에서 적자로 꺾였다는 신호를 확인시켜 "
             "밸류에이션 하향 압력을 점검하게 하는 보도"
         )
-    if "흑자전환" in compact:
+    if "흑자전환" in title_hits:
         return f"{company_name}의 수익구조 개선 가능성을 뒷받침하는 전환 신호 보도"
-    if any(k in compact for k in ["유상증자", "전환사채", "신주인수권부사채"]):
+    if title_hits & _FUNDING_KEYWORDS:
         return f"{company_name}의 자금조달/희석 이슈 해석에 직접 연결되는 보도"
-    if any(k in compact for k in ["공급계약", "수주"]):
+    if title_hits & {"공급계약", "수주"}:
         return f"{company_name}의 수주가 실제 실적으로 연결되는지 추적하는 보도"
     if "주력사업" in issue_ctx.core_business_headwind and "포착됨" in issue_ctx.core_business_headwind:
         return f"{company_name}의 주력 사업 어려움과 연결해 해석할 필요가 있는 보도"
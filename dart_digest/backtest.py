@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from dart_digest.columnar import DisclosureBatch
+from dart_digest.config import Settings
+from dart_digest.dart_client import parse_disclosures
+from dart_digest.market_filter import CompanyUniverse, MarketFilter
+from dart_digest.models import Disclosure
+from dart_digest.open_dart_client import fetch_disclosures_by_date, parse_list_page_batch
+from dart_digest.scoring import RULES_VERSION, score_batch
+from dart_digest.selection import SelectionRules, TopKSelector
+
+
+HISTOGRAM_BIN = 5
+
+# Per-process state, built once by the pool initializer rather than per replayed day.
+_worker_settings: Settings | None = None
+_worker_filter: MarketFilter | None = None
+
+
+@dataclass
+class DayResult:
+    date: str
+    disclosures: int = 0
+    scored: int = 0
+    picks: list[dict] = field(default_factory=list)
+    event_mix: dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+    scores: list[float] = field(default_factory=list, repr=False)
+
+
+def fixture_path(fixture_dir: Path, target_date: str) -> Path | None:
+    # <date>.json holds raw OpenDART list pages; <date>.xml a saved todayRSS feed.
+    for suffix in (".json", ".xml"):
+        path = fixture_dir / f"{target_date}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def load_fixture(path: Path, target_date: str) -> list[Disclosure]:
+    return load_fixture_batch(path, target_date).to_disclosures()
+
+
+def load_fixture_batch(path: Path, target_date: str) -> DisclosureBatch:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".xml":
+        return DisclosureBatch.from_disclosures(parse_disclosures(text))
+
+    pages = json.loads(text)
+    if isinstance(pages, dict):
+        pages = [pages]
+    batch = DisclosureBatch()
+    for page in pages:
+        parse_list_page_batch(page, target_date, str(page.get("corp_cls", "")), into=batch)
+    # A receipt can appear on more than one page; keep its last row, in first-seen order.
+    last = {receipt_no: index for index, receipt_no in enumerate(batch.receipt_no)}
+    if len(last) == len(batch):
+        return batch
+    first = dict.fromkeys(batch.receipt_no)
+    return batch.take([last[receipt_no] for receipt_no in first])
+
+
+def record_fixtures(settings: Settings, dates: list[str], fixture_dir: Path) -> list[Path]:
+    if not settings.dart_api_key:
+        raise RuntimeError("DART_API_KEY is required to record backtest fixtures.")
+
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    for target_date in dates:
+        pages: list[dict] = []
+        fetch_disclosures_by_date(
+            target_date=target_date,
+            api_key=settings.dart_api_key,
+            target_markets=settings.fetch_markets,
+            on_page=lambda corp_cls, data: pages.append({**data, "corp_cls": corp_cls}),
+        )
+        path = fixture_dir / f"{target_date}.json"
+        path.write_text(json.dumps(pages, ensure_ascii=False), encoding="utf-8")
+        written.append(path)
+    return written
+
+
+def run_backtest(
+    settings: Settings,
+    fixture_dir: Path,
+    dates: list[str],
+    workers: int | None = None,
+) -> dict:
+    jobs = [(target_date, fixture_path(fixture_dir, target_date)) for target_date in dates]
+    available = [(target_date, path) for target_date, path in jobs if path is not None]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(available) or 1))
+
+    started = time.perf_counter()
+    if workers == 1:
+        _init_worker(settings)
+        days = [_replay_day(job) for job in available]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(settings,),
+        ) as pool:
+            days = list(pool.map(_replay_day, available))
+    wall_seconds = time.perf_counter() - started
+
+    return {
+        "rules": {
+            "scoring": RULES_VERSION,
+            "selection": asdict(SelectionRules.from_settings(settings)),
+            "markets": list(settings.fetch_markets),
+        },
+        "workers": workers,
+        "missing_dates": [target_date for target_date, path in jobs if path is None],
+        "days": [_day_row(day) for day in days],
+        "summary": summarize(days, wall_seconds),
+    }
+
+
+def summarize(days: list[DayResult], wall_seconds: float) -> dict:
+    scores = sorted(score for day in days for score in day.scores)
+    picked = [pick for day in days for pick in day.picks]
+    event_mix: Counter[str] = Counter()
+    for day in days:
+        event_mix.update(day.event_mix)
+    histogram = Counter(int(score // HISTOGRAM_BIN) * HISTOGRAM_BIN for score in scores)
+    disclosures = sum(day.disclosures for day in days)
+
+    return {
+        "days": len(days),
+        "days_with_picks": sum(1 for day in days if day.picks),
+        "disclosures": disclosures,
+        "scored": len(scores),
+        "picks": len(picked),
+        "event_mix_scored": dict(event_mix.most_common()),
+        "event_mix_selected": dict(Counter(pick["event_type"] for pick in picked).most_common()),
+        "score": _distribution(scores),
+        "selected_score": _distribution(sorted(pick["total_score"] for pick in picked)),
+        "histogram": {
+            f"{low}-{low + HISTOGRAM_BIN}": histogram[low] for low in sorted(histogram)
+        },
+        "wall_seconds": round(wall_seconds, 3),
+        "disclosures_per_second": round(disclosures / wall_seconds, 1) if wall_seconds else 0.0,
+    }
+
+
+def compare_reports(baseline: dict, current: dict) -> dict:
+    before = {day["date"]: day for day in baseline["days"]}
+    after = {day["date"]: day for day in current["days"]}
+    shared = sorted(set(before) & set(after))
+
+    changed: list[dict] = []
+    for target_date in shared:
+        old = [pick["receipt_no"] for pick in before[target_date]["picks"]]
+        new = [pick["receipt_no"] for pick in after[target_date]["picks"]]
+        if old != new:
+            changed.append(
+                {
+                    "date": target_date,
+                    "baseline": _pick_labels(before[target_date]["picks"]),
+                    "current": _pick_labels(after[target_date]["picks"]),
+                    "overlap": len(set(old) & set(new)),
+                }
+            )
+
+    old_mix = baseline["summary"]["event_mix_selected"]
+    new_mix = current["summary"]["event_mix_selected"]
+    return {
+        "days_compared": len(shared),
+        "days_changed": len(changed),
+        "agreement": round(1 - len(changed) / len(shared), 4) if shared else 1.0,
+        "picks": current["summary"]["picks"] - baseline["summary"]["picks"],
+        "selected_score_mean": round(
+            current["summary"]["selected_score"]["mean"]
+            - baseline["summary"]["selected_score"]["mean"],
+            3,
+        ),
+        "event_mix_selected": {
+            event: new_mix.get(event, 0) - old_mix.get(event, 0)
+            for event in sorted(set(old_mix) | set(new_mix))
+            if new_mix.get(event, 0) != old_mix.get(event, 0)
+        },
+        "changed": changed,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"{'date':<10} {'disc':>6} {'scored':>6}  picks"]
+    for day in report["days"]:
+        lines.append(
+            f"{day['date']:<10} {day['disclosures']:>6} {day['scored']:>6}  "
+            + (" | ".join(_pick_labels(day["picks"])) or "-")
+        )
+    summary = report["summary"]
+    lines += [
+        "",
+        f"rules: scoring={report['rules']['scoring']} "
+        f"markets={','.join(report['rules']['markets'])}",
+        f"days: {summary['days']} ({summary['days_with_picks']} with picks, "
+        f"{len(report['missing_dates'])} without fixtures)",
+        f"disclosures: {summary['disclosures']} scored: {summary['scored']} "
+        f"picks: {summary['picks']}",
+        "score: " + _format_distribution(summary["score"]),
+        "selected score: " + _format_distribution(summary["selected_score"]),
+        "selected event mix: "
+        + (", ".join(f"{k}={v}" for k, v in summary["event_mix_selected"].items()) or "-"),
+        f"throughput: {summary['disclosures_per_second']:.1f} disclosures/s "
+        f"({summary['wall_seconds']:.2f}s, {report['workers']} worker(s))",
+    ]
+    return "\n".join(lines)
+
+
+def format_comparison(diff: dict) -> str:
+    lines = [
+        f"days compared: {diff['days_compared']}, changed: {diff['days_changed']} "
+        f"(agreement {diff['agreement']:.1%})",
+        f"picks delta: {diff['picks']:+d}, selected score mean delta: "
+        f"{diff['selected_score_mean']:+.3f}",
+    ]
+    if diff["event_mix_selected"]:
+        lines.append(
+            "selected event mix delta: "
+            + ", ".join(f"{k}={v:+d}" for k, v in diff["event_mix_selected"].items())
+        )
+    for row in diff["changed"]:
+        lines.append(
+            f"{row['date']}: {' | '.join(row['baseline']) or '-'}  ->  "
+            f"{' | '.join(row['current']) or '-'}"
+        )
+    return "\n".join(lines)
+
+
+def _init_worker(settings: Settings) -> None:
+    global _worker_settings, _worker_filter
+    _worker_settings = settings
+    _worker_filter = MarketFilter(
+        CompanyUniverse.from_csv(settings.company_map_path),
+        settings.fetch_markets,
+    )
+
+
+def _replay_day(job: tuple[str, Path]) -> DayResult:
+    # Filter, score and select only: no dedup table, caches, news, LLM or Slack.
+    assert _worker_settings is not None and _worker_filter is not None
+    target_date, path = job
+    started = time.perf_counter()
+    # Columnar end to end: only rows that clear the selection floor become objects.
+    disclosures = load_fixture_batch(path, target_date)
+    scored = score_batch(_worker_filter.filter(disclosures))
+    rules = SelectionRules.from_settings(_worker_settings)
+    selector = TopKSelector(rules)
+    selector.extend(scored.rows(min_score=rules.score_floor))
+    picks = selector.select()
+
+    return DayResult(
+        date=target_date,
+        disclosures=len(disclosures),
+        scored=len(scored),
+        picks=[
+            {
+                "receipt_no": item.disclosure.receipt_no,
+                "company_name": item.disclosure.company_name,
+                "title": item.disclosure.title,
+                "event_type": item.event_type,
+                "total_score": item.total_score,
+            }
+            for item in picks
+        ],
+        event_mix=dict(Counter(scored.event_type)),
+        seconds=round(time.perf_counter() - started, 6),
+        scores=scored.total_score,
+    )
+
+
+def _day_row(day: DayResult) -> dict:
+    row = asdict(day)
+    del row["scores"]
+    return row
+
+
+def _distribution(values: list[float]) -> dict[str, float]:
+    # `values` must be sorted.
+    if not values:
+        return {"count": 0, "mean": 0.0, "min": 0.0, "p50": 0.0, "p90": 0.0, "max": 0.0}
+    return {
+        "count": len(values),
+        "mean": round(statistics.fmean(values), 3),
+        "min": values[0],
+        "p50": values[len(values) // 2],
+        "p90": values[min(len(values) - 1, int(len(values) * 0.9))],
+        "max": values[-1],
+    }
+
+
+def _format_distribution(dist: dict[str, float]) -> str:
+    if not dist["count"]:
+        return "-"
+    return (
+        f"n={dist['count']} mean={dist['mean']:.1f} min={dist['min']:.1f} "
+        f"p50={dist['p50']:.1f} p90={dist['p90']:.1f} max={dist['max']:.1f}"
+    )
+
+
+def _pick_labels(picks: list[dict]) -> list[str]:
+    return [f"{pick['company_name']}({pick['total_score']:.1f})" for pick in picks]
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from dart_digest.models import Disclosure, ScoredDisclosure
+
+
+# Stages in completion order; a checkpoint's stage is the last one it finished.
+STARTED = "started"
+FETCHED = "fetched"
+SELECTED = "selected"
+WRITTEN = "written"
+DONE = "done"
+STAGES = (STARTED, FETCHED, SELECTED, WRITTEN, DONE)
+
+
+@dataclass
+class RunCheckpoint:
+    run_key: str
+    run_dt: datetime
+    stage: str = STARTED
+    # Fetched feed; stored once at FETCHED and dropped at SELECTED (see CheckpointStore.save).
+    disclosures: list[Disclosure] | None = None
+    # UTC time the streamed filter/dedup/score pass first started; disclosures it marked
+    # processed before a failure still count as new when the run is resumed.
+    scoring_since: str | None = None
+    # Output profile name -> selected items, in pick order. Scored items are streamed
+    # and never held as a whole, so only the picks are checkpointed.
+    selections: dict[str, list[ScoredDisclosure]] | None = None
+    articles: dict[str, str] = field(default_factory=dict)
+    published: list[str] = field(default_factory=list)
+    status: str = ""
+
+    def reached(self, stage: str) -> bool:
+        return STAGES.index(self.stage) >= STAGES.index(stage)
+
+
+class CheckpointStore:
+    def __init__(self, db_path: Path, retention_seconds: float = 7 * 86400) -> None:
+        self.db_path = db_path
+        self.retention_seconds = retention_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS run_checkpoints (
+                    run_key TEXT PRIMARY KEY,
+                    stage TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(run_checkpoints)")}
+            if "disclosures" not in columns:
+                # The fetched list lives apart from the payload so that small updates
+                # (articles, publishes) do not re-serialize it.
+                conn.execute("ALTER TABLE run_checkpoints ADD COLUMN disclosures TEXT")
+            conn.commit()
+
+    @staticmethod
+    def run_key_for(run_dt: datetime, test_date: str | None) -> str:
+        # One resumable run per source and day: the RSS feed is "today", --date a fixed day.
+        return f"date:{test_date}" if test_date else f"rss:{run_dt.strftime('%Y%m%d')}"
+
+    def start(self, run_key: str, run_dt: datetime) -> RunCheckpoint:
+        checkpoint = RunCheckpoint(run_key=run_key, run_dt=run_dt)
+        self.save(checkpoint)
+        return checkpoint
+
+    def load(self, run_key: str) -> RunCheckpoint | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, disclosures FROM run_checkpoints WHERE run_key = ?",
+                (run_key,),
+            ).fetchone()
+        if row is None:
+            return None
+        checkpoint = _from_payload(json.loads(row[0]))
+        if row[1] is not None and not checkpoint.reached(SELECTED):
+            checkpoint.disclosures = [_disclosure_from_dict(item) for item in json.loads(row[1])]
+        return checkpoint
+
+    def save(self, checkpoint: RunCheckpoint, stage: str | None = None) -> None:
+        # The fetched list is written only by the FETCHED save and cleared before it (a new
+        # attempt) or once SELECTED is reached (resume no longer needs it); every other
+        # save rewrites the small fields.
+        if stage is not None and not checkpoint.reached(stage):
+            checkpoint.stage = stage
+        if checkpoint.reached(SELECTED):
+            checkpoint.disclosures = None
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO run_checkpoints (run_key, stage, payload, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(run_key) DO UPDATE SET
+                    stage = excluded.stage,
+                    payload = excluded.payload,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    checkpoint.run_key,
+                    checkpoint.stage,
+                    json.dumps(_to_payload(checkpoint), ensure_ascii=False),
+                    now,
+                ),
+            )
+            if stage == FETCHED and checkpoint.disclosures is not None:
+                conn.execute(
+                    "UPDATE run_checkpoints SET disclosures = ? WHERE run_key = ?",
+                    (
+                        json.dumps(
+                            [_disclosure_to_dict(item) for item in checkpoint.disclosures],
+                            ensure_ascii=False,
+                        ),
+                        checkpoint.run_key,
+                    ),
+                )
+            elif checkpoint.reached(SELECTED) or not checkpoint.reached(FETCHED):
+                # A fresh start() must not leave an earlier attempt's list for --resume.
+                conn.execute(
+                    "UPDATE run_checkpoints SET disclosures = NULL "
+                    "WHERE run_key = ? AND disclosures IS NOT NULL",
+                    (checkpoint.run_key,),
+                )
+            conn.execute(
+                "DELETE FROM run_checkpoints WHERE updated_at < ?",
+                (now - self.retention_seconds,),
+            )
+            conn.commit()
+
+
+def _to_payload(checkpoint: RunCheckpoint) -> dict[str, Any]:
+    return {
+        "run_key": checkpoint.run_key,
+        "run_dt": checkpoint.run_dt.isoformat(),
+        "stage": checkpoint.stage,
+        "scoring_since": checkpoint.scoring_since,
+        "selections": (
+            None
+            if checkpoint.selections is None
+            else {
+                name: [_scored_to_dict(item) for item in selected]
+                for name, selected in checkpoint.selections.items()
+            }
+        ),
+        "articles": checkpoint.articles,
+        "published": checkpoint.published,
+        "status": checkpoint.status,
+    }
+
+
+def _from_payload(payload: dict[str, Any]) -> RunCheckpoint:
+    return RunCheckpoint(
+        run_key=payload["run_key"],
+        run_dt=datetime.fromisoformat(payload["run_dt"]),
+        stage=payload["stage"],
+        scoring_since=payload["scoring_since"],
+        selections=(
+            None
+            if payload["selections"] is None
+            else {
+                name: [_scored_from_dict(item) for item in selected]
+                for name, selected in payload["selections"].items()
+            }
+        ),
+        articles=dict(payload["articles"]),
+        published=list(payload["published"]),
+        status=payload["status"],
+    )
+
+
+def _disclosure_to_dict(disclosure: Disclosure) -> dict[str, Any]:
+    row = asdict(disclosure)
+    row["published_at"] = disclosure.published_at.isoformat()
+    return row
+
+
+def _disclosure_from_dict(row: dict[str, Any]) -> Disclosure:
+    return Disclosure(**{**row, "published_at": datetime.fromisoformat(row["published_at"])})
+
+
+def _scored_to_dict(scored: ScoredDisclosure) -> dict[str, Any]:
+    return {
+        "disclosure": _disclosure_to_dict(scored.disclosure),
+        "market": scored.market,
+        "event_type": scored.event_type,
+        "event_score": scored.event_score,
+        "financial_score": scored.financial_score,
+        "persistence_score": scored.persistence_score,
+        "confidence_score": scored.confidence_score,
+        "market_bonus": scored.market_bonus,
+        "total_score": scored.total_score,
+        "reasons": list(scored.reasons),
+    }
+
+
+def _scored_from_dict(row: dict[str, Any]) -> ScoredDisclosure:
+    return ScoredDisclosure(**{**row, "disclosure": _disclosure_from_dict(row["disclosure"])})
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from dart_digest.config import Settings
+
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+BREAKER_NAMES = ("dart", "news", "openai", "slack")
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        db_path: Path,
+        failure_rate: float = 0.5,
+        min_calls: int = 4,
+        window: int = 10,
+        cooldown_seconds: float = 30 * 60,
+    ) -> None:
+        self.name = name
+        self.db_path = db_path
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.window = max(self.min_calls, window)
+        self.cooldown_seconds = cooldown_seconds
+        self.state = CLOSED
+        # Last `window` call outcomes, oldest first: "1" failure, "0" success.
+        self.outcomes = ""
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+        self._load()
+
+    @classmethod
+    def from_settings(cls, name: str, settings: Settings) -> "CircuitBreaker":
+        return cls(
+            name,
+            settings.db_path,
+            failure_rate=settings.breaker_failure_rate,
+            min_calls=settings.breaker_min_calls,
+            window=settings.breaker_window,
+            cooldown_seconds=settings.breaker_cooldown_minutes * 60,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_rate > 0
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS circuit_breakers (
+                    name TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    outcomes TEXT NOT NULL,
+                    opened_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+
+    def allow(self) -> bool:
+        if not self.enabled:
+            return True
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.time()
+            if now - self.opened_at >= self.cooldown_seconds:
+                # Let one probe through; a probe that never reports back is retried
+                # after another cooldown.
+                self.state = HALF_OPEN
+                self.opened_at = now
+                self._save()
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.state = CLOSED
+                self.outcomes = ""
+            else:
+                self.outcomes = (self.outcomes + "0")[-self.window :]
+            self._save()
+
+    def record_failure(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            now = time.time()
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+                self.opened_at = now
+            else:
+                self.outcomes = (self.outcomes + "1")[-self.window :]
+                if self.state == CLOSED and self._tripped():
+                    self.state = OPEN
+                    self.opened_at = now
+            self._save()
+
+    def call(self, fn: Callable[..., T], *args: object, **kwargs: object) -> T:
+        if not self.allow():
+            raise CircuitOpenError(
+                f"{self.name} circuit is open after repeated failures; call skipped."
+            )
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "open": 0 if self.state == CLOSED else 1,
+                "rejected": self.rejected,
+                "failure_rate": (
+                    round(self.outcomes.count("1") / len(self.outcomes), 4)
+                    if self.outcomes
+                    else 0.0
+                ),
+            }
+
+    def _tripped(self) -> bool:
+        calls = len(self.outcomes)
+        return calls >= self.min_calls and self.outcomes.count("1") / calls >= self.failure_rate
+
+    def _load(self) -> None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT state, outcomes, opened_at FROM circuit_breakers WHERE name = ?",
+                (self.name,),
+            ).fetchone()
+        if row is not None:
+            self.state, outcomes, self.opened_at = row
+            self.outcomes = outcomes[-self.window :]
+
+    def _save(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO circuit_breakers (name, state, outcomes, opened_at, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    state = excluded.state,
+                    outcomes = excluded.outcomes,
+                    opened_at = excluded.opened_at,
+                    updated_at = excluded.updated_at
+                """,
+                (self.name, self.state, self.outcomes, self.opened_at, time.time()),
+            )
+            conn.commit()
+
+
+def load_breakers(settings: Settings) -> dict[str, CircuitBreaker]:
+    return {name: CircuitBreaker.from_settings(name, settings) for name in BREAKER_NAMES}
@@ -2,9 +2,18 @@ from __future__ import annotations
 
 import argparse
 import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
 
+from dart_digest import __version__
 from dart_digest.config import Settings
-from dart_digest.pipeline import DigestPipeline
+
+if TYPE_CHECKING:
+    from dart_digest.pipeline import DigestPipeline, PipelineResult
+
+# Keep this module cheap to import: the pipeline pulls in requests, every client and
+# zoneinfo, so it is imported only by the commands that actually run it.
+CHEAP_COMMANDS = ("help", "version", "config")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -12,7 +21,19 @@ def build_parser() -> argparse.ArgumentParser:
         prog="dart-digest",
         description="Generate and publish a daily deep-dive report from DART disclosures.",
     )
-    parser.add_argument("run", nargs="?", default="run", help="Run pipeline once")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="run",
+        choices=["run", "backfill", "backtest", "flush", "serve", *CHEAP_COMMANDS],
+        help=(
+            "run: run pipeline once (default). backfill: regenerate reports for a date range. "
+            "backtest: replay recorded fixtures through filter/score/select, no publishing. "
+            "flush: deliver Slack messages left in the outbox by an earlier run. "
+            "serve: HTTP scoring service (/score, /classify-company) on a preloaded universe. "
+            "help/version: print and exit. config: validate settings from the environment."
+        ),
+    )
     parser.add_argument(
         "--force",
         action="store_true",
@@ -28,36 +49,344 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print generated article to stdout.",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue today's (or --date's) failed run from its last checkpointed stage.",
+    )
     parser.add_argument(
         "--date",
         help="Historical date for backtest in YYYYMMDD (uses OpenDART list API).",
     )
+    parser.add_argument(
+        "--from",
+        dest="date_from",
+        help="Start date in YYYYMMDD (backfill/backtest commands).",
+    )
+    parser.add_argument(
+        "--to",
+        dest="date_to",
+        help="End date in YYYYMMDD, inclusive (backfill/backtest; defaults to --from).",
+    )
+    parser.add_argument(
+        "--batch-dir",
+        help="Directory for OpenAI batch JSONL job files (backfill command).",
+    )
+    parser.add_argument(
+        "--fixtures",
+        default="data/fixtures",
+        help="Backtest fixture directory of <YYYYMMDD>.json/.xml files (default: data/fixtures).",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Backtest: fetch each date from OpenDART and save it as a fixture, then exit.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Backtest worker processes (default: CPU count).",
+    )
+    parser.add_argument(
+        "--report-out",
+        help="Backtest: write the full report (per-day picks and summary) as JSON.",
+    )
+    parser.add_argument(
+        "--compare",
+        help="Backtest: compare against a baseline report JSON written by --report-out.",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Serve: address to bind (default: 127.0.0.1).",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8787,
+        help="Serve: port to listen on (default: 8787).",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        help="Total run budget in seconds (run command; defaults to DART_RUN_DEADLINE_SECONDS, 0 = none).",
+    )
+    parser.add_argument(
+        "--rss-file",
+        help="Read the DART RSS feed from a recorded XML file instead of the network.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help=(
+            "No network: requires --rss-file (no --date), skips news and OpenAI "
+            "(replay cache still applies); implies --dry-run."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["cpu", "mem"],
+        help="Profile the run with cProfile (cpu) or tracemalloc (mem), split by pipeline stage.",
+    )
+    parser.add_argument(
+        "--profile-out",
+        help="Profile output (default: data/profile.prof or data/profile_mem.txt).",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        help="Allocation sites listed per stage in the mem report (default: 25).",
+    )
+    parser.add_argument(
+        "--emit",
+        choices=["jsonl"],
+        help="Stream every scored candidate (score parts, reasons, selected flag) as it is produced.",
+    )
+    parser.add_argument(
+        "--emit-out",
+        default="-",
+        help="Where --emit writes (default: stdout; status lines then go to stderr).",
+    )
+    parser.add_argument(
+        "--metrics-out",
+        help="Write per-stage timings and counters as JSON to this path.",
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        help="Write per-stage metrics in Prometheus textfile format to this path.",
+    )
     return parser
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.command == "help":
+        parser.print_help()
+        return 0
+    if args.command == "version":
+        print(f"dart-digest {__version__}")
+        return 0
+    if args.command in ("backfill", "backtest") and not args.date_from:
+        parser.error(f"{args.command} requires --from YYYYMMDD")
+    if args.offline and (args.command != "run" or args.date or not args.rss_file):
+        # The feed (RSS or the OpenDART list API) is the one call --offline cannot skip.
+        parser.error("--offline needs the run command with --rss-file and no --date")
+
+    try:
+        settings = Settings.from_env()
+    except (OSError, ValueError) as exc:
+        print(f"[error] invalid setting: {exc}", file=sys.stderr)
+        return 2
+    if args.command == "config":
+        return _check_config(settings)
+    if args.command == "backtest":
+        return _backtest(settings, args)
+    if args.command == "serve":
+        return _serve(settings, args)
 
-    settings = Settings.from_env()
     if args.dry_run:
         settings.dry_run = True
+    if args.rss_file:
+        settings.rss_url = Path(args.rss_file).resolve().as_uri()
+    if args.offline:
+        settings.dry_run = True
+        settings.news_enabled = False
+        settings.openai_api_key = None
 
-    pipeline = DigestPipeline(settings)
+    from dart_digest.emit import CandidateEmitter
+    from dart_digest.pipeline import DigestPipeline
+
+    emit_file = None
+    emitter = None
+    status_out = sys.stdout
+    if args.emit:
+        if args.emit_out == "-":
+            emitter = CandidateEmitter(sys.stdout.buffer, profiles=bool(settings.profiles))
+            # Keep stdout pure JSONL for whatever it is piped into.
+            status_out = sys.stderr
+        else:
+            emit_path = Path(args.emit_out)
+            emit_path.parent.mkdir(parents=True, exist_ok=True)
+            emit_file = emit_path.open("wb")
+            emitter = CandidateEmitter(emit_file, profiles=bool(settings.profiles))
+    pipeline = DigestPipeline(settings, emitter=emitter)
 
     try:
-        result = pipeline.run(force=args.force, test_date=args.date)
+        if args.profile:
+            from dart_digest.profiling import run_profiled
+
+            out_path = Path(
+                args.profile_out
+                or ("data/profile.prof" if args.profile == "cpu" else "data/profile_mem.txt")
+            )
+            results, written = run_profiled(
+                args.profile,
+                lambda: _dispatch(pipeline, args),
+                out_path,
+                top_n=max(1, args.profile_top),
+            )
+            for path in written:
+                print(f"[profile] wrote {path}", file=sys.stderr)
+        else:
+            results = _dispatch(pipeline, args)
     except Exception as exc:  # noqa: BLE001
         print(f"[error] {exc}", file=sys.stderr)
         return 1
+    finally:
+        _write_metrics(pipeline, args)
+        if emit_file is not None:
+            emit_file.close()
 
-    print(f"[{result.status}] {result.message}")
+    for result in results:
+        for output in result.outputs or [result]:
+            profile = f"[{output.profile}] " if output.profile else ""
+            print(f"[{output.status}] {profile}{output.message}", file=status_out)
 
-    if args.print_article and result.selection:
-        print("\n" + result.selection.generated_article)
+            if args.print_article and output.selection:
+                print("\n" + output.selection.generated_article, file=status_out)
+
+    return 0
+
+
+def _backtest(settings: Settings, args: argparse.Namespace) -> int:
+    import json
+
+    from dart_digest.backtest import (
+        compare_reports,
+        format_comparison,
+        format_report,
+        record_fixtures,
+        run_backtest,
+    )
+    from dart_digest.pipeline import date_range
+
+    fixture_dir = Path(args.fixtures)
+    try:
+        # Argument and baseline problems surface before the (slow) replay, not after it.
+        dates = date_range(args.date_from, args.date_to or args.date_from)
+        baseline = None
+        if args.compare:
+            if args.record:
+                raise ValueError("--compare cannot be combined with --record")
+            baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+            if not isinstance(baseline, dict) or not {"days", "summary"} <= set(baseline):
+                raise ValueError(f"{args.compare} is not a backtest report (--report-out)")
+        if args.record:
+            for path in record_fixtures(settings, dates, fixture_dir):
+                print(f"[recorded] {path}")
+            return 0
+        report = run_backtest(settings, fixture_dir, dates, workers=args.workers)
+        comparison = compare_reports(baseline, report) if baseline is not None else None
+    except Exception as exc:  # noqa: BLE001
+        print(f"[error] {exc}", file=sys.stderr)
+        return 1
 
+    print(format_report(report))
+    if args.report_out:
+        out_path = Path(args.report_out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if comparison is not None:
+        print("\n" + format_comparison(comparison))
     return 0
 
 
+def _serve(settings: Settings, args: argparse.Namespace) -> int:
+    from dart_digest.server import ScoringService, make_server
+
+    try:
+        service = ScoringService.from_settings(settings)
+        server = make_server(service, args.host, args.port)
+    except (OSError, ValueError) as exc:
+        print(f"[error] {exc}", file=sys.stderr)
+        return 1
+
+    host, port = server.server_address[:2]
+    print(
+        f"[serve] http://{host}:{port} ({len(service.universe.items)} companies, "
+        f"markets={','.join(sorted(service.target_markets))})",
+        file=sys.stderr,
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def _check_config(settings: Settings) -> int:
+    # Reads only the environment: no network, no database, no company CSV.
+    problems: list[str] = []
+    if settings.require_slack_webhook and not settings.slack_webhook_url and not settings.dry_run:
+        problems.append("DART_REQUIRE_SLACK_WEBHOOK is set but SLACK_WEBHOOK_URL is empty")
+    try:
+        from zoneinfo import ZoneInfo
+
+        ZoneInfo(settings.timezone)
+    except (ValueError, KeyError):
+        problems.append(f"DART_TIMEZONE is not a known time zone: {settings.timezone}")
+    if not 0 <= settings.breaker_failure_rate <= 1:
+        problems.append("DART_BREAKER_FAILURE_RATE must be between 0 and 1")
+    if settings.run_deadline_seconds < 0:
+        problems.append("DART_RUN_DEADLINE_SECONDS must be >= 0")
+
+    print(f"rss_url: {settings.rss_url}")
+    print(f"db_path: {settings.db_path}")
+    print(f"company_map_path: {settings.company_map_path}")
+    print(f"target_markets: {','.join(settings.target_markets)}")
+    print(f"timezone: {settings.timezone}")
+    print(f"openai: model={settings.openai_model} key={_presence(settings.openai_api_key)}")
+    print(f"dart_api_key: {_presence(settings.dart_api_key)}")
+    print(f"slack_webhook_url: {_presence(settings.slack_webhook_url)}")
+    print(f"dry_run: {settings.dry_run}")
+    for profile in settings.profiles:
+        target = settings.for_profile(profile)
+        print(
+            f"profile {profile.name}: markets={','.join(target.target_markets)} "
+            f"top_n={target.top_n_max} slack_webhook_url={_presence(target.slack_webhook_url)}"
+        )
+    for problem in problems:
+        print(f"[error] {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+def _presence(secret: str | None) -> str:
+    return "set" if secret else "missing"
+
+
+def _dispatch(pipeline: DigestPipeline, args: argparse.Namespace) -> list[PipelineResult]:
+    if args.command == "flush":
+        return [pipeline.flush()]
+    if args.command == "backfill":
+        return pipeline.backfill(
+            start_date=args.date_from,
+            end_date=args.date_to or args.date_from,
+            force=args.force,
+            batch_dir=Path(args.batch_dir) if args.batch_dir else None,
+        )
+    return [
+        pipeline.run(
+            force=args.force,
+            test_date=args.date,
+            deadline_seconds=args.deadline,
+            resume=args.resume,
+        )
+    ]
+
+
+def _write_metrics(pipeline: DigestPipeline, args: argparse.Namespace) -> None:
+    run_metrics = pipeline.last_metrics
+    if run_metrics is None:
+        return
+    if args.metrics_out:
+        run_metrics.write_json(Path(args.metrics_out))
+    if args.metrics_prom:
+        run_metrics.write_prometheus(Path(args.metrics_prom))
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from typing import Any, Iterable, Iterator
+
+from dart_digest.models import Disclosure, ScoredDisclosure, intern_reasons
+
+
+DISCLOSURE_COLUMNS = (
+    "company_name",
+    "title",
+    "link",
+    "receipt_no",
+    "published_at",
+    "description",
+    "market",
+    "ticker",
+)
+SCORE_COLUMNS = (
+    "market",
+    "event_type",
+    "event_score",
+    "financial_score",
+    "persistence_score",
+    "confidence_score",
+    "market_bonus",
+    "total_score",
+    "reasons",
+)
+
+
+class DisclosureBatch:
+    # Struct of arrays: one list per Disclosure field, row i spread across them. A
+    # batch costs a handful of list slots per row instead of an object per row.
+    # Conversions to and from Disclosure move references only; no string or datetime
+    # is copied, so a round trip yields fields that are the very same objects.
+    __slots__ = DISCLOSURE_COLUMNS
+
+    def __init__(self, **columns: list[Any]) -> None:
+        unknown = set(columns) - set(DISCLOSURE_COLUMNS)
+        if unknown:
+            raise TypeError(f"unknown column(s): {', '.join(sorted(unknown))}")
+        for name in DISCLOSURE_COLUMNS:
+            setattr(self, name, columns.get(name, []))
+        if len({len(getattr(self, name)) for name in DISCLOSURE_COLUMNS}) > 1:
+            raise ValueError("columns must all have the same length")
+
+    def __len__(self) -> int:
+        return len(self.receipt_no)
+
+    def append(
+        self,
+        company_name: str,
+        title: str,
+        link: str,
+        receipt_no: str,
+        published_at: datetime,
+        description: str,
+        market: str = "",
+        ticker: str = "",
+    ) -> None:
+        self.company_name.append(company_name)
+        self.title.append(title)
+        self.link.append(link)
+        self.receipt_no.append(receipt_no)
+        self.published_at.append(published_at)
+        self.description.append(description)
+        self.market.append(market)
+        self.ticker.append(ticker)
+
+    @classmethod
+    def from_disclosures(cls, disclosures: Iterable[Disclosure]) -> DisclosureBatch:
+        batch = cls()
+        for item in disclosures:
+            batch.append(
+                item.company_name,
+                item.title,
+                item.link,
+                item.receipt_no,
+                item.published_at,
+                item.description,
+                item.market,
+                item.ticker,
+            )
+        return batch
+
+    def row(self, index: int) -> Disclosure:
+        return Disclosure(*(getattr(self, name)[index] for name in DISCLOSURE_COLUMNS))
+
+    def to_disclosures(self) -> list[Disclosure]:
+        return [
+            Disclosure(*row)
+            for row in zip(*(getattr(self, name) for name in DISCLOSURE_COLUMNS))
+        ]
+
+    def take(self, indices: list[int]) -> DisclosureBatch:
+        columns: dict[str, list[Any]] = {}
+        for name in DISCLOSURE_COLUMNS:
+            column = getattr(self, name)
+            columns[name] = [column[index] for index in indices]
+        return DisclosureBatch(**columns)
+
+    def slices(self, size: int) -> Iterator[DisclosureBatch]:
+        size = max(1, size)
+        for start in range(0, len(self), size):
+            yield DisclosureBatch(
+                **{name: getattr(self, name)[start : start + size] for name in DISCLOSURE_COLUMNS}
+            )
+
+
+class ScoredBatch:
+    # Score columns alongside the DisclosureBatch they were computed from, with the
+    # same interning as ScoredDisclosure. Rows become objects only when asked for, e.g.
+    # for the few candidates that make it into a top-K pool.
+    __slots__ = ("batch", *SCORE_COLUMNS)
+
+    def __init__(self, batch: DisclosureBatch, parts: list[tuple[Any, ...]]) -> None:
+        self.batch = batch
+        columns = list(zip(*parts)) if parts else [()] * len(SCORE_COLUMNS)
+        for name, column in zip(SCORE_COLUMNS, columns):
+            setattr(self, name, list(column))
+        self.market = [sys.intern(market) for market in self.market]
+        self.event_type = [sys.intern(event_type) for event_type in self.event_type]
+        self.reasons = [intern_reasons(reasons) for reasons in self.reasons]
+
+    def __len__(self) -> int:
+        return len(self.total_score)
+
+    def row(self, index: int) -> ScoredDisclosure:
+        return ScoredDisclosure(
+            self.batch.row(index),
+            *(getattr(self, name)[index] for name in SCORE_COLUMNS),
+        )
+
+    def rows(self, min_score: float | None = None) -> Iterator[ScoredDisclosure]:
+        # With `min_score`, rows below it are skipped without building their objects.
+        for index, total in enumerate(self.total_score):
+            if min_score is None or total >= min_score:
+                yield self.row(index)
+
+    def to_scored(self) -> list[ScoredDisclosure]:
+        return list(self.rows())
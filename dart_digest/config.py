@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import json
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 from pathlib import Path
 
 
@@ -35,6 +36,54 @@ def _get_csv_list(name: str, default: str) -> tuple[str, ...]:
     return tuple(dict.fromkeys(items))
 
 
+@dataclass(frozen=True)
+class OutputProfile:
+    # A named destination; fields left as None inherit the base Settings value.
+    name: str
+    target_markets: tuple[str, ...] | None = None
+    top_n_max: int | None = None
+    primary_min_score: float | None = None
+    second_pick_min_score: float | None = None
+    second_pick_min_gap: float | None = None
+    max_per_event_type: int | None = None
+    max_per_company: int | None = None
+    slack_webhook_url: str | None = None
+    slack_channel: str | None = None
+
+
+def load_profiles(path: Path) -> tuple[OutputProfile, ...]:
+    # JSON list of objects. Webhooks are secrets, so they are named by env var
+    # ("slack_webhook_env") rather than written into the file.
+    known = {item.name for item in fields(OutputProfile)} - {"slack_webhook_url"}
+    profiles: list[OutputProfile] = []
+    for raw in json.loads(path.read_text(encoding="utf-8")):
+        values = dict(raw)
+        webhook_env = values.pop("slack_webhook_env", None)
+        unknown = set(values) - known
+        if unknown:
+            raise ValueError(f"unknown profile keys in {path}: {', '.join(sorted(unknown))}")
+        if not values.get("name"):
+            raise ValueError(f"every profile in {path} needs a name")
+        if "target_markets" in values:
+            values["target_markets"] = tuple(
+                dict.fromkeys(market.strip().upper() for market in values["target_markets"])
+            )
+        if webhook_env:
+            # An unset variable must not fall back to the base webhook, which is another
+            # desk's channel.
+            values["slack_webhook_url"] = os.getenv(webhook_env)
+            if not values["slack_webhook_url"]:
+                raise ValueError(
+                    f"profile {values['name']!r} in {path}: {webhook_env} is not set"
+                )
+        profiles.append(OutputProfile(**values))
+
+    names = [profile.name for profile in profiles]
+    if len(set(names)) != len(names):
+        raise ValueError(f"duplicate profile names in {path}")
+    return tuple(profiles)
+
+
 @dataclass
 class Settings:
     rss_url: str
@@ -53,6 +102,54 @@ class Settings:
     notify_on_skip: bool
     require_slack_webhook: bool
     dry_run: bool
+    score_cache_size: int = 4096
+    score_cache_persist: bool = True
+    score_workers: int = 1
+    score_parallel_threshold: int = 5000
+    stream_batch_size: int = 1000
+    primary_min_score: float = 60.0
+    max_per_event_type: int = 1
+    max_per_company: int = 0
+    news_enabled: bool = True
+    news_max_workers: int = 4
+    news_deadline_seconds: float = 15.0
+    news_cache_ttl_minutes: float = 180.0
+    news_cache_stale_minutes: float = 1440.0
+    openai_cache_max_age_days: float = 7.0
+    openai_cache_max_entries: int = 200
+    openai_replay: bool = False
+    openai_first_token_timeout_seconds: float = 15.0
+    openai_total_timeout_seconds: float = 40.0
+    prompt_token_budget: int = 3000
+    openai_base_url: str = "https://api.openai.com/v1"
+    openai_batch_poll_seconds: float = 30.0
+    openai_batch_timeout_seconds: float = 3600.0
+    breaker_failure_rate: float = 0.5
+    breaker_min_calls: int = 4
+    breaker_window: int = 10
+    breaker_cooldown_minutes: float = 30.0
+    run_deadline_seconds: float = 900.0
+    profiles: tuple[OutputProfile, ...] = ()
+
+    @property
+    def fetch_markets(self) -> tuple[str, ...]:
+        # Fetch and filter once for every market any profile publishes.
+        if not self.profiles:
+            return self.target_markets
+        markets = [
+            market
+            for profile in self.profiles
+            for market in (profile.target_markets or self.target_markets)
+        ]
+        return tuple(dict.fromkeys(markets))
+
+    def for_profile(self, profile: OutputProfile) -> "Settings":
+        overrides = {
+            item.name: getattr(profile, item.name)
+            for item in fields(OutputProfile)
+            if item.name != "name" and getattr(profile, item.name) is not None
+        }
+        return replace(self, profiles=(), **overrides)
 
     @classmethod
     def from_env(cls) -> "Settings":
@@ -69,7 +166,7 @@ class Settings:
             or ("KOSPI", "KOSDAQ"),
             dart_api_key=os.getenv("DART_API_KEY"),
             timezone=os.getenv("DART_TIMEZONE", "Asia/Seoul"),
-            top_n_max=max(1, min(2, _get_int("DART_TOP_N_MAX", 2))),
+            top_n_max=max(1, _get_int("DART_TOP_N_MAX", 2)),
             second_pick_min_score=_get_float("DART_SECOND_PICK_MIN_SCORE", 78.0),
             second_pick_min_gap=_get_float("DART_SECOND_PICK_MIN_GAP", 6.0),
             openai_api_key=os.getenv("OPENAI_API_KEY"),
@@ -79,4 +176,38 @@ class Settings:
             notify_on_skip=_get_bool("DART_NOTIFY_ON_SKIP", True),
             require_slack_webhook=_get_bool("DART_REQUIRE_SLACK_WEBHOOK", False),
             dry_run=_get_bool("DRY_RUN", False),
+            score_cache_size=max(1, _get_int("DART_SCORE_CACHE_SIZE", 4096)),
+            score_cache_persist=_get_bool("DART_SCORE_CACHE_PERSIST", True),
+            score_workers=max(0, _get_int("DART_SCORE_WORKERS", 1)),
+            score_parallel_threshold=_get_int("DART_SCORE_PARALLEL_THRESHOLD", 5000),
+            stream_batch_size=max(1, _get_int("DART_STREAM_BATCH_SIZE", 1000)),
+            primary_min_score=_get_float("DART_PRIMARY_MIN_SCORE", 60.0),
+            max_per_event_type=max(0, _get_int("DART_MAX_PER_EVENT_TYPE", 1)),
+            max_per_company=max(0, _get_int("DART_MAX_PER_COMPANY", 0)),
+            news_enabled=_get_bool("DART_NEWS_ENABLED", True),
+            news_max_workers=max(1, _get_int("DART_NEWS_MAX_WORKERS", 4)),
+            news_deadline_seconds=_get_float("DART_NEWS_DEADLINE_SECONDS", 15.0),
+            news_cache_ttl_minutes=_get_float("DART_NEWS_CACHE_TTL_MINUTES", 180.0),
+            news_cache_stale_minutes=_get_float("DART_NEWS_CACHE_STALE_MINUTES", 1440.0),
+            openai_cache_max_age_days=_get_float("OPENAI_CACHE_MAX_AGE_DAYS", 7.0),
+            openai_cache_max_entries=_get_int("OPENAI_CACHE_MAX_ENTRIES", 200),
+            openai_replay=_get_bool("OPENAI_REPLAY", False),
+            openai_first_token_timeout_seconds=_get_float(
+                "OPENAI_FIRST_TOKEN_TIMEOUT_SECONDS", 15.0
+            ),
+            openai_total_timeout_seconds=_get_float("OPENAI_TOTAL_TIMEOUT_SECONDS", 40.0),
+            prompt_token_budget=max(0, _get_int("OPENAI_PROMPT_TOKEN_BUDGET", 3000)),
+            openai_base_url=os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/"),
+            openai_batch_poll_seconds=_get_float("OPENAI_BATCH_POLL_SECONDS", 30.0),
+            openai_batch_timeout_seconds=_get_float("OPENAI_BATCH_TIMEOUT_SECONDS", 3600.0),
+            breaker_failure_rate=_get_float("DART_BREAKER_FAILURE_RATE", 0.5),
+            breaker_min_calls=max(1, _get_int("DART_BREAKER_MIN_CALLS", 4)),
+            breaker_window=max(1, _get_int("DART_BREAKER_WINDOW", 10)),
+            breaker_cooldown_minutes=_get_float("DART_BREAKER_COOLDOWN_MINUTES", 30.0),
+            run_deadline_seconds=_get_float("DART_RUN_DEADLINE_SECONDS", 900.0),
+            profiles=(
+                load_profiles(Path(os.environ["DART_PROFILES_PATH"]))
+                if os.getenv("DART_PROFILES_PATH")
+                else ()
+            ),
         )
@@ -3,16 +3,24 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from email.utils import parsedate_to_datetime
+from pathlib import Path
 from urllib.parse import parse_qs, urlparse
+from urllib.request import url2pathname
 from xml.etree import ElementTree as ET
 
 import requests
 
+from dart_digest import metrics
 from dart_digest.models import Disclosure
 
 
 def fetch_today_rss(rss_url: str, timeout_seconds: int = 20) -> str:
+    # file:// URLs replay a recorded feed without touching the network.
+    if rss_url.startswith("file://"):
+        return Path(url2pathname(urlparse(rss_url).path)).read_text(encoding="utf-8")
+
     response = requests.get(rss_url, timeout=timeout_seconds)
+    metrics.record_http(len(response.content))
     response.raise_for_status()
     return response.text
 
@@ -40,9 +48,6 @@ def parse_disclosures(rss_xml: str) -> list[Disclosure]:
                 receipt_no=receipt_no,
                 published_at=_parse_pub_date(pub_date_raw),
                 description=description,
-                raw={
-                    "pub_date_raw": pub_date_raw,
-                },
             )
         )
 
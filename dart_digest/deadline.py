@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import math
+import time
+
+
+# Budget held back for rendering the template, storing and publishing the report.
+DELIVERY_RESERVE_SECONDS = 30.0
+
+
+class Deadline:
+    def __init__(self, seconds: float | None = None) -> None:
+        # None or a non-positive budget means the run is unbounded.
+        self.expires_at = time.monotonic() + seconds if seconds and seconds > 0 else None
+
+    def remaining(self) -> float:
+        if self.expires_at is None:
+            return math.inf
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float, reserve: float = 0.0) -> float:
+        # Per-call timeout: the usual cap, shortened to what is left after the reserve.
+        return max(0.0, min(cap, self.remaining() - reserve))
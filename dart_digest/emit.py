@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any, BinaryIO, Callable
+
+from dart_digest.models import ScoredDisclosure
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson (or the fast-json extra)
+    orjson = None
+
+
+def _json_dumps() -> Callable[[dict[str, Any]], bytes]:
+    if orjson is not None:
+        return orjson.dumps
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    return lambda record: encoder.encode(record).encode("utf-8")
+
+
+class CandidateEmitter:
+    # Writes every scored candidate as one JSON line. A candidate is written as soon as
+    # no top-K pool can still pick it (rejected or evicted everywhere); the few still
+    # pooled are written once selection is known, so lines are not in input order.
+    def __init__(self, out: BinaryIO, profiles: bool = False) -> None:
+        self.out = out
+        self.profiles = profiles
+        self.emitted = 0
+        self._dumps = _json_dumps()
+        self._run_date = ""
+        self._lines: list[bytes] = []
+        # id(item) -> [item, number of pools holding it]
+        self._held: dict[int, list[Any]] = {}
+
+    def start(self, run_dt: datetime) -> None:
+        self._run_date = run_dt.isoformat(timespec="seconds")
+
+    def track(self, item: ScoredDisclosure, pools: int) -> None:
+        if pools:
+            self._held[id(item)] = [item, pools]
+        else:
+            self._write(item, ())
+
+    def release(self, item: ScoredDisclosure) -> None:
+        entry = self._held.get(id(item))
+        if entry is None:
+            return
+        entry[1] -= 1
+        if not entry[1]:
+            del self._held[id(item)]
+            self._write(item, ())
+
+    def flush(self) -> None:
+        if self._lines:
+            self.out.write(b"".join(self._lines))
+            self._lines.clear()
+        self.out.flush()
+
+    def finish(self, selections: dict[str, list[ScoredDisclosure]]) -> None:
+        picked: dict[int, list[str]] = {}
+        for name, selected in selections.items():
+            for item in selected:
+                picked.setdefault(id(item), []).append(name)
+        for item, _ in self._held.values():
+            self._write(item, picked.get(id(item), ()))
+        self._held.clear()
+        self.flush()
+
+    def _write(self, item: ScoredDisclosure, selected_by: list[str] | tuple[()]) -> None:
+        disclosure = item.disclosure
+        record: dict[str, Any] = {
+            "run_date": self._run_date,
+            "receipt_no": disclosure.receipt_no,
+            "company_name": disclosure.company_name,
+            "ticker": disclosure.ticker,
+            "market": item.market,
+            "title": disclosure.title,
+            "link": disclosure.link,
+            "published_at": disclosure.published_at.isoformat(timespec="seconds"),
+            "event_type": item.event_type,
+            "event_score": item.event_score,
+            "financial_score": item.financial_score,
+            "persistence_score": item.persistence_score,
+            "confidence_score": item.confidence_score,
+            "market_bonus": item.market_bonus,
+            "total_score": item.total_score,
+            "reasons": list(item.reasons),
+            "selected": bool(selected_by),
+        }
+        if self.profiles:
+            record["selected_profiles"] = list(selected_by)
+        self._lines.append(self._dumps(record) + b"\n")
+        self.emitted += 1
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        db_path: Path,
+        max_age_seconds: float | None = 7 * 86400,
+        max_entries: int = 200,
+    ) -> None:
+        self.db_path = db_path
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    prompt_hash TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    article TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+
+    @staticmethod
+    def key_for(model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+        payload = json.dumps(
+            [model, system_prompt, user_prompt, temperature],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, prompt_hash: str) -> str | None:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT article FROM llm_responses WHERE prompt_hash = ? AND created_at >= ?",
+                (prompt_hash, self._cutoff()),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put(self, prompt_hash: str, model: str, article: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO llm_responses (prompt_hash, model, article, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(prompt_hash) DO UPDATE SET
+                    model = excluded.model,
+                    article = excluded.article,
+                    created_at = excluded.created_at
+                """,
+                (prompt_hash, model, article, time.time()),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _cutoff(self) -> float:
+        if self.max_age_seconds is None:
+            return 0.0
+        return time.time() - self.max_age_seconds
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (self._cutoff(),))
+        conn.execute(
+            """
+            DELETE FROM llm_responses WHERE prompt_hash NOT IN (
+                SELECT prompt_hash FROM llm_responses ORDER BY created_at DESC LIMIT ?
+            )
+            """,
+            (self.max_entries,),
+        )
@@ -4,7 +4,9 @@ import csv
 import re
 from dataclasses import dataclass
 from pathlib import Path
+from typing import overload
 
+from dart_digest.columnar import DisclosureBatch
 from dart_digest.models import Disclosure
 
 
@@ -74,16 +76,42 @@ class MarketFilter:
         else:
             self.target_markets = {"KOSPI"}
 
-    def filter(self, disclosures: list[Disclosure]) -> list[Disclosure]:
+    @overload
+    def filter(self, disclosures: list[Disclosure]) -> list[Disclosure]: ...
+
+    @overload
+    def filter(self, disclosures: DisclosureBatch) -> DisclosureBatch: ...
+
+    def filter(
+        self, disclosures: list[Disclosure] | DisclosureBatch
+    ) -> list[Disclosure] | DisclosureBatch:
+        if isinstance(disclosures, DisclosureBatch):
+            return self._filter_batch(disclosures)
         filtered: list[Disclosure] = []
         for item in disclosures:
             company = self.universe.get_company(item.company_name)
             if company and company.market in self.target_markets:
-                item.raw["market"] = company.market
-                item.raw["ticker"] = company.ticker
+                item.market = company.market
+                item.ticker = company.ticker
                 filtered.append(item)
         return filtered
 
+    def _filter_batch(self, batch: DisclosureBatch) -> DisclosureBatch:
+        # Returns a new batch with market/ticker from the universe; the input is untouched.
+        kept: list[int] = []
+        markets: list[str] = []
+        tickers: list[str] = []
+        for index, name in enumerate(batch.company_name):
+            company = self.universe.get_company(name)
+            if company and company.market in self.target_markets:
+                kept.append(index)
+                markets.append(company.market)
+                tickers.append(company.ticker)
+        filtered = batch.take(kept)
+        filtered.market = markets
+        filtered.ticker = tickers
+        return filtered
+
 
 class KospiFilter(MarketFilter):
     def __init__(self, universe: CompanyUniverse) -> None:
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterator, Protocol
+
+
+@dataclass
+class StageMetrics:
+    name: str
+    wall_seconds: float = 0.0
+    items_in: int = 0
+    items_out: int = 0
+    http_calls: int = 0
+    http_bytes: int = 0
+
+
+@dataclass
+class RunMetrics:
+    stages: list[StageMetrics] = field(default_factory=list)
+    counters: dict[str, float] = field(default_factory=dict)
+    status: str = ""
+    total_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+        self._open: list[StageMetrics] = []
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+        items_in: int = 0,
+        accumulate: bool = False,
+    ) -> Iterator[StageMetrics]:
+        # accumulate=True folds repeated entries (one per streamed batch) into one stage.
+        with self._lock:
+            entry = self._latest(name) if accumulate else None
+            if entry is None:
+                entry = StageMetrics(name=name)
+                self.stages.append(entry)
+            entry.items_in += items_in
+            self._open.append(entry)
+        started = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                entry.wall_seconds = round(entry.wall_seconds + elapsed, 6)
+                self._open.remove(entry)
+
+    def record_http(self, nbytes: int = 0) -> None:
+        with self._lock:
+            target = self._open[-1] if self._open else self._unstaged()
+            target.http_calls += 1
+            target.http_bytes += max(0, nbytes)
+
+    def set_counter(self, name: str, value: float) -> None:
+        with self._lock:
+            self.counters[name] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "total_seconds": self.total_seconds,
+            "stages": [asdict(stage) for stage in self.stages],
+            "counters": dict(self.counters),
+        }
+
+    def write_json(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(self.to_dict(), ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+
+    def write_prometheus(self, path: Path, prefix: str = "dart_digest") -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.to_prometheus(prefix), encoding="utf-8")
+
+    def to_prometheus(self, prefix: str = "dart_digest") -> str:
+        totals: dict[str, StageMetrics] = {}
+        for stage in self.stages:
+            agg = totals.setdefault(stage.name, StageMetrics(name=stage.name))
+            agg.wall_seconds += stage.wall_seconds
+            agg.items_in += stage.items_in
+            agg.items_out += stage.items_out
+            agg.http_calls += stage.http_calls
+            agg.http_bytes += stage.http_bytes
+
+        series = (
+            ("stage_seconds", "Wall time per pipeline stage.", "wall_seconds"),
+            ("stage_items_in", "Items entering each stage.", "items_in"),
+            ("stage_items_out", "Items leaving each stage.", "items_out"),
+            ("stage_http_calls", "HTTP calls made during each stage.", "http_calls"),
+            ("stage_http_bytes", "HTTP response bytes read during each stage.", "http_bytes"),
+        )
+        lines: list[str] = []
+        for metric, help_text, attr in series:
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} gauge")
+            for name, agg in totals.items():
+                lines.append(f'{prefix}_{metric}{{stage="{name}"}} {getattr(agg, attr):g}')
+
+        lines.append(f"# HELP {prefix}_run_seconds Total wall time of the run.")
+        lines.append(f"# TYPE {prefix}_run_seconds gauge")
+        lines.append(f'{prefix}_run_seconds{{status="{self.status}"}} {self.total_seconds:g}')
+
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+    def _latest(self, name: str) -> StageMetrics | None:
+        for stage in reversed(self.stages):
+            if stage.name == name:
+                return stage
+        return None
+
+    def _unstaged(self) -> StageMetrics:
+        for stage in self.stages:
+            if stage.name == "unstaged":
+                return stage
+        stage = StageMetrics(name="unstaged")
+        self.stages.append(stage)
+        return stage
+
+
+class StageListener(Protocol):
+    def enter(self, name: str) -> None: ...
+
+    def exit(self, name: str) -> None: ...
+
+
+_active: RunMetrics | None = None
+_listeners: list[StageListener] = []
+
+
+@contextmanager
+def collecting(run_metrics: RunMetrics) -> Iterator[RunMetrics]:
+    global _active
+    previous = _active
+    _active = run_metrics
+    started = time.perf_counter()
+    try:
+        yield run_metrics
+    finally:
+        run_metrics.total_seconds = round(time.perf_counter() - started, 6)
+        _active = previous
+
+
+@contextmanager
+def listening(listener: StageListener) -> Iterator[StageListener]:
+    # Listeners (e.g. profilers) are told when each stage starts and ends.
+    _listeners.append(listener)
+    try:
+        yield listener
+    finally:
+        _listeners.remove(listener)
+
+
+@contextmanager
+def stage(name: str, items_in: int = 0, accumulate: bool = False) -> Iterator[StageMetrics]:
+    for listener in _listeners:
+        listener.enter(name)
+    try:
+        if _active is None:
+            yield StageMetrics(name=name, items_in=items_in)
+        else:
+            with _active.stage(name, items_in=items_in, accumulate=accumulate) as entry:
+                yield entry
+    finally:
+        for listener in reversed(_listeners):
+            listener.exit(name)
+
+
+def record_http(nbytes: int = 0) -> None:
+    if _active is not None:
+        _active.record_http(nbytes)
+
+
+def set_counter(name: str, value: float) -> None:
+    if _active is not None:
+        _active.set_counter(name, value)
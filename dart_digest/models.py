@@ -1,10 +1,44 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Iterable, TypeVar
 
+if TYPE_CHECKING:
+    from dart_digest.article_writer import IssueContext
 
+
+T = TypeVar("T")
+
+
+def _slotted(cls: type[T]) -> type[T]:
+    # dataclass(slots=True) needs Python 3.10; rebuild the class with __slots__ the same
+    # way. Field defaults already live in the generated __init__, so the class-level
+    # copies (which would clash with the slots) are dropped.
+    names = tuple(item.name for item in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+# Reason strings come from a fixed set of templates, so every distinct combination is
+# stored once and shared by all items that carry it.
+_REASONS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def intern_reasons(reasons: Iterable[str]) -> tuple[str, ...]:
+    key = tuple(sys.intern(reason) for reason in reasons)
+    return _REASONS.setdefault(key, key)
+
+
+@_slotted
 @dataclass
 class Disclosure:
     company_name: str
@@ -13,9 +47,12 @@ class Disclosure:
     receipt_no: str
     published_at: datetime
     description: str
-    raw: dict[str, Any] = field(default_factory=dict)
+    # Set by MarketFilter from the company universe; empty until then.
+    market: str = ""
+    ticker: str = ""
 
 
+@_slotted
 @dataclass
 class ScoredDisclosure:
     disclosure: Disclosure
@@ -27,7 +64,14 @@ class ScoredDisclosure:
     confidence_score: float
     market_bonus: float
     total_score: float
-    reasons: list[str]
+    reasons: tuple[str, ...]
+    # Memoized by the article writer; not part of the score.
+    issue_context: IssueContext | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.market = sys.intern(self.market)
+        self.event_type = sys.intern(self.event_type)
+        self.reasons = intern_reasons(self.reasons)
 
 
 @dataclass
@@ -35,3 +79,4 @@ class DailySelection:
     run_date: datetime
     selected: list[ScoredDisclosure]
     generated_article: str
+    profile: str = ""
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from email.utils import parsedate_to_datetime
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Iterable
 from urllib.parse import urlencode
 from xml.etree import ElementTree as ET
 
 import requests
 
+from dart_digest import metrics
+from dart_digest.circuit_breaker import CircuitBreaker
 
 GOOGLE_NEWS_RSS = "https://news.google.com/rss/search"
+FETCH_TIMEOUT_SECONDS = 12.0
 
 
 @dataclass
@@ -22,13 +31,192 @@ class NewsItem:
     published_ts: float
 
 
+class NewsCache:
+    def __init__(
+        self,
+        db_path: Path,
+        ttl_seconds: float = 3 * 3600,
+        stale_seconds: float = 24 * 3600,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.db_path = db_path
+        self.breaker = breaker
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        self._inflight: set[str] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS news_cache (
+                    query TEXT PRIMARY KEY,
+                    items TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+
+    def lookup(self, query: str, timeout: float = FETCH_TIMEOUT_SECONDS) -> list[NewsItem]:
+        key = normalize_query(query)
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT items, fetched_at FROM news_cache WHERE query = ?",
+                (key,),
+            ).fetchone()
+
+        if row is not None:
+            age = now - row[1]
+            items = [NewsItem(**item) for item in json.loads(row[0])]
+            if age < self.ttl_seconds:
+                self._count("hits")
+                return items
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._count("stale_hits")
+                # Bounded like the caller's own fetch, so it cannot outlive the run budget.
+                self._revalidate(key, query, timeout)
+                return items
+
+        self._count("misses")
+        fetched = _guarded_fetch(query, self.breaker, timeout)
+        if fetched is None:
+            return []
+        self.store(key, fetched)
+        return fetched
+
+    def store(self, query: str, items: list[NewsItem]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO news_cache (query, items, fetched_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(query) DO UPDATE SET
+                    items = excluded.items,
+                    fetched_at = excluded.fetched_at
+                """,
+                (
+                    normalize_query(query),
+                    json.dumps([asdict(item) for item in items], ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+            conn.commit()
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            served = self.hits + self.stale_hits
+            lookups = served + self.misses
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+            }
+
+    def close(self, wait: bool = True) -> None:
+        # wait=False drops queued refreshes; one already running ends within its timeout.
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _revalidate(self, key: str, query: str, timeout: float) -> None:
+        with self._lock:
+            if key in self._inflight:
+                return
+            self._inflight.add(key)
+            self.revalidations += 1
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2,
+                    thread_name_prefix="dart-news-revalidate",
+                )
+            executor = self._executor
+
+        def forget_if_cancelled(future: Future) -> None:
+            # Cancelled by close() before it ran, so _refresh never clears the mark.
+            if future.cancelled():
+                self._discard_inflight(key)
+
+        executor.submit(self._refresh, key, query, timeout).add_done_callback(
+            forget_if_cancelled
+        )
+
+    def _refresh(self, key: str, query: str, timeout: float) -> None:
+        try:
+            fetched = _guarded_fetch(query, self.breaker, timeout)
+            # Keep serving the stale entry when the refresh fails.
+            if fetched is not None:
+                self.store(key, fetched)
+        finally:
+            self._discard_inflight(key)
+
+    def _discard_inflight(self, key: str) -> None:
+        with self._lock:
+            self._inflight.discard(key)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+
 def search_related_news(
     company_name: str,
     disclosure_title: str,
     event_type: str,
     max_items: int = 2,
+    cache: NewsCache | None = None,
+    breaker: CircuitBreaker | None = None,
+    timeout: float = FETCH_TIMEOUT_SECONDS,
 ) -> list[NewsItem]:
     query = _build_query(company_name, disclosure_title, event_type)
+    if cache is not None:
+        items = cache.lookup(query, timeout)
+    else:
+        items = _guarded_fetch(query, breaker, timeout) or []
+
+    filtered = _filter_relevant_news(items, company_name)
+    ranked = _rank_news(filtered, company_name, disclosure_title, event_type)
+    return ranked[:max_items]
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.split()).lower()
+
+
+def _guarded_fetch(
+    query: str,
+    breaker: CircuitBreaker | None,
+    timeout: float = FETCH_TIMEOUT_SECONDS,
+) -> list[NewsItem] | None:
+    if breaker is None:
+        return _fetch_news(query, timeout)
+    # An open breaker answers like a failed fetch, without waiting on the network.
+    if not breaker.allow():
+        return None
+    fetched = _fetch_news(query, timeout)
+    if fetched is None:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return fetched
+
+
+def _fetch_news(query: str, timeout: float = FETCH_TIMEOUT_SECONDS) -> list[NewsItem] | None:
     params = {
         "q": query,
         "hl": "ko",
@@ -40,17 +228,15 @@ def search_related_news(
     try:
         response = requests.get(
             url,
-            timeout=12,
+            timeout=timeout,
             headers={"User-Agent": "Mozilla/5.0 (compatible; dart-news-bot/1.0)"},
         )
+        metrics.record_http(len(response.content))
         response.raise_for_status()
     except requests.RequestException:
-        return []
+        return None
 
-    items = parse_google_news_rss(response.text)
-    filtered = _filter_relevant_news(items, company_name)
-    ranked = _rank_news(filtered, company_name, disclosure_title, event_type)
-    return ranked[:max_items]
+    return parse_google_news_rss(response.text)
 
 
 def parse_google_news_rss(rss_xml: str) -> list[NewsItem]:
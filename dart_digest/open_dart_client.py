@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Callable
 
 import requests
 
+from dart_digest import metrics
+from dart_digest.columnar import DisclosureBatch
+from dart_digest.deadline import Deadline
 from dart_digest.models import Disclosure
 
 
@@ -12,6 +16,7 @@ MARKET_TO_CORP_CLS = {
     "KOSPI": "Y",
     "KOSDAQ": "K",
 }
+CORP_CLS_TO_MARKET = {corp_cls: market for market, corp_cls in MARKET_TO_CORP_CLS.items()}
 
 
 def fetch_disclosures_by_date(
@@ -19,6 +24,8 @@ def fetch_disclosures_by_date(
     api_key: str,
     target_markets: tuple[str, ...],
     timeout_seconds: int = 20,
+    deadline: Deadline | None = None,
+    on_page: Callable[[str, dict], None] | None = None,
 ) -> list[Disclosure]:
     if not (len(target_date) == 8 and target_date.isdigit()):
         raise ValueError("target_date must be YYYYMMDD")
@@ -35,6 +42,12 @@ def fetch_disclosures_by_date(
     for corp_cls in corp_classes:
         page_no = 1
         while True:
+            timeout = timeout_seconds
+            if deadline is not None:
+                # Out of run budget: keep the pages fetched so far (newest first).
+                if deadline.expired() and collected:
+                    break
+                timeout = max(1.0, deadline.timeout(timeout_seconds))
             payload = {
                 "crtfc_key": api_key,
                 "bgn_de": target_date,
@@ -45,7 +58,8 @@ def fetch_disclosures_by_date(
                 "page_no": page_no,
                 "page_count": 100,
             }
-            response = requests.get(API_URL, params=payload, timeout=timeout_seconds)
+            response = requests.get(API_URL, params=payload, timeout=timeout)
+            metrics.record_http(len(response.content))
             response.raise_for_status()
             data = response.json()
 
@@ -55,31 +69,12 @@ def fetch_disclosures_by_date(
             if status != "000":
                 message = data.get("message", "Unknown OpenDART error")
                 raise RuntimeError(f"OpenDART API error {status}: {message}")
+            if on_page is not None:
+                # Lets the backtest recorder keep the raw page as a replay fixture.
+                on_page(corp_cls, data)
 
-            items = data.get("list") or []
-            for item in items:
-                receipt_no = str(item.get("rcept_no") or "").strip()
-                if not receipt_no:
-                    continue
-
-                company_name = str(item.get("corp_name") or "").strip()
-                title = str(item.get("report_nm") or "").strip()
-                rcept_dt = str(item.get("rcept_dt") or target_date).strip()
-                published_at = _parse_rcept_dt(rcept_dt)
-
-                filler = str(item.get("flr_nm") or "").strip()
-                remark = str(item.get("rm") or "").strip()
-                description = " / ".join(x for x in [filler, remark] if x)
-
-                collected[receipt_no] = Disclosure(
-                    company_name=company_name,
-                    title=f"{company_name} ({title})" if company_name and title else title,
-                    link=f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={receipt_no}",
-                    receipt_no=receipt_no,
-                    published_at=published_at,
-                    description=description,
-                    raw={"source": "opendart", "corp_cls": corp_cls},
-                )
+            for item in parse_list_page(data, target_date, corp_cls):
+                collected[item.receipt_no] = item
 
             total_page = int(data.get("total_page", 1) or 1)
             if page_no >= total_page:
@@ -93,6 +88,46 @@ def fetch_disclosures_by_date(
     )
 
 
+def parse_list_page(data: dict, target_date: str, corp_cls: str) -> list[Disclosure]:
+    return parse_list_page_batch(data, target_date, corp_cls).to_disclosures()
+
+
+def parse_list_page_batch(
+    data: dict,
+    target_date: str,
+    corp_cls: str,
+    into: DisclosureBatch | None = None,
+) -> DisclosureBatch:
+    # Appends the page's rows straight into columns; pass `into` to collect many pages.
+    batch = into if into is not None else DisclosureBatch()
+    # Provisional: MarketFilter replaces it with the company universe's market.
+    market = CORP_CLS_TO_MARKET.get(corp_cls, "")
+    for item in data.get("list") or []:
+        receipt_no = str(item.get("rcept_no") or "").strip()
+        if not receipt_no:
+            continue
+
+        company_name = str(item.get("corp_name") or "").strip()
+        title = str(item.get("report_nm") or "").strip()
+        rcept_dt = str(item.get("rcept_dt") or target_date).strip()
+        published_at = _parse_rcept_dt(rcept_dt)
+
+        filler = str(item.get("flr_nm") or "").strip()
+        remark = str(item.get("rm") or "").strip()
+        description = " / ".join(x for x in [filler, remark] if x)
+
+        batch.append(
+            company_name,
+            f"{company_name} ({title})" if company_name and title else title,
+            f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={receipt_no}",
+            receipt_no,
+            published_at,
+            description,
+            market,
+        )
+    return batch
+
+
 def _parse_rcept_dt(raw: str) -> datetime:
     if len(raw) == 8 and raw.isdigit():
         return datetime.strptime(raw, "%Y%m%d")
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import requests
+
+from dart_digest import metrics
+
+
+TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@dataclass
+class BatchJob:
+    custom_id: str
+    body: dict
+
+
+def write_jobs(jobs: list[BatchJob], path: Path, endpoint: str = "/v1/responses") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fp:
+        for job in jobs:
+            fp.write(
+                json.dumps(
+                    {
+                        "custom_id": job.custom_id,
+                        "method": "POST",
+                        "url": endpoint,
+                        "body": job.body,
+                    },
+                    ensure_ascii=False,
+                )
+                + "\n"
+            )
+    return path
+
+
+def run_batch(
+    job_path: Path,
+    api_key: str,
+    base_url: str,
+    poll_seconds: float = 30.0,
+    timeout_seconds: float = 3600.0,
+) -> dict[str, dict]:
+    batch_id = submit_batch(job_path, api_key, base_url)
+    batch = poll_batch(batch_id, api_key, base_url, poll_seconds, timeout_seconds)
+    if batch.get("status") != "completed" or not batch.get("output_file_id"):
+        raise RuntimeError(f"OpenAI batch {batch_id} ended with status {batch.get('status')}")
+    return download_results(batch["output_file_id"], api_key, base_url)
+
+
+def submit_batch(job_path: Path, api_key: str, base_url: str, timeout: float = 60.0) -> str:
+    with job_path.open("rb") as fp:
+        upload = requests.post(
+            f"{base_url}/files",
+            headers=_auth(api_key),
+            data={"purpose": "batch"},
+            files={"file": (job_path.name, fp, "application/jsonl")},
+            timeout=timeout,
+        )
+    metrics.record_http(len(upload.content))
+    upload.raise_for_status()
+
+    response = requests.post(
+        f"{base_url}/batches",
+        headers=_auth(api_key),
+        json={
+            "input_file_id": upload.json()["id"],
+            "endpoint": "/v1/responses",
+            "completion_window": "24h",
+        },
+        timeout=timeout,
+    )
+    metrics.record_http(len(response.content))
+    response.raise_for_status()
+    return response.json()["id"]
+
+
+def poll_batch(
+    batch_id: str,
+    api_key: str,
+    base_url: str,
+    poll_seconds: float = 30.0,
+    timeout_seconds: float = 3600.0,
+) -> dict:
+    deadline = time.monotonic() + timeout_seconds
+    while True:
+        response = requests.get(
+            f"{base_url}/batches/{batch_id}",
+            headers=_auth(api_key),
+            timeout=30,
+        )
+        metrics.record_http(len(response.content))
+        response.raise_for_status()
+        batch = response.json()
+        if batch.get("status") in TERMINAL_STATUSES:
+            return batch
+        if time.monotonic() + poll_seconds > deadline:
+            raise TimeoutError(f"OpenAI batch {batch_id} did not finish in {timeout_seconds}s")
+        time.sleep(poll_seconds)
+
+
+def download_results(file_id: str, api_key: str, base_url: str) -> dict[str, dict]:
+    response = requests.get(
+        f"{base_url}/files/{file_id}/content",
+        headers=_auth(api_key),
+        timeout=120,
+    )
+    metrics.record_http(len(response.content))
+    response.raise_for_status()
+    return parse_results(response.text)
+
+
+def parse_results(jsonl: str) -> dict[str, dict]:
+    # Maps custom_id to the response body of each successful request.
+    results: dict[str, dict] = {}
+    for line in jsonl.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or int(response.get("status_code") or 0) >= 400:
+            continue
+        results[str(record.get("custom_id"))] = response.get("body") or {}
+    return results
+
+
+def _auth(api_key: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {api_key}"}
@@ -1,18 +1,53 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import cached_property
+from pathlib import Path
+from typing import Callable, TypeVar
 from zoneinfo import ZoneInfo
 
-from dart_digest.article_writer import ArticleWriter
+from dart_digest import metrics
+from dart_digest.article_writer import ArticleWriter, shorten_article
+from dart_digest.checkpoint import (
+    DONE,
+    FETCHED,
+    SELECTED,
+    STAGES,
+    WRITTEN,
+    CheckpointStore,
+    RunCheckpoint,
+)
+from dart_digest.circuit_breaker import CircuitBreaker, CircuitOpenError, load_breakers
 from dart_digest.config import Settings
 from dart_digest.dart_client import fetch_today_rss, parse_disclosures
+from dart_digest.deadline import DELIVERY_RESERVE_SECONDS, Deadline
+from dart_digest.emit import CandidateEmitter
+from dart_digest.llm_cache import ResponseCache
 from dart_digest.market_filter import CompanyUniverse, MarketFilter
-from dart_digest.models import DailySelection, ScoredDisclosure
+from dart_digest.metrics import RunMetrics
+from dart_digest.models import DailySelection, Disclosure, ScoredDisclosure
+from dart_digest.news_client import NewsCache, NewsItem
 from dart_digest.open_dart_client import fetch_disclosures_by_date
-from dart_digest.scoring import score_disclosures
-from dart_digest.slack_client import SlackPublisher
+from dart_digest.score_cache import ScoreCache
+from dart_digest.selection import SelectionRules, TopKSelector
+from dart_digest.slack_client import POST_TIMEOUT_SECONDS, SlackPublisher
+from dart_digest.slack_outbox import SlackOutbox
 from dart_digest.storage import Storage
+from dart_digest.streaming import (
+    StreamCounts,
+    batched,
+    drop_processed,
+    filter_markets,
+    mark_processed,
+    score_batches,
+)
+
+
+T = TypeVar("T")
 
 
 @dataclass
@@ -20,44 +55,395 @@ class PipelineResult:
     status: str
     message: str
     selection: DailySelection | None = None
+    metrics: RunMetrics = field(default_factory=RunMetrics)
+    profile: str = ""
+    # Per-profile results of a fan-out run; empty when no output profiles are configured.
+    outputs: list[PipelineResult] = field(default_factory=list)
 
 
 class DigestPipeline:
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, emitter: CandidateEmitter | None = None) -> None:
         self.settings = settings
-        self.storage = Storage(settings.db_path)
-        self.universe = CompanyUniverse.from_csv(settings.company_map_path)
-        self.market_filter = MarketFilter(self.universe, settings.target_markets)
-        self.writer = ArticleWriter(settings)
-        self.publisher = SlackPublisher(
-            webhook_url=settings.slack_webhook_url,
-            channel=settings.slack_channel,
+        # Optional sink that streams every scored candidate (see dart_digest.emit).
+        self.emitter = emitter
+        # Destinations keyed by profile name; "" is the single default output.
+        self.targets: dict[str, Settings] = (
+            {profile.name: settings.for_profile(profile) for profile in settings.profiles}
+            if settings.profiles
+            else {"": settings}
+        )
+        self.last_metrics: RunMetrics | None = None
+
+    # Everything below is built on first use, so `flush` and early exits open only the
+    # tables (and threads) they need; cheap commands never touch the DB at all.
+    @cached_property
+    def breakers(self) -> dict[str, CircuitBreaker]:
+        return load_breakers(self.settings)
+
+    @cached_property
+    def score_cache(self) -> ScoreCache:
+        return ScoreCache(
+            max_entries=self.settings.score_cache_size,
+            db_path=self.settings.db_path if self.settings.score_cache_persist else None,
+        )
+
+    @cached_property
+    def news_cache(self) -> NewsCache | None:
+        if self.settings.news_cache_ttl_minutes <= 0:
+            return None
+        return NewsCache(
+            self.settings.db_path,
+            ttl_seconds=self.settings.news_cache_ttl_minutes * 60,
+            stale_seconds=self.settings.news_cache_stale_minutes * 60,
+            breaker=self.breakers["news"],
+        )
+
+    @cached_property
+    def response_cache(self) -> ResponseCache | None:
+        settings = self.settings
+        if settings.openai_cache_max_age_days <= 0 and not settings.openai_replay:
+            return None
+        return ResponseCache(
+            settings.db_path,
+            # Replay serves whatever was recorded, however old.
+            max_age_seconds=(
+                None if settings.openai_replay else settings.openai_cache_max_age_days * 86400
+            ),
+            max_entries=settings.openai_cache_max_entries,
+        )
+
+    @cached_property
+    def writer(self) -> ArticleWriter:
+        return ArticleWriter(
+            self.settings,
+            news_cache=self.news_cache,
+            response_cache=self.response_cache,
+            news_breaker=self.breakers["news"],
+            openai_breaker=self.breakers["openai"],
+        )
+
+    @cached_property
+    def outbox(self) -> SlackOutbox:
+        return SlackOutbox(self.settings.db_path)
+
+    @cached_property
+    def publisher(self) -> SlackPublisher:
+        return self.publishers[""]
+
+    @cached_property
+    def publishers(self) -> dict[str, SlackPublisher]:
+        publishers = {
+            "": SlackPublisher(
+                webhook_url=self.settings.slack_webhook_url,
+                channel=self.settings.slack_channel,
+                outbox=self.outbox,
+            )
+        }
+        for name, target in self.targets.items():
+            if name:
+                publishers[name] = SlackPublisher(
+                    webhook_url=target.slack_webhook_url,
+                    channel=target.slack_channel,
+                    outbox=self.outbox,
+                    destination=name,
+                )
+        return publishers
+
+    @cached_property
+    def checkpoints(self) -> CheckpointStore:
+        return CheckpointStore(self.settings.db_path)
+
+    @cached_property
+    def storage(self) -> Storage:
+        return Storage(self.settings.db_path)
+
+    @cached_property
+    def universe(self) -> CompanyUniverse:
+        return CompanyUniverse.from_csv(self.settings.company_map_path)
+
+    @cached_property
+    def market_filter(self) -> MarketFilter:
+        return MarketFilter(self.universe, self.settings.fetch_markets)
+
+    def run(
+        self,
+        force: bool = False,
+        test_date: str | None = None,
+        deadline_seconds: float | None = None,
+        resume: bool = False,
+    ) -> PipelineResult:
+        run_metrics = RunMetrics()
+        self.last_metrics = run_metrics
+        deadline = Deadline(
+            self.settings.run_deadline_seconds if deadline_seconds is None else deadline_seconds
+        )
+        result = self._instrumented(
+            run_metrics,
+            lambda: self._run(force, test_date, deadline, resume),
+        )
+        result.metrics = run_metrics
+        return result
+
+    def backfill(
+        self,
+        start_date: str,
+        end_date: str,
+        force: bool = False,
+        batch_dir: Path | None = None,
+    ) -> list[PipelineResult]:
+        run_metrics = RunMetrics()
+        self.last_metrics = run_metrics
+        return self._instrumented(
+            run_metrics,
+            lambda: self._backfill(start_date, end_date, force, batch_dir),
+        )
+
+    def flush(self) -> PipelineResult:
+        run_metrics = RunMetrics()
+        self.last_metrics = run_metrics
+        result = self._instrumented(run_metrics, self._flush)
+        result.metrics = run_metrics
+        return result
+
+    def _instrumented(self, run_metrics: RunMetrics, work: Callable[[], T]) -> T:
+        try:
+            with metrics.collecting(run_metrics):
+                result = work()
+        except Exception:
+            run_metrics.status = "error"
+            raise
+        finally:
+            # Only what this run actually built; reporting must not open anything new.
+            built = self.__dict__
+            for attr, prefix in (
+                ("score_cache", "score_cache"),
+                ("news_cache", "news_cache"),
+                ("response_cache", "openai_cache"),
+                ("outbox", "slack_outbox"),
+            ):
+                if built.get(attr) is not None:
+                    for name, value in built[attr].stats().items():
+                        run_metrics.set_counter(f"{prefix}_{name}", value)
+            for breaker in built.get("breakers", {}).values():
+                for name, value in breaker.stats().items():
+                    run_metrics.set_counter(f"breaker_{breaker.name}_{name}", value)
+            if built.get("news_cache") is not None:
+                # Do not hold the process open for a background refresh past the run.
+                built["news_cache"].close(wait=False)
+
+        run_metrics.status = (
+            result.status if isinstance(result, PipelineResult) else "completed"
         )
+        return result
 
-    def run(self, force: bool = False, test_date: str | None = None) -> PipelineResult:
+    def _run(
+        self,
+        force: bool,
+        test_date: str | None,
+        deadline: Deadline,
+        resume: bool = False,
+    ) -> PipelineResult:
         run_dt = datetime.now(ZoneInfo(self.settings.timezone)).replace(tzinfo=None)
-        if (
-            not self.settings.dry_run
-            and self.settings.require_slack_webhook
-            and not self.settings.slack_webhook_url
-        ):
+        self._check_publish_config()
+        self._resume_outbox(deadline)
+
+        # Every stage's output is checkpointed; --resume picks up after the last one.
+        run_key = CheckpointStore.run_key_for(run_dt, test_date)
+        checkpoint = self.checkpoints.load(run_key) if resume else None
+        if checkpoint is None:
+            checkpoint = self.checkpoints.start(run_key, run_dt)
+        elif checkpoint.reached(DONE):
+            return PipelineResult(
+                status="skipped",
+                message=(
+                    f"Run {run_key} already finished ({checkpoint.status}); nothing to resume."
+                ),
+            )
+        else:
+            run_dt = checkpoint.run_dt
+            metrics.set_counter("checkpoint_resumed_stage", STAGES.index(checkpoint.stage))
+
+        outcome = self._select(force, test_date, run_dt, deadline, checkpoint)
+        if isinstance(outcome, PipelineResult):
+            self._finish(checkpoint, outcome.status)
+            return outcome
+
+        if self.settings.profiles:
+            result = self._fan_out(outcome, run_dt, deadline, checkpoint)
+        else:
+            article = self._write("", outcome[""], run_dt, deadline, checkpoint)
+            self.checkpoints.save(checkpoint, WRITTEN)
+            result = self._deliver(outcome[""], run_dt, article, deadline, "", checkpoint)
+        self._finish(checkpoint, result.status)
+        if deadline.expires_at is not None:
+            metrics.set_counter("deadline_remaining_seconds", round(deadline.remaining(), 3))
+        return result
+
+    def _backfill(
+        self,
+        start_date: str,
+        end_date: str,
+        force: bool,
+        batch_dir: Path | None,
+    ) -> list[PipelineResult]:
+        self._check_publish_config()
+        dates = date_range(start_date, end_date)
+
+        results: dict[str, PipelineResult] = {}
+        pending: dict[str, tuple[list[ScoredDisclosure], datetime]] = {}
+        owners: dict[str, tuple[str, str]] = {}
+        for target_date in dates:
+            # Backfilled reports are stamped with the evening schedule slot of their day.
+            run_dt = datetime.strptime(target_date, "%Y%m%d").replace(hour=18, minute=10)
+            outcome = self._select(force, target_date, run_dt)
+            if isinstance(outcome, PipelineResult):
+                results[target_date] = outcome
+                continue
+            for profile, selected in outcome.items():
+                key = f"{target_date}:{profile}" if profile else target_date
+                if selected:
+                    pending[key] = (selected, run_dt)
+                    owners[key] = (target_date, profile)
+                else:
+                    results[key] = _nothing_selected(profile)
+
+        if pending:
+            batch_dir = batch_dir or self.settings.db_path.parent / "batches"
+            job_path = batch_dir / f"articles_{start_date}_{end_date}.jsonl"
+            articles = self.writer.write_batch(pending, job_path)
+            for key, (selected, run_dt) in pending.items():
+                results[key] = self._deliver(
+                    selected, run_dt, articles[key], profile=owners[key][1]
+                )
+
+        return [
+            results[key]
+            for target_date in dates
+            for key in (
+                [target_date]
+                if target_date in results or not self.settings.profiles
+                else [f"{target_date}:{name}" for name in self.targets]
+            )
+        ]
+
+    def _flush(self) -> PipelineResult:
+        pending, orphaned = self._outbox_backlog()
+        if not pending:
+            message = "Slack outbox is empty."
+            if orphaned:
+                message = _orphaned_note(orphaned)
+            return PipelineResult(status="skipped", message=message)
+        publishers = [publisher for publisher in self.publishers.values() if publisher.webhook_url]
+        if not publishers:
+            raise RuntimeError("SLACK_WEBHOOK_URL is missing; cannot flush the Slack outbox.")
+
+        with metrics.stage("publish", items_in=pending) as stage:
+            sent = 0
+            for publisher in publishers:
+                sent += self.breakers["slack"].call(publisher.flush)
+            stage.items_out = sent
+        message = f"Delivered {sent} pending Slack message(s)."
+        failed = self.outbox.stats()["failed"]
+        if failed:
+            message += f" {failed} message(s) failed for good and stay in slack_outbox."
+        if orphaned:
+            message += " " + _orphaned_note(orphaned)
+        return PipelineResult(status="completed", message=message)
+
+    def _outbox_backlog(self) -> tuple[int, dict[str, int]]:
+        # Pending chunks this configuration can deliver, and the rest by destination: a
+        # profile renamed or removed from DART_PROFILES_PATH leaves its chunks behind.
+        by_destination = self.outbox.pending_by_destination()
+        orphaned = {
+            name: count for name, count in by_destination.items() if name not in self.publishers
+        }
+        if orphaned:
+            metrics.set_counter("slack_outbox_orphaned", sum(orphaned.values()))
+        return sum(by_destination.values()) - sum(orphaned.values()), orphaned
+
+    def _resume_outbox(self, deadline: Deadline) -> None:
+        # Finish a report an earlier run left half-posted before anything new is queued.
+        publishers = [publisher for publisher in self.publishers.values() if publisher.webhook_url]
+        if self.settings.dry_run or not publishers:
+            return
+        pending, _ = self._outbox_backlog()
+        if not pending:
+            return
+        with metrics.stage("outbox", items_in=pending) as stage:
+            for publisher in publishers:
+                try:
+                    stage.items_out += self.breakers["slack"].call(
+                        publisher.flush,
+                        timeout=max(1.0, deadline.timeout(POST_TIMEOUT_SECONDS)),
+                        deadline=deadline,
+                    )
+                except RuntimeError:
+                    # Still undeliverable; the chunks stay queued ahead of today's report.
+                    metrics.set_counter("slack_outbox_resume_failed", 1)
+
+    def _check_publish_config(self) -> None:
+        if self.settings.dry_run or not self.settings.require_slack_webhook:
+            return
+        missing = [name for name, target in self.targets.items() if not target.slack_webhook_url]
+        if missing == [""]:
             raise RuntimeError(
                 "SLACK_WEBHOOK_URL is missing while DART_REQUIRE_SLACK_WEBHOOK=true."
             )
+        if missing:
+            raise RuntimeError(
+                "Slack webhook is missing for profile(s) "
+                + ", ".join(missing)
+                + " while DART_REQUIRE_SLACK_WEBHOOK=true."
+            )
 
-        if test_date:
-            if not self.settings.dart_api_key:
-                raise RuntimeError(
-                    "DART_API_KEY is required when running with --date YYYYMMDD."
-                )
-            disclosures = fetch_disclosures_by_date(
-                target_date=test_date,
-                api_key=self.settings.dart_api_key,
-                target_markets=self.settings.target_markets,
+    def _select(
+        self,
+        force: bool,
+        test_date: str | None,
+        run_dt: datetime,
+        deadline: Deadline | None = None,
+        checkpoint: RunCheckpoint | None = None,
+    ) -> dict[str, list[ScoredDisclosure]] | PipelineResult:
+        # Fetch, filter, dedup and score once; every output profile then selects from
+        # the same scored items. Returns the selection per profile name.
+        deadline = deadline or Deadline()
+        if checkpoint is not None and checkpoint.selections is not None:
+            # Resumed: these were marked processed by the run that scored them.
+            selections = checkpoint.selections
+        else:
+            outcome = self._score(force, test_date, run_dt, deadline, checkpoint)
+            if isinstance(outcome, PipelineResult):
+                return outcome
+            selections = outcome
+            if checkpoint is not None:
+                checkpoint.selections = selections
+                self.checkpoints.save(checkpoint, SELECTED)
+
+        if not any(selections.values()):
+            result = PipelineResult(
+                status="skipped",
+                message="No disclosure passed the importance threshold.",
             )
+            self._notify_skip(result, run_dt, deadline)
+            return result
+
+        return selections
+
+    def _score(
+        self,
+        force: bool,
+        test_date: str | None,
+        run_dt: datetime,
+        deadline: Deadline,
+        checkpoint: RunCheckpoint | None,
+    ) -> dict[str, list[ScoredDisclosure]] | PipelineResult:
+        if checkpoint is not None and checkpoint.disclosures is not None:
+            disclosures = checkpoint.disclosures
         else:
-            rss_xml = fetch_today_rss(self.settings.rss_url)
-            disclosures = parse_disclosures(rss_xml)
+            disclosures = self._fetch(test_date, deadline)
+            if checkpoint is not None:
+                checkpoint.disclosures = disclosures
+                self.checkpoints.save(checkpoint, FETCHED)
 
         if not disclosures:
             result = PipelineResult(
@@ -68,64 +454,257 @@ class DigestPipeline:
                     else "No disclosures in DART RSS feed."
                 ),
             )
-            self._notify_skip(result, run_dt)
+            self._notify_skip(result, run_dt, deadline)
             return result
 
-        market_disclosures = self.market_filter.filter(disclosures)
+        seen_before = checkpoint.scoring_since if checkpoint is not None else None
+        if checkpoint is not None and seen_before is None:
+            checkpoint.scoring_since = datetime.utcnow().isoformat(timespec="seconds")
+            self.checkpoints.save(checkpoint)
 
-        if not market_disclosures:
+        # Filter, dedup, score and mark processed one batch at a time, feeding each
+        # profile's bounded top-K pool; no stage holds the full scored list. Parallel
+        # scoring shares one process pool across all batches of the run.
+        workers = self.settings.score_workers or os.cpu_count() or 1
+        parallel = workers > 1 and len(disclosures) >= self.settings.score_parallel_threshold
+        selectors = {
+            name: (
+                frozenset(target.target_markets),
+                TopKSelector(SelectionRules.from_settings(target)),
+            )
+            for name, target in self.targets.items()
+        }
+        emitter = self.emitter
+        if emitter is not None:
+            emitter.start(run_dt)
+        counts = StreamCounts()
+        with ProcessPoolExecutor(max_workers=workers) if parallel else nullcontext() as pool:
+            stream = mark_processed(
+                score_batches(
+                    drop_processed(
+                        filter_markets(
+                            batched(disclosures, self.settings.stream_batch_size),
+                            self.market_filter,
+                            counts,
+                        ),
+                        self.storage,
+                        counts,
+                        force=force,
+                        seen_before=seen_before,
+                    ),
+                    counts,
+                    cache=self.score_cache,
+                    workers=workers,
+                    parallel_threshold=self.settings.score_parallel_threshold,
+                    executor=pool,
+                ),
+                self.storage,
+            )
+            for batch in stream:
+                with metrics.stage("select", items_in=len(batch), accumulate=True):
+                    if emitter is None:
+                        for markets, selector in selectors.values():
+                            for item in batch:
+                                if not self.settings.profiles or item.market in markets:
+                                    selector.push(item)
+                    else:
+                        self._push_and_emit(batch, selectors, emitter)
+
+        if not counts.in_market:
             result = PipelineResult(
                 status="skipped",
                 message=(
                     "No disclosures found for target markets: "
-                    + ", ".join(self.settings.target_markets)
+                    + ", ".join(self.settings.fetch_markets)
                 ),
             )
-            self._notify_skip(result, run_dt)
+            self._notify_skip(result, run_dt, deadline)
             return result
-
-        candidates = (
-            market_disclosures
-            if force
-            else [
-                item
-                for item in market_disclosures
-                if not self.storage.is_processed(item.receipt_no)
-            ]
-        )
-        if not candidates:
+        if not counts.candidates:
             result = PipelineResult(
                 status="skipped",
                 message="No new disclosures after deduplication.",
             )
-            self._notify_skip(result, run_dt)
+            self._notify_skip(result, run_dt, deadline)
             return result
 
-        scored = score_disclosures(candidates)
-        for item in scored:
-            self.storage.mark_processed(item)
+        with metrics.stage("select", accumulate=True) as stage:
+            selections = {name: selector.select() for name, (_, selector) in selectors.items()}
+            stage.items_out = sum(len(selected) for selected in selections.values())
+        if emitter is not None:
+            emitter.finish(selections)
+            metrics.set_counter("emitted_candidates", emitter.emitted)
+        return selections
 
-        selected = self._pick_top(scored)
+    def _push_and_emit(
+        self,
+        batch: list[ScoredDisclosure],
+        selectors: dict[str, tuple[frozenset[str], TopKSelector]],
+        emitter: CandidateEmitter,
+    ) -> None:
+        # Item-major so the emitter learns, per item, how many pools kept it; whatever a
+        # pool rejects or evicts is released and written once no pool holds it.
+        for item in batch:
+            pools = 0
+            for markets, selector in selectors.values():
+                if self.settings.profiles and item.market not in markets:
+                    continue
+                dropped = selector.push(item)
+                if dropped is None:
+                    pools += 1
+                elif dropped is not item:
+                    pools += 1
+                    emitter.release(dropped)
+            emitter.track(item, pools)
+        emitter.flush()
 
-        if not selected:
-            result = PipelineResult(
-                status="skipped",
-                message="No disclosure passed the importance threshold.",
+    def _fetch(self, test_date: str | None, deadline: Deadline) -> list[Disclosure]:
+        if test_date:
+            if not self.settings.dart_api_key:
+                raise RuntimeError(
+                    "DART_API_KEY is required when running with --date YYYYMMDD."
+                )
+            with metrics.stage("fetch") as stage:
+                disclosures = self.breakers["dart"].call(
+                    fetch_disclosures_by_date,
+                    target_date=test_date,
+                    api_key=self.settings.dart_api_key,
+                    target_markets=self.settings.fetch_markets,
+                    deadline=deadline,
+                )
+                stage.items_out = len(disclosures)
+            return disclosures
+
+        with metrics.stage("fetch") as stage:
+            rss_xml = self.breakers["dart"].call(
+                fetch_today_rss,
+                self.settings.rss_url,
+                timeout_seconds=max(1.0, deadline.timeout(20)),
             )
-            self._notify_skip(result, run_dt)
-            return result
+            disclosures = parse_disclosures(rss_xml)
+            stage.items_out = len(disclosures)
+        return disclosures
+
+    def _fan_out(
+        self,
+        selections: dict[str, list[ScoredDisclosure]],
+        run_dt: datetime,
+        deadline: Deadline,
+        checkpoint: RunCheckpoint | None = None,
+    ) -> PipelineResult:
+        # News is searched once for the union of picks still needing an article, and
+        # profiles whose selections are identical share one article.
+        written = checkpoint.articles if checkpoint is not None else {}
+        union = list(
+            {
+                item.disclosure.receipt_no: item
+                for profile, selected in selections.items()
+                if profile not in written
+                for item in selected
+            }.values()
+        )
+        news_map = self.writer.collect_news(union, deadline) if union else {}
+
+        articles: dict[tuple[str, ...], str] = {}
+        for profile, selected in selections.items():
+            if selected:
+                key = tuple(item.disclosure.receipt_no for item in selected)
+                if profile in written:
+                    articles.setdefault(key, written[profile])
+                    continue
+                if key not in articles:
+                    articles[key] = self._write(
+                        profile, selected, run_dt, deadline, checkpoint, news_map
+                    )
+                    metrics.set_counter("fanout_articles_written", len(articles))
+                elif checkpoint is not None:
+                    checkpoint.articles[profile] = articles[key]
+        if checkpoint is not None:
+            self.checkpoints.save(checkpoint, WRITTEN)
+
+        outputs: list[PipelineResult] = []
+        for profile, selected in selections.items():
+            if not selected:
+                result = _nothing_selected(profile)
+                self._notify_skip(result, run_dt, deadline, profile)
+                outputs.append(result)
+                continue
+            key = tuple(item.disclosure.receipt_no for item in selected)
+            outputs.append(
+                self._deliver(selected, run_dt, articles[key], deadline, profile, checkpoint)
+            )
+        metrics.set_counter("fanout_profiles", len(selections))
 
-        article = self.writer.write(selected, run_dt)
+        completed = [result for result in outputs if result.status == "completed"]
+        return PipelineResult(
+            status="completed" if completed else "skipped",
+            message="; ".join(f"[{result.profile}] {result.message}" for result in outputs),
+            selection=completed[0].selection if completed else None,
+            outputs=outputs,
+        )
+
+    def _deliver(
+        self,
+        selected: list[ScoredDisclosure],
+        run_dt: datetime,
+        article: str,
+        deadline: Deadline | None = None,
+        profile: str = "",
+        checkpoint: RunCheckpoint | None = None,
+    ) -> PipelineResult:
+        deadline = deadline or Deadline()
         selection = DailySelection(
             run_date=run_dt,
             selected=selected,
             generated_article=article,
+            profile=profile,
         )
+        if checkpoint is not None and profile in checkpoint.published:
+            return PipelineResult(
+                status="completed",
+                message="Report was already published by the resumed run.",
+                selection=selection,
+                profile=profile,
+            )
 
-        self.storage.save_report(selection)
+        with metrics.stage("store", items_in=len(selected)):
+            self.storage.save_report(selection)
 
         if not self.settings.dry_run:
-            sent = self.publisher.publish(article, selected, run_dt)
+            if deadline.remaining() < DELIVERY_RESERVE_SECONDS:
+                # Too little time left for a multi-message post; send one message instead.
+                article = shorten_article(article)
+                metrics.set_counter("degraded_report_shortened", 1)
+            publisher = self.publishers[profile]
+            with metrics.stage("publish", items_in=len(selected)) as stage:
+                try:
+                    sent = self.breakers["slack"].call(
+                        publisher.publish,
+                        article,
+                        selected,
+                        run_dt,
+                        timeout=max(1.0, deadline.timeout(POST_TIMEOUT_SECONDS)),
+                        deadline=deadline,
+                    )
+                except CircuitOpenError:
+                    # The disclosures are already marked processed, so the report must not
+                    # be lost: queue it and let a later run's outbox resume post it.
+                    if not publisher.enqueue(article, selected, run_dt):
+                        raise
+                    metrics.set_counter("publish_deferred_breaker_open", 1)
+                    if checkpoint is not None:
+                        checkpoint.published.append(profile)
+                        self.checkpoints.save(checkpoint)
+                    return PipelineResult(
+                        status="completed",
+                        message=(
+                            "Report queued in slack_outbox; the Slack circuit is open, "
+                            "so a later run will post it."
+                        ),
+                        selection=selection,
+                        profile=profile,
+                    )
+                stage.items_out = len(selected) if sent else 0
             if not sent:
                 if self.settings.require_slack_webhook:
                     raise RuntimeError(
@@ -138,59 +717,110 @@ class DigestPipeline:
                         "(missing SLACK_WEBHOOK_URL)."
                     ),
                     selection=selection,
+                    profile=profile,
                 )
+            if checkpoint is not None:
+                checkpoint.published.append(profile)
+                self.checkpoints.save(checkpoint)
 
         return PipelineResult(
             status="completed",
             message=f"Generated report with {len(selected)} disclosure(s).",
             selection=selection,
+            profile=profile,
         )
 
-    def _notify_skip(self, result: PipelineResult, run_dt: datetime) -> None:
+    def _write(
+        self,
+        profile: str,
+        selected: list[ScoredDisclosure],
+        run_dt: datetime,
+        deadline: Deadline,
+        checkpoint: RunCheckpoint | None,
+        news_map: dict[str, list[NewsItem]] | None = None,
+    ) -> str:
+        if checkpoint is not None and profile in checkpoint.articles:
+            return checkpoint.articles[profile]
+        article = self.writer.write(selected, run_dt, deadline, news_map=news_map)
+        if checkpoint is not None:
+            checkpoint.articles[profile] = article
+            self.checkpoints.save(checkpoint)
+        return article
+
+    def _finish(self, checkpoint: RunCheckpoint, status: str) -> None:
+        checkpoint.status = status
+        self.checkpoints.save(checkpoint, DONE)
+
+    def _notify_skip(
+        self,
+        result: PipelineResult,
+        run_dt: datetime,
+        deadline: Deadline,
+        profile: str | None = None,
+    ) -> None:
+        # profile=None tells every output; a name tells just that profile's channel.
         if self.settings.dry_run or not self.settings.notify_on_skip:
             return
+        names = list(self.targets) if profile is None else [profile]
+        for name in names:
+            self._notify_one(result, run_dt, deadline, name)
 
+    def _notify_one(
+        self,
+        result: PipelineResult,
+        run_dt: datetime,
+        deadline: Deadline,
+        profile: str,
+    ) -> None:
         message = (
             f"[DART 심층 리포트] {run_dt.strftime('%Y-%m-%d %H:%M')} 실행 결과\\n"
             f"- 상태: {result.status}\\n"
             f"- 사유: {result.message}"
         )
-        sent = self.publisher.publish_text(message)
+        with metrics.stage("notify"):
+            try:
+                sent = self.breakers["slack"].call(
+                    self.publishers[profile].publish_text,
+                    message,
+                    timeout=max(1.0, deadline.timeout(POST_TIMEOUT_SECONDS)),
+                    deadline=deadline,
+                )
+            except CircuitOpenError:
+                # A skip notice is not worth failing the run over; Slack is known to be down.
+                metrics.set_counter("notify_skipped_breaker_open", 1)
+                return
         if not sent and self.settings.require_slack_webhook:
             raise RuntimeError(
                 "Skip notification was not sent because SLACK_WEBHOOK_URL is missing."
             )
 
     def _pick_top(self, scored: list[ScoredDisclosure]) -> list[ScoredDisclosure]:
-        if not scored:
-            return []
-
-        ranked = sorted(
-            scored,
-            key=lambda x: (x.total_score, x.disclosure.published_at),
-            reverse=True,
-        )
-
-        primary = ranked[0]
-        if primary.total_score < 60.0:
-            return []
-
-        selected = [primary]
+        selector = TopKSelector(SelectionRules.from_settings(self.settings))
+        selector.extend(scored)
+        return selector.select()
 
-        if self.settings.top_n_max < 2 or len(ranked) < 2:
-            return selected
 
-        secondary = ranked[1]
-        score_gap = primary.total_score - secondary.total_score
+def _orphaned_note(orphaned: dict[str, int]) -> str:
+    return (
+        f"{sum(orphaned.values())} queued Slack message(s) belong to unconfigured profile(s) "
+        f"and cannot be delivered: {', '.join(sorted(orphaned))}."
+    )
 
-        if secondary.total_score < self.settings.second_pick_min_score:
-            return selected
 
-        if score_gap > self.settings.second_pick_min_gap:
-            return selected
+def _nothing_selected(profile: str) -> PipelineResult:
+    return PipelineResult(
+        status="skipped",
+        message="No disclosure passed the importance threshold.",
+        profile=profile,
+    )
 
-        if secondary.event_type == primary.event_type:
-            return selected
 
-        selected.append(secondary)
-        return selected
+def date_range(start_date: str, end_date: str) -> list[str]:
+    start = datetime.strptime(start_date, "%Y%m%d")
+    end = datetime.strptime(end_date, "%Y%m%d")
+    if end < start:
+        raise ValueError("end date must not be before start date")
+    return [
+        (start + timedelta(days=offset)).strftime("%Y%m%d")
+        for offset in range((end - start).days + 1)
+    ]
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import threading
+import tracemalloc
+from pathlib import Path
+from typing import Callable, TypeVar
+
+from dart_digest import metrics
+
+
+T = TypeVar("T")
+
+OUTSIDE_STAGES = "other"
+
+
+class CpuProfiler:
+    # One cProfile.Profile per stage, switched at stage boundaries; only one can be
+    # active per interpreter, so the enclosing stage is paused while a nested one runs.
+    def __init__(self) -> None:
+        self.profiles: dict[str, cProfile.Profile] = {}
+        self._stack: list[str] = []
+        self._thread = threading.get_ident()
+
+    def start(self) -> None:
+        self._switch_to(OUTSIDE_STAGES)
+
+    def stop(self) -> None:
+        if self._stack:
+            self.profiles[self._stack[-1]].disable()
+            self._stack.clear()
+
+    def enter(self, name: str) -> None:
+        if threading.get_ident() == self._thread:
+            self._switch_to(name)
+
+    def exit(self, name: str) -> None:
+        if threading.get_ident() != self._thread or len(self._stack) < 2:
+            return
+        self.profiles[self._stack.pop()].disable()
+        self.profiles[self._stack[-1]].enable()
+
+    def write(self, path: Path) -> list[Path]:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written: list[Path] = []
+        combined: pstats.Stats | None = None
+        for name, profile in self.profiles.items():
+            stage_path = path.with_name(f"{path.stem}.{name}{path.suffix}")
+            profile.dump_stats(stage_path)
+            written.append(stage_path)
+            if combined is None:
+                combined = pstats.Stats(profile)
+            else:
+                combined.add(profile)
+        if combined is not None:
+            combined.dump_stats(path)
+            written.insert(0, path)
+        return written
+
+    def _switch_to(self, name: str) -> None:
+        if self._stack:
+            self.profiles[self._stack[-1]].disable()
+        self._stack.append(name)
+        self.profiles.setdefault(name, cProfile.Profile()).enable()
+
+
+class MemoryProfiler:
+    # tracemalloc snapshots at each stage boundary; a stage's report is the allocation
+    # difference between its end and start, plus the peak traced while it ran.
+    def __init__(self, top_n: int = 25, frames: int = 10) -> None:
+        self.top_n = top_n
+        self.frames = frames
+        self.stages: list[tuple[str, int, list[tracemalloc.StatisticDiff]]] = []
+        self.peak = 0
+        self._open: list[tuple[str, tracemalloc.Snapshot]] = []
+        self._final: tracemalloc.Snapshot | None = None
+
+    def start(self) -> None:
+        tracemalloc.start(self.frames)
+
+    def stop(self) -> None:
+        self._final = _snapshot()
+        self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    def enter(self, name: str) -> None:
+        self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._open.append((name, _snapshot()))
+
+    def exit(self, name: str) -> None:
+        if not self._open:
+            return
+        _, before = self._open.pop()
+        stage_peak = tracemalloc.get_traced_memory()[1]
+        self.peak = max(self.peak, stage_peak)
+        diff = _snapshot().compare_to(before, "lineno")
+        self.stages.append((name, stage_peak, diff[: self.top_n]))
+
+    def write(self, path: Path) -> list[Path]:
+        lines = [f"peak traced memory: {_kib(self.peak)}", ""]
+        for name, stage_peak, diff in self.stages:
+            net = sum(stat.size_diff for stat in diff)
+            lines.append(
+                f"== stage {name}: peak {_kib(stage_peak)}, top-{len(diff)} net {_kib(net)}"
+            )
+            lines.extend(f"  {stat}" for stat in diff)
+            lines.append("")
+        if self._final is not None:
+            lines.append(f"== live at end of run (top {self.top_n})")
+            lines.extend(
+                f"  {stat}" for stat in self._final.statistics("lineno")[: self.top_n]
+            )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return [path]
+
+
+def run_profiled(
+    kind: str,
+    work: Callable[[], T],
+    out_path: Path,
+    top_n: int = 25,
+) -> tuple[T, list[Path]]:
+    if kind == "cpu":
+        profiler: CpuProfiler | MemoryProfiler = CpuProfiler()
+    elif kind == "mem":
+        profiler = MemoryProfiler(top_n=top_n)
+    else:
+        raise ValueError(f"unknown profile kind: {kind}")
+
+    with metrics.listening(profiler):
+        profiler.start()
+        try:
+            result = work()
+        finally:
+            # Written even when the run fails; that is often the run worth profiling.
+            profiler.stop()
+            written = profiler.write(out_path)
+    return result, written
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # Leave out the profiler's own bookkeeping.
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        )
+    )
+
+
+def _kib(nbytes: int) -> str:
+    return f"{nbytes / 1024:.1f} KiB"
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+from dart_digest.models import Disclosure, ScoredDisclosure
+from dart_digest.scoring import RULES_VERSION, _build_scored
+
+
+class ScoreCache:
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        db_path: Path | None = None,
+        rules_version: str = RULES_VERSION,
+        persist_limit: int = 50_000,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.db_path = db_path
+        self.rules_version = rules_version
+        self.persist_limit = persist_limit
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[Any, ...]] = OrderedDict()
+        # Upper bound on persisted rows (upserts count as inserts); None until first read.
+        self._row_bound: int | None = None
+
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        assert self.db_path is not None
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS score_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS score_cache_updated_at ON score_cache (updated_at)"
+            )
+            conn.commit()
+
+    def key_for(self, disclosure: Disclosure) -> str:
+        market = disclosure.market.upper()
+        digest = hashlib.sha256(
+            "\x1f".join(
+                [disclosure.title, disclosure.description, market, self.rules_version]
+            ).encode("utf-8")
+        ).hexdigest()
+        return f"{disclosure.receipt_no}:{digest[:32]}"
+
+    def get(self, disclosure: Disclosure) -> ScoredDisclosure | None:
+        return self.get_many([disclosure])[0]
+
+    def put(self, scored: ScoredDisclosure) -> None:
+        self.put_many([scored])
+
+    def get_many(self, disclosures: list[Disclosure]) -> list[ScoredDisclosure | None]:
+        keys = [self.key_for(item) for item in disclosures]
+        found: dict[str, tuple[Any, ...]] = {}
+        missing: list[str] = []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is None:
+                missing.append(key)
+            else:
+                self._entries.move_to_end(key)
+                found[key] = entry
+
+        if missing and self.db_path is not None:
+            for key, entry in self._load(missing).items():
+                self._remember(key, entry)
+                found[key] = entry
+        if found and self.db_path is not None:
+            # Hits count as use, so the persisted table trims least recently used rows.
+            self._touch(list(found))
+
+        result: list[ScoredDisclosure | None] = []
+        for disclosure, key in zip(disclosures, keys):
+            entry = found.get(key)
+            if entry is None:
+                self.misses += 1
+                result.append(None)
+            else:
+                self.hits += 1
+                result.append(_build_scored(disclosure, entry))
+        return result
+
+    def put_many(self, scored_items: Iterable[ScoredDisclosure]) -> None:
+        rows: list[tuple[str, str, str]] = []
+        now = datetime.utcnow().isoformat(timespec="microseconds")
+        for scored in scored_items:
+            key = self.key_for(scored.disclosure)
+            entry = _to_entry(scored)
+            self._remember(key, entry)
+            rows.append((key, json.dumps(entry, ensure_ascii=False), now))
+
+        if not rows or self.db_path is None:
+            return
+
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO score_cache (cache_key, payload, updated_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    payload = excluded.payload,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+            if self._row_bound is None:
+                self._row_bound = _count(conn)
+            else:
+                self._row_bound += len(rows)
+            if self._row_bound > self.persist_limit:
+                # Only when the cap may be exceeded; the oldest rows come off the index.
+                rows_now = _count(conn)
+                excess = rows_now - self.persist_limit
+                if excess > 0:
+                    conn.execute(
+                        """
+                        DELETE FROM score_cache WHERE cache_key IN (
+                            SELECT cache_key FROM score_cache ORDER BY updated_at LIMIT ?
+                        )
+                        """,
+                        (excess,),
+                    )
+                self._row_bound = min(rows_now, self.persist_limit)
+            conn.commit()
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+    def _remember(self, key: str, entry: tuple[Any, ...]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _touch(self, keys: list[str]) -> None:
+        now = datetime.utcnow().isoformat(timespec="microseconds")
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE score_cache SET updated_at = ? WHERE cache_key = ?",
+                [(now, key) for key in keys],
+            )
+            conn.commit()
+
+    def _load(self, keys: list[str]) -> dict[str, tuple[Any, ...]]:
+        loaded: dict[str, tuple[Any, ...]] = {}
+        with self._connect() as conn:
+            # Stay well below SQLite's host-parameter limit.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" for _ in chunk)
+                rows = conn.execute(
+                    f"SELECT cache_key, payload FROM score_cache WHERE cache_key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for cache_key, payload in rows:
+                    loaded[cache_key] = tuple(json.loads(payload))
+        return loaded
+
+
+def _count(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COUNT(*) FROM score_cache").fetchone()[0]
+
+
+def _to_entry(scored: ScoredDisclosure) -> tuple[Any, ...]:
+    return (
+        scored.market,
+        scored.event_type,
+        scored.event_score,
+        scored.financial_score,
+        scored.persistence_score,
+        scored.confidence_score,
+        scored.market_bonus,
+        scored.total_score,
+        list(scored.reasons),
+    )
+
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import math
+import os
 import re
-from dataclasses import dataclass
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from dart_digest.columnar import DisclosureBatch, ScoredBatch
 from dart_digest.models import Disclosure, ScoredDisclosure
 
+if TYPE_CHECKING:
+    from dart_digest.score_cache import ScoreCache
+
 
 @dataclass(frozen=True)
 class EventRule:
@@ -69,14 +78,163 @@ EVENT_RULES: tuple[EventRule, ...] = (
 )
 
 
-def score_disclosures(disclosures: list[Disclosure]) -> list[ScoredDisclosure]:
-    return [score_disclosure(item) for item in disclosures]
+# Bump when scoring weights or helper heuristics change without touching EVENT_RULES.
+SCORING_REVISION = 1
+
+
+def rules_version(rules: tuple[EventRule, ...] = EVENT_RULES) -> str:
+    payload = json.dumps(
+        {"revision": SCORING_REVISION, "rules": [asdict(rule) for rule in rules]},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+RULES_VERSION = rules_version()
+
+# Below this many disclosures, process start-up and pickling cost more than they save.
+PARALLEL_THRESHOLD = 5000
+DEFAULT_CHUNK_SIZE = 2000
+
+
+class ScoringInput(NamedTuple):
+    title: str
+    description: str
+    market: str
+
+
+def score_disclosures(
+    disclosures: list[Disclosure],
+    cache: ScoreCache | None = None,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+    executor: Executor | None = None,
+) -> list[ScoredDisclosure]:
+    # `executor` is a pool the caller keeps open across calls (e.g. a streamed run);
+    # with one, every call fans out to it regardless of the threshold.
+    if cache is None:
+        return _score_many(disclosures, workers, chunk_size, parallel_threshold, executor)
+
+    cached = cache.get_many(disclosures)
+    pending = [item for item, scored in zip(disclosures, cached) if scored is None]
+    fresh = _score_many(pending, workers, chunk_size, parallel_threshold, executor)
+    cache.put_many(fresh)
+
+    fresh_iter = iter(fresh)
+    return [scored if scored is not None else next(fresh_iter) for scored in cached]
 
 
 def score_disclosure(disclosure: Disclosure) -> ScoredDisclosure:
-    title = disclosure.title
-    body = f"{disclosure.title}\n{disclosure.description}"
-    market = str(disclosure.raw.get("market") or "").upper()
+    return _build_scored(disclosure, _score_input(_to_input(disclosure)))
+
+
+def score_batch(
+    batch: DisclosureBatch,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+) -> ScoredBatch:
+    # Columnar path: inputs come straight from the columns and scores stay columns, so
+    # no per-row objects are built. Uncached; the score cache is keyed by Disclosure.
+    inputs = [
+        ScoringInput(title=title, description=description, market=market.upper())
+        for title, description, market in zip(batch.title, batch.description, batch.market)
+    ]
+    return ScoredBatch(batch, _score_inputs(inputs, workers, chunk_size, parallel_threshold))
+
+
+def _score_many(
+    disclosures: list[Disclosure],
+    workers: int,
+    chunk_size: int,
+    parallel_threshold: int,
+    executor: Executor | None = None,
+) -> list[ScoredDisclosure]:
+    parts = _score_inputs(
+        [_to_input(item) for item in disclosures],
+        workers,
+        chunk_size,
+        parallel_threshold,
+        executor,
+    )
+    return [_build_scored(item, part) for item, part in zip(disclosures, parts)]
+
+
+def _score_inputs(
+    inputs: list[ScoringInput],
+    workers: int,
+    chunk_size: int,
+    parallel_threshold: int,
+    executor: Executor | None = None,
+) -> list[tuple[Any, ...]]:
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    if executor is not None and workers > 1 and len(inputs) >= 2:
+        # Shared pool: split so every worker gets a share of this (stream-sized) batch.
+        size = min(max(1, chunk_size), math.ceil(len(inputs) / workers))
+        return _map_chunks(executor, inputs, size)
+    if workers <= 1 or len(inputs) < max(parallel_threshold, 2):
+        return [_score_input(item) for item in inputs]
+
+    chunk_size = max(1, chunk_size)
+    # executor.map yields chunk results in submission order, so output order is deterministic.
+    with ProcessPoolExecutor(
+        max_workers=min(workers, math.ceil(len(inputs) / chunk_size))
+    ) as pool:
+        return _map_chunks(pool, inputs, chunk_size)
+
+
+def _map_chunks(
+    executor: Executor, inputs: list[ScoringInput], chunk_size: int
+) -> list[tuple[Any, ...]]:
+    chunks = [inputs[start : start + chunk_size] for start in range(0, len(inputs), chunk_size)]
+    return [part for chunk in executor.map(_score_chunk, chunks) for part in chunk]
+
+
+def _score_chunk(chunk: list[ScoringInput]) -> list[tuple[Any, ...]]:
+    return [_score_input(item) for item in chunk]
+
+
+def _to_input(disclosure: Disclosure) -> ScoringInput:
+    return ScoringInput(
+        title=disclosure.title,
+        description=disclosure.description,
+        market=disclosure.market.upper(),
+    )
+
+
+def _build_scored(disclosure: Disclosure, part: tuple[Any, ...]) -> ScoredDisclosure:
+    (
+        market,
+        event_type,
+        event_score,
+        financial_score,
+        persistence_score,
+        confidence_score,
+        market_bonus,
+        total_score,
+        reasons,
+    ) = part
+    return ScoredDisclosure(
+        disclosure=disclosure,
+        market=market,
+        event_type=event_type,
+        event_score=event_score,
+        financial_score=financial_score,
+        persistence_score=persistence_score,
+        confidence_score=confidence_score,
+        market_bonus=market_bonus,
+        total_score=total_score,
+        reasons=reasons,
+    )
+
+
+def _score_input(item: ScoringInput) -> tuple[Any, ...]:
+    title = item.title
+    body = f"{item.title}\n{item.description}"
+    market = item.market
 
     event_type, event_score, persistence_score, reasons = _score_event(title)
     financial_score, financial_reason = _score_financial_impact(body)
@@ -95,17 +253,16 @@ def score_disclosure(disclosure: Disclosure) -> ScoredDisclosure:
     )
     total = base_total + market_bonus
 
-    return ScoredDisclosure(
-        disclosure=disclosure,
-        market=market or "UNKNOWN",
-        event_type=event_type,
-        event_score=event_score,
-        financial_score=financial_score,
-        persistence_score=persistence_score,
-        confidence_score=confidence_score,
-        market_bonus=market_bonus,
-        total_score=round(total, 2),
-        reasons=[reason for reason in reasons if reason],
+    return (
+        market or "UNKNOWN",
+        event_type,
+        event_score,
+        financial_score,
+        persistence_score,
+        confidence_score,
+        market_bonus,
+        round(total, 2),
+        [reason for reason in reasons if reason],
     )
 
 
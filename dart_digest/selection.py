@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable
+
+from dart_digest.config import Settings
+from dart_digest.models import ScoredDisclosure
+
+
+# Extra ranked candidates kept per pick so diversity skips can still be filled.
+POOL_FACTOR = 16
+MIN_POOL_SIZE = 64
+
+
+@dataclass(frozen=True)
+class SelectionRules:
+    top_n: int = 2
+    primary_min_score: float = 60.0
+    follow_min_score: float = 78.0
+    max_gap: float = 6.0
+    max_per_event_type: int = 1
+    max_per_company: int = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "SelectionRules":
+        return cls(
+            top_n=settings.top_n_max,
+            primary_min_score=settings.primary_min_score,
+            follow_min_score=settings.second_pick_min_score,
+            max_gap=settings.second_pick_min_gap,
+            max_per_event_type=settings.max_per_event_type,
+            max_per_company=settings.max_per_company,
+        )
+
+    @property
+    def score_floor(self) -> float:
+        # Nothing below this can become the primary or any follow-up pick.
+        follow_floor = max(self.follow_min_score, self.primary_min_score - self.max_gap)
+        return min(self.primary_min_score, follow_floor)
+
+
+class TopKSelector:
+    def __init__(self, rules: SelectionRules, pool_size: int | None = None) -> None:
+        self.rules = rules
+        self.pool_size = pool_size or max(rules.top_n * POOL_FACTOR, MIN_POOL_SIZE)
+        self.seen = 0
+        self._heap: list[tuple[float, datetime, int, ScoredDisclosure]] = []
+
+    # Returns the candidate that can no longer be selected (rejected or evicted), if any.
+    def push(self, item: ScoredDisclosure) -> ScoredDisclosure | None:
+        self.seen += 1
+        if item.total_score < self.rules.score_floor:
+            return item
+
+        # Ties keep arrival order: earlier items rank higher, matching a stable sort.
+        entry = (item.total_score, item.disclosure.published_at, -self.seen, item)
+        if len(self._heap) < self.pool_size:
+            heapq.heappush(self._heap, entry)
+            return None
+        if entry[:3] <= self._heap[0][:3]:
+            return item
+        return heapq.heapreplace(self._heap, entry)[3]
+
+    def extend(self, items: Iterable[ScoredDisclosure]) -> None:
+        for item in items:
+            self.push(item)
+
+    def pool(self) -> list[ScoredDisclosure]:
+        return [entry[3] for entry in sorted(self._heap, key=lambda x: x[:3], reverse=True)]
+
+    def select(self) -> list[ScoredDisclosure]:
+        ranked = self.pool()
+        if not ranked or ranked[0].total_score < self.rules.primary_min_score:
+            return []
+
+        primary = ranked[0]
+        selected = [primary]
+        per_event: dict[str, int] = {primary.event_type: 1}
+        per_company: dict[str, int] = {primary.disclosure.company_name: 1}
+
+        for candidate in ranked[1:]:
+            if len(selected) >= self.rules.top_n:
+                break
+            # The pool is ranked, so once a score rule fails every later candidate fails too.
+            if candidate.total_score < self.rules.follow_min_score:
+                break
+            if primary.total_score - candidate.total_score > self.rules.max_gap:
+                break
+
+            event_count = per_event.get(candidate.event_type, 0)
+            if self.rules.max_per_event_type and event_count >= self.rules.max_per_event_type:
+                continue
+            company = candidate.disclosure.company_name
+            company_count = per_company.get(company, 0)
+            if self.rules.max_per_company and company_count >= self.rules.max_per_company:
+                continue
+
+            selected.append(candidate)
+            per_event[candidate.event_type] = event_count + 1
+            per_company[company] = company_count + 1
+
+        return selected
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from dart_digest.config import Settings
+from dart_digest.dart_client import extract_company_name
+from dart_digest.market_filter import CompanyUniverse
+from dart_digest.models import Disclosure
+from dart_digest.score_cache import ScoreCache
+from dart_digest.scoring import RULES_VERSION, score_disclosures
+
+
+MAX_BODY_BYTES = 1 << 20
+MAX_BATCH_ITEMS = 1000
+# Optional item fields; anything but a string is a 400, not a scoring-time crash.
+_OPTIONAL_TEXT_FIELDS = ("company_name", "description", "receipt_no", "market")
+
+
+class RequestError(ValueError):
+    pass
+
+
+class ScoringService:
+    # The universe and score cache are loaded once and shared by every request, so a
+    # caller pays for the company CSV at startup instead of per invocation.
+    def __init__(
+        self,
+        universe: CompanyUniverse,
+        target_markets: tuple[str, ...] = ("KOSPI",),
+        cache_size: int = 4096,
+    ) -> None:
+        self.universe = universe
+        self.target_markets = frozenset(market.upper() for market in target_markets)
+        # Memory only: request titles are ad hoc and not worth persisting.
+        self.cache = ScoreCache(max_entries=cache_size)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ScoringService:
+        return cls(
+            CompanyUniverse.from_csv(settings.company_map_path),
+            settings.fetch_markets,
+            settings.score_cache_size,
+        )
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "rules_version": RULES_VERSION,
+            "companies": len(self.universe.items),
+            "target_markets": sorted(self.target_markets),
+        }
+
+    def score(self, body: dict[str, Any]) -> dict[str, Any]:
+        # {"title": ...} scores one item; {"items": [{"title": ...}, ...]} a batch.
+        if "items" in body:
+            items = body["items"]
+            if not isinstance(items, list):
+                raise RequestError("'items' must be a list")
+            if len(items) > MAX_BATCH_ITEMS:
+                raise RequestError(f"at most {MAX_BATCH_ITEMS} items per request")
+            return {"results": self._score_many([_item(entry) for entry in items])}
+        return self._score_many([_item(body)])[0]
+
+    def classify(self, names: list[str]) -> list[dict[str, Any]]:
+        results: list[dict[str, Any]] = []
+        for name in names:
+            company = self.universe.get_company(name)
+            in_target = company is not None and company.market in self.target_markets
+            results.append(
+                {
+                    "name": name,
+                    "found": company is not None,
+                    "company_name": company.company_name if company else None,
+                    "ticker": company.ticker if company else None,
+                    "market": company.market if company else None,
+                    "in_target_markets": in_target,
+                }
+            )
+        return results
+
+    def _score_many(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        disclosures = [self._disclosure(item) for item in items]
+        # ScoreCache is a plain OrderedDict; scoring is CPU-bound, so serializing costs little.
+        with self._lock:
+            scored = score_disclosures(disclosures, cache=self.cache)
+        return [
+            {
+                "company_name": item.disclosure.company_name,
+                "ticker": item.disclosure.ticker or None,
+                "market": item.market,
+                "in_target_markets": item.market in self.target_markets,
+                "event_type": item.event_type,
+                "event_score": item.event_score,
+                "financial_score": item.financial_score,
+                "persistence_score": item.persistence_score,
+                "confidence_score": item.confidence_score,
+                "market_bonus": item.market_bonus,
+                "total_score": item.total_score,
+                "reasons": item.reasons,
+            }
+            for item in scored
+        ]
+
+    def _disclosure(self, item: dict[str, Any]) -> Disclosure:
+        # Same inputs the digest scores: market comes from the universe when the company
+        # is known, otherwise from the request.
+        title = item["title"]
+        name = item.get("company_name") or extract_company_name(title)
+        company = self.universe.get_company(name)
+        return Disclosure(
+            company_name=company.company_name if company else name,
+            title=title,
+            link="",
+            receipt_no=str(item.get("receipt_no") or ""),
+            published_at=datetime.now(),
+            description=str(item.get("description") or ""),
+            market=company.market if company else str(item.get("market") or "").upper(),
+            ticker=company.ticker if company else "",
+        )
+
+
+def make_handler(service: ScoringService) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        # Keep-alive, so load tests and batch callers reuse one connection. Headers and
+        # body go out in separate writes; without TCP_NODELAY each response would wait
+        # on the client's delayed ACK (~40 ms).
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:  # noqa: N802
+            url = urlsplit(self.path)
+            if url.path == "/healthz":
+                self._send(200, service.health())
+            elif url.path == "/classify-company":
+                names = parse_qs(url.query).get("name", [])
+                if not names:
+                    self._send(400, {"error": "'name' query parameter is required"})
+                else:
+                    self._send(200, _classified(service.classify(names), len(names) == 1))
+            else:
+                self._send(404, {"error": f"unknown path: {url.path}"})
+
+        def do_POST(self) -> None:  # noqa: N802
+            path = urlsplit(self.path).path
+            try:
+                if path not in ("/score", "/classify-company"):
+                    self._discard_body()
+                    self._send(404, {"error": f"unknown path: {path}"})
+                    return
+                body = self._read_json()
+                if path == "/score":
+                    self._send(200, service.score(body))
+                else:
+                    names = _names(body)
+                    self._send(200, _classified(service.classify(names), "name" in body))
+            except RequestError as exc:
+                self._send(400, {"error": str(exc)})
+
+        def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+            # Access logs would dominate a load test; log_error still reaches stderr.
+            pass
+
+        def _content_length(self) -> int:
+            raw = self.headers.get("Content-Length") or "0"
+            try:
+                length = int(raw)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # Where this body ends is unknown, so the connection cannot be reused.
+                self.close_connection = True
+                raise RequestError(f"invalid Content-Length: {raw!r}")
+            return length
+
+        def _read_json(self) -> dict[str, Any]:
+            length = self._content_length()
+            if length > MAX_BODY_BYTES:
+                self.close_connection = True
+                raise RequestError(f"request body exceeds {MAX_BODY_BYTES} bytes")
+            try:
+                body = json.loads(self.rfile.read(length) or b"{}")
+            except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+                raise RequestError(f"invalid JSON: {exc}") from exc
+            if not isinstance(body, dict):
+                raise RequestError("request body must be a JSON object")
+            return body
+
+        def _discard_body(self) -> None:
+            length = self._content_length()
+            if length > MAX_BODY_BYTES:
+                self.close_connection = True
+            else:
+                self.rfile.read(length)
+
+        def _send(self, status: int, payload: dict[str, Any]) -> None:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    return Handler
+
+
+def make_server(service: ScoringService, host: str, port: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), make_handler(service))
+    server.daemon_threads = True
+    return server
+
+
+def _item(entry: Any) -> dict[str, Any]:
+    if not isinstance(entry, dict):
+        raise RequestError("each item must be a JSON object")
+    title = entry.get("title")
+    if not isinstance(title, str) or not title.strip():
+        raise RequestError("'title' is required")
+    for field in _OPTIONAL_TEXT_FIELDS:
+        value = entry.get(field)
+        if value is not None and not isinstance(value, str):
+            raise RequestError(f"'{field}' must be a string")
+    return entry
+
+
+def _names(body: dict[str, Any]) -> list[str]:
+    names = body.get("names", [body.get("name")] if "name" in body else None)
+    if not isinstance(names, list) or not names:
+        raise RequestError("'name' or 'names' is required")
+    if len(names) > MAX_BATCH_ITEMS:
+        raise RequestError(f"at most {MAX_BATCH_ITEMS} names per request")
+    if not all(isinstance(name, str) and name.strip() for name in names):
+        raise RequestError("company names must be non-empty strings")
+    return names
+
+
+def _classified(results: list[dict[str, Any]], single: bool) -> dict[str, Any]:
+    return results[0] if single else {"results": results}
@@ -1,54 +1,163 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime
 
 import requests
 
+from dart_digest import metrics
+from dart_digest.deadline import Deadline
 from dart_digest.models import ScoredDisclosure
+from dart_digest.slack_outbox import SlackOutbox
+
+
+POST_TIMEOUT_SECONDS = 15.0
+MAX_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class SlackRejectedError(RuntimeError):
+    # Non-retryable 4xx (invalid_payload, channel_not_found, revoked webhook, ...).
+    pass
 
 
 class SlackPublisher:
-    def __init__(self, webhook_url: str | None, channel: str | None = None) -> None:
+    def __init__(
+        self,
+        webhook_url: str | None,
+        channel: str | None = None,
+        outbox: SlackOutbox | None = None,
+        destination: str = "",
+    ) -> None:
         self.webhook_url = webhook_url
         self.channel = channel
-
-    def publish(self, article: str, selected: list[ScoredDisclosure], run_dt: datetime) -> bool:
+        self.outbox = outbox
+        # Outbox partition this publisher owns, so a flush never posts another profile's chunks.
+        self.destination = destination
+        self._session: requests.Session | None = None
+
+    def publish(
+        self,
+        article: str,
+        selected: list[ScoredDisclosure],
+        run_dt: datetime,
+        timeout: float = POST_TIMEOUT_SECONDS,
+        deadline: Deadline | None = None,
+    ) -> bool:
         if not self.webhook_url:
             return False
 
-        intro = self._intro(selected, run_dt)
-        chunks = _chunk_text(article, size=3200)
-
-        # First message: intro and first chunk.
-        all_chunks = [intro + "\n\n" + chunks[0]] + chunks[1:]
-        for idx, chunk in enumerate(all_chunks, start=1):
-            payload = {"text": chunk}
-            if self.channel:
-                payload["channel"] = self.channel
+        self._send(self._report_payloads(article, selected, run_dt), timeout, deadline)
+        return True
 
-            response = requests.post(self.webhook_url, json=payload, timeout=15)
-            if response.status_code >= 400:
-                raise RuntimeError(
-                    f"Slack publish failed at chunk {idx}: "
-                    f"{response.status_code} {response.text[:200]}"
-                )
+    def enqueue(self, article: str, selected: list[ScoredDisclosure], run_dt: datetime) -> bool:
+        # Queue the report without posting it; a later flush delivers it.
+        if not self.webhook_url or self.outbox is None:
+            return False
 
+        self.outbox.enqueue(self._report_payloads(article, selected, run_dt), self.destination)
         return True
 
-    def publish_text(self, text: str) -> bool:
+    def publish_text(
+        self,
+        text: str,
+        timeout: float = POST_TIMEOUT_SECONDS,
+        deadline: Deadline | None = None,
+    ) -> bool:
         if not self.webhook_url:
             return False
 
+        # Notices (skips, errors) only matter now: they bypass the outbox, so a stale one
+        # is never replayed beside a later report and a repeat is not deduplicated away.
+        self._post_all([self._payload(text)], timeout, deadline)
+        return True
+
+    def flush(self, timeout: float = POST_TIMEOUT_SECONDS, deadline: Deadline | None = None) -> int:
+        # Oldest first; delivery stops at the first chunk that may still go through, so
+        # order is kept. A chunk Slack rejects outright, or one out of attempts, fails for
+        # good together with the rest of its report, and later reports are still sent.
+        if not self.webhook_url or self.outbox is None:
+            return 0
+
+        sent = 0
+        dead_reports: set[str] = set()
+        for message in self.outbox.pending(self.destination):
+            if message.report_key in dead_reports:
+                continue
+            try:
+                self._post(message.payload, timeout, deadline)
+            except (requests.RequestException, RuntimeError) as exc:
+                if self.outbox.mark_failed(
+                    message, str(exc), permanent=isinstance(exc, SlackRejectedError)
+                ):
+                    dead_reports.add(message.report_key)
+                    continue
+                raise RuntimeError(
+                    f"Slack publish failed at chunk {message.seq}: {exc}"
+                ) from exc
+            self.outbox.mark_delivered(message)
+            sent += 1
+        return sent
+
+    def _send(self, payloads: list[dict], timeout: float, deadline: Deadline | None) -> None:
+        if self.outbox is not None:
+            report_key = self.outbox.enqueue(payloads, self.destination)
+            self.flush(timeout, deadline)
+            if self.outbox.failed_chunks(report_key):
+                # Failed for good, now or on an earlier run; the outbox will not re-send it.
+                raise RuntimeError("Slack rejected this report; see slack_outbox.last_error.")
+            return
+        self._post_all(payloads, timeout, deadline)
+
+    def _post_all(self, payloads: list[dict], timeout: float, deadline: Deadline | None) -> None:
+        for idx, payload in enumerate(payloads, start=1):
+            try:
+                self._post(payload, timeout, deadline)
+            except (requests.RequestException, RuntimeError) as exc:
+                raise RuntimeError(f"Slack publish failed at chunk {idx}: {exc}") from exc
+
+    def _report_payloads(
+        self, article: str, selected: list[ScoredDisclosure], run_dt: datetime
+    ) -> list[dict]:
+        intro = self._intro(selected, run_dt)
+        chunks = _chunk_text(article, size=3200)
+
+        # First message: intro and first chunk.
+        all_chunks = [intro + "\n\n" + chunks[0]] + chunks[1:]
+        return [self._payload(chunk) for chunk in all_chunks]
+
+    def _payload(self, text: str) -> dict:
         payload = {"text": text}
         if self.channel:
             payload["channel"] = self.channel
-
-        response = requests.post(self.webhook_url, json=payload, timeout=15)
-        if response.status_code >= 400:
-            raise RuntimeError(
-                f"Slack publish failed: {response.status_code} {response.text[:200]}"
-            )
-        return True
+        return payload
+
+    def _post(self, payload: dict, timeout: float, deadline: Deadline | None = None) -> None:
+        if self._session is None:
+            self._session = requests.Session()
+
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            retry_after: str | None = None
+            try:
+                response = self._session.post(self.webhook_url, json=payload, timeout=timeout)
+            except requests.RequestException:
+                if attempt == MAX_ATTEMPTS:
+                    raise
+            else:
+                metrics.record_http(len(response.content))
+                if response.status_code < 400:
+                    return
+                error = f"{response.status_code} {response.text[:200]}"
+                if response.status_code != 429 and response.status_code < 500:
+                    raise SlackRejectedError(error)
+                if attempt == MAX_ATTEMPTS:
+                    raise RuntimeError(error)
+                retry_after = response.headers.get("Retry-After")
+            delay = _backoff_seconds(attempt, retry_after)
+            if deadline is not None and delay >= deadline.remaining():
+                # No time left to wait out the backoff; the outbox keeps the chunk for later.
+                raise RuntimeError(f"Slack retry needs {delay:.0f}s but the run deadline is near")
+            time.sleep(delay)
 
     @staticmethod
     def _intro(selected: list[ScoredDisclosure], run_dt: datetime) -> str:
@@ -77,3 +186,12 @@ def _chunk_text(text: str, size: int) -> list[str]:
         chunks.append(text[start:end].strip())
         start = end
     return [chunk for chunk in chunks if chunk]
+
+
+def _backoff_seconds(attempt: int, retry_after: str | None) -> float:
+    # Slack sends Retry-After (seconds) with 429s; otherwise back off exponentially.
+    try:
+        delay = float(retry_after) if retry_after else 2.0 ** (attempt - 1)
+    except ValueError:
+        delay = 2.0 ** (attempt - 1)
+    return min(MAX_BACKOFF_SECONDS, max(0.0, delay))
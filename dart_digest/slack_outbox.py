@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+PENDING = "pending"
+DELIVERED = "delivered"
+# Terminal: rejected by Slack or out of attempts; kept for inspection, never retried.
+FAILED = "failed"
+
+# Failed flushes (each already retried in-process) before a chunk is given up on.
+MAX_DELIVERY_ATTEMPTS = 5
+
+
+@dataclass
+class OutboxMessage:
+    id: int
+    destination: str
+    report_key: str
+    seq: int
+    idempotency_key: str
+    payload: dict
+    attempts: int
+
+
+class SlackOutbox:
+    def __init__(
+        self,
+        db_path: Path,
+        retention_seconds: float = 30 * 86400,
+        max_attempts: int = MAX_DELIVERY_ATTEMPTS,
+    ) -> None:
+        self.db_path = db_path
+        self.retention_seconds = retention_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.delivered = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path)
+
+    def _init_db(self) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS slack_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    report_key TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    idempotency_key TEXT NOT NULL UNIQUE,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    delivered_at REAL
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(slack_outbox)")}
+            if "destination" not in columns:
+                # Output profile the chunk belongs to ("" is the default webhook).
+                conn.execute(
+                    "ALTER TABLE slack_outbox ADD COLUMN destination TEXT NOT NULL DEFAULT ''"
+                )
+            conn.commit()
+
+    @staticmethod
+    def report_key_for(payloads: list[dict], destination: str = "") -> str:
+        # The same report sent to two profiles is two deliveries, not a duplicate.
+        keyed: object = [destination, payloads] if destination else payloads
+        encoded = json.dumps(keyed, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+    def enqueue(self, payloads: list[dict], destination: str = "") -> str:
+        # Re-enqueueing the same report is a no-op, so delivered chunks are never re-sent.
+        report_key = self.report_key_for(payloads, destination)
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO slack_outbox
+                    (destination, report_key, seq, idempotency_key, payload, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        destination,
+                        report_key,
+                        seq,
+                        f"{report_key}:{seq}",
+                        json.dumps(payload, ensure_ascii=False),
+                        PENDING,
+                        now,
+                    )
+                    for seq, payload in enumerate(payloads, start=1)
+                ],
+            )
+            conn.execute(
+                "DELETE FROM slack_outbox WHERE status = ? AND delivered_at < ?",
+                (DELIVERED, now - self.retention_seconds),
+            )
+            conn.execute(
+                "DELETE FROM slack_outbox WHERE status = ? AND created_at < ?",
+                (FAILED, now - self.retention_seconds),
+            )
+            conn.commit()
+        return report_key
+
+    def pending(self, destination: str | None = None) -> list[OutboxMessage]:
+        query = """
+            SELECT id, destination, report_key, seq, idempotency_key, payload, attempts
+            FROM slack_outbox WHERE status = ?
+        """
+        params: tuple = (PENDING,)
+        if destination is not None:
+            query += " AND destination = ?"
+            params += (destination,)
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY id", params).fetchall()
+        return [
+            OutboxMessage(
+                id=row[0],
+                destination=row[1],
+                report_key=row[2],
+                seq=row[3],
+                idempotency_key=row[4],
+                payload=json.loads(row[5]),
+                attempts=row[6],
+            )
+            for row in rows
+        ]
+
+    def mark_delivered(self, message: OutboxMessage) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                UPDATE slack_outbox
+                SET status = ?, attempts = attempts + 1, last_error = NULL, delivered_at = ?
+                WHERE id = ?
+                """,
+                (DELIVERED, time.time(), message.id),
+            )
+            conn.commit()
+        self.delivered += 1
+
+    def mark_failed(self, message: OutboxMessage, error: str, permanent: bool = False) -> bool:
+        # Returns True when the chunk is given up on. Its report can no longer be delivered
+        # intact, so the report's later chunks are failed with it instead of posted alone.
+        dead = permanent or message.attempts + 1 >= self.max_attempts
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE slack_outbox SET attempts = attempts + 1, last_error = ? WHERE id = ?",
+                (error[:500], message.id),
+            )
+            if dead:
+                conn.execute(
+                    """
+                    UPDATE slack_outbox SET status = ?, last_error = COALESCE(last_error, ?)
+                    WHERE status = ? AND destination = ? AND report_key = ? AND seq >= ?
+                    """,
+                    (
+                        FAILED,
+                        f"chunk {message.seq} failed",
+                        PENDING,
+                        message.destination,
+                        message.report_key,
+                        message.seq,
+                    ),
+                )
+            conn.commit()
+        return dead
+
+    def pending_by_destination(self) -> dict[str, int]:
+        with self._connect() as conn:
+            return dict(
+                conn.execute(
+                    "SELECT destination, COUNT(*) FROM slack_outbox WHERE status = ? "
+                    "GROUP BY destination",
+                    (PENDING,),
+                ).fetchall()
+            )
+
+    def failed_chunks(self, report_key: str) -> int:
+        with self._connect() as conn:
+            (failed,) = conn.execute(
+                "SELECT COUNT(*) FROM slack_outbox WHERE status = ? AND report_key = ?",
+                (FAILED, report_key),
+            ).fetchone()
+        return failed
+
+    def stats(self) -> dict[str, float]:
+        with self._connect() as conn:
+            counts = dict(
+                conn.execute(
+                    "SELECT status, COUNT(*) FROM slack_outbox WHERE status IN (?, ?) "
+                    "GROUP BY status",
+                    (PENDING, FAILED),
+                ).fetchall()
+            )
+        return {
+            "pending": counts.get(PENDING, 0),
+            "failed": counts.get(FAILED, 0),
+            "delivered": self.delivered,
+        }
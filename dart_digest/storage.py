@@ -8,6 +8,9 @@ from pathlib import Path
 from dart_digest.models import DailySelection, ScoredDisclosure
 
 
+SQL_PARAM_CHUNK = 500
+
+
 class Storage:
     def __init__(self, db_path: Path) -> None:
         self.db_path = db_path
@@ -54,10 +57,36 @@ class Storage:
             ).fetchone()
             return row is not None
 
+    def processed_among(
+        self,
+        receipt_nos: list[str],
+        seen_before: str | None = None,
+    ) -> set[str]:
+        # One query per batch instead of one per disclosure. With `seen_before`, rows
+        # marked at or after that UTC timestamp do not count as processed.
+        found: set[str] = set()
+        with self._connect() as conn:
+            # Chunked to stay under SQLite's bound-parameter limit (999 on older builds).
+            for start in range(0, len(receipt_nos), SQL_PARAM_CHUNK):
+                chunk = receipt_nos[start : start + SQL_PARAM_CHUNK]
+                query = (
+                    "SELECT receipt_no FROM processed_disclosures "
+                    f"WHERE receipt_no IN ({','.join('?' * len(chunk))})"
+                )
+                params = list(chunk)
+                if seen_before is not None:
+                    query += " AND last_seen_at < ?"
+                    params.append(seen_before)
+                found.update(row[0] for row in conn.execute(query, params))
+        return found
+
     def mark_processed(self, scored: ScoredDisclosure) -> None:
+        self.mark_processed_many([scored])
+
+    def mark_processed_many(self, items: list[ScoredDisclosure]) -> None:
         now = datetime.utcnow().isoformat(timespec="seconds")
         with self._connect() as conn:
-            conn.execute(
+            conn.executemany(
                 """
                 INSERT INTO processed_disclosures
                 (receipt_no, company_name, title, event_type, total_score, published_at, last_seen_at)
@@ -70,15 +99,18 @@ class Storage:
                     published_at = excluded.published_at,
                     last_seen_at = excluded.last_seen_at
                 """,
-                (
-                    scored.disclosure.receipt_no,
-                    scored.disclosure.company_name,
-                    scored.disclosure.title,
-                    scored.event_type,
-                    scored.total_score,
-                    scored.disclosure.published_at.isoformat(timespec="seconds"),
-                    now,
-                ),
+                [
+                    (
+                        scored.disclosure.receipt_no,
+                        scored.disclosure.company_name,
+                        scored.disclosure.title,
+                        scored.event_type,
+                        scored.total_score,
+                        scored.disclosure.published_at.isoformat(timespec="seconds"),
+                        now,
+                    )
+                    for scored in items
+                ],
             )
             conn.commit()
 
@@ -92,6 +124,9 @@ class Storage:
 
     def save_report(self, selection: DailySelection) -> None:
         report_date = selection.run_date.isoformat(timespec="seconds")
+        if selection.profile:
+            # One row per output profile; the unsuffixed key stays the default report.
+            report_date = f"{report_date}#{selection.profile}"
         receipt_nos = [item.disclosure.receipt_no for item in selection.selected]
         with self._connect() as conn:
             conn.execute(
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable, Iterator, TypeVar
+
+from dart_digest import metrics
+from dart_digest.market_filter import MarketFilter
+from dart_digest.models import Disclosure, ScoredDisclosure
+from dart_digest.score_cache import ScoreCache
+from dart_digest.scoring import score_disclosures
+from dart_digest.storage import Storage
+
+
+T = TypeVar("T")
+
+# Stages over batches: each step holds one batch at a time, so a run's peak memory
+# depends on the batch size rather than on how many disclosures flow through.
+# Every batch is timed under the same stage name (metrics accumulate per name), and
+# batches are yielded outside the stage so downstream work is not billed to it.
+
+
+@dataclass
+class StreamCounts:
+    fetched: int = 0
+    in_market: int = 0
+    candidates: int = 0
+    scored: int = 0
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, max(1, size)))
+        if not batch:
+            return
+        yield batch
+
+
+def filter_markets(
+    batches: Iterable[list[Disclosure]],
+    market_filter: MarketFilter,
+    counts: StreamCounts,
+) -> Iterator[list[Disclosure]]:
+    for batch in batches:
+        counts.fetched += len(batch)
+        with metrics.stage("filter", items_in=len(batch), accumulate=True) as stage:
+            kept = market_filter.filter(batch)
+            stage.items_out += len(kept)
+        counts.in_market += len(kept)
+        if kept:
+            yield kept
+
+
+def drop_processed(
+    batches: Iterable[list[Disclosure]],
+    storage: Storage,
+    counts: StreamCounts,
+    force: bool = False,
+    seen_before: str | None = None,
+) -> Iterator[list[Disclosure]]:
+    for batch in batches:
+        with metrics.stage("dedup", items_in=len(batch), accumulate=True) as stage:
+            if force:
+                fresh = batch
+            else:
+                processed = storage.processed_among(
+                    [item.receipt_no for item in batch], seen_before=seen_before
+                )
+                fresh = [item for item in batch if item.receipt_no not in processed]
+            stage.items_out += len(fresh)
+        counts.candidates += len(fresh)
+        if fresh:
+            yield fresh
+
+
+def score_batches(
+    batches: Iterable[list[Disclosure]],
+    counts: StreamCounts,
+    cache: ScoreCache | None = None,
+    workers: int = 1,
+    parallel_threshold: int = 5000,
+    executor: Executor | None = None,
+) -> Iterator[list[ScoredDisclosure]]:
+    # Pass one `executor` for the whole stream: batches are far smaller than the parallel
+    # threshold, and a pool per batch would pay process start-up again every time.
+    for batch in batches:
+        with metrics.stage("score", items_in=len(batch), accumulate=True) as stage:
+            scored = score_disclosures(
+                batch,
+                cache=cache,
+                workers=workers,
+                parallel_threshold=parallel_threshold,
+                executor=executor,
+            )
+            stage.items_out += len(scored)
+        counts.scored += len(scored)
+        yield scored
+
+
+def mark_processed(
+    batches: Iterable[list[ScoredDisclosure]],
+    storage: Storage,
+) -> Iterator[list[ScoredDisclosure]]:
+    # One transaction per batch; billed to the score stage, which used to do the marking.
+    for batch in batches:
+        with metrics.stage("score", accumulate=True):
+            storage.mark_processed_many(batch)
+        yield batch
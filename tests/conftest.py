@@ -0,0 +1,81 @@
+from dataclasses import fields, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from dart_digest.config import Settings
+from dart_digest.models import Disclosure, ScoredDisclosure
+
+
+_DISCLOSURE_FIELDS = {item.name for item in fields(Disclosure)} - {"market"}
+
+
+@pytest.fixture
+def make_settings(tmp_path: Path) -> Callable[..., Settings]:
+    # Offline baseline for tests: dry run, no keys or webhooks, a two-company map in
+    # tmp_path. Each test overrides only what it exercises.
+    csv_path = tmp_path / "companies.csv"
+    csv_path.write_text(
+        "company_name,ticker,market\n삼성전자,005930,KOSPI\n카카오,035720,KOSDAQ\n",
+        encoding="utf-8",
+    )
+    base = Settings(
+        rss_url="https://example.com/rss.xml",
+        db_path=tmp_path / "digest.db",
+        company_map_path=csv_path,
+        target_markets=("KOSPI",),
+        dart_api_key=None,
+        timezone="Asia/Seoul",
+        top_n_max=2,
+        second_pick_min_score=78.0,
+        second_pick_min_gap=6.0,
+        openai_api_key=None,
+        openai_model="gpt-4.1-mini",
+        slack_webhook_url=None,
+        slack_channel=None,
+        notify_on_skip=False,
+        require_slack_webhook=False,
+        dry_run=True,
+    )
+
+    def make(**overrides: Any) -> Settings:
+        return replace(base, **overrides)
+
+    return make
+
+
+@pytest.fixture
+def make_scored() -> Callable[..., ScoredDisclosure]:
+    # A scored capital-raise disclosure; keyword overrides go to the Disclosure or the
+    # score fields by name (`market` is the scored one).
+    def make(
+        company: str = "테스트전자",
+        receipt_no: str = "20260227000001",
+        **overrides: Any,
+    ) -> ScoredDisclosure:
+        disclosure: dict[str, Any] = {
+            "company_name": company,
+            "title": f"{company} (유상증자결정)",
+            "link": f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={receipt_no}",
+            "receipt_no": receipt_no,
+            "published_at": datetime(2026, 2, 27, 10, 0, 0),
+            "description": "1.2조원 규모 자금조달",
+        }
+        scores: dict[str, Any] = {
+            "market": "KOSPI",
+            "event_type": "지배구조/자본변동",
+            "event_score": 95.0,
+            "financial_score": 90.0,
+            "persistence_score": 88.0,
+            "confidence_score": 80.0,
+            "market_bonus": 5.0,
+            "total_score": 90.4,
+            "reasons": [],
+        }
+        for name, value in overrides.items():
+            (disclosure if name in _DISCLOSURE_FIELDS else scores)[name] = value
+        return ScoredDisclosure(disclosure=Disclosure(**disclosure), **scores)
+
+    return make
@@ -0,0 +1,62 @@
+import threading
+from typing import Callable
+
+import dart_digest.article_writer as article_writer_module
+from dart_digest.article_writer import ArticleWriter
+from dart_digest.config import Settings
+from dart_digest.models import ScoredDisclosure
+from dart_digest.news_client import NewsItem
+
+
+def test_related_news_is_collected_concurrently_with_deadline(
+    make_settings: Callable[..., Settings], make_scored: Callable[..., ScoredDisclosure]
+) -> None:
+    release = threading.Event()
+    started: list[str] = []
+
+    def fake_search(company_name: str, **_kwargs: object) -> list[NewsItem]:
+        started.append(company_name)
+        if company_name == "느린회사":
+            release.wait(timeout=5)
+        return [NewsItem(f"{company_name} 기사", "https://news.example.com", "예시", "2026-02-27", 1.0)]
+
+    selected = [
+        make_scored(
+            company,
+            receipt_no,
+            title=f"{company} (단일판매ㆍ공급계약 체결)",
+            description="",
+            event_type="수주/계약",
+            event_score=85.0,
+            financial_score=60.0,
+            persistence_score=82.0,
+            confidence_score=70.0,
+            total_score=84.0,
+        )
+        for company, receipt_no in [
+            ("삼성전자", "20260227000001"),
+            ("느린회사", "20260227000002"),
+            ("카카오", "20260227000003"),
+        ]
+    ]
+
+    settings = make_settings(
+        target_markets=("KOSPI", "KOSDAQ"),
+        top_n_max=3,
+        notify_on_skip=True,
+        news_max_workers=4,
+        news_deadline_seconds=0.3,
+    )
+    original = article_writer_module.search_related_news
+    article_writer_module.search_related_news = fake_search
+    try:
+        news_map = ArticleWriter(settings)._collect_related_news(selected)
+    finally:
+        release.set()
+        article_writer_module.search_related_news = original
+
+    assert sorted(started) == sorted(["삼성전자", "느린회사", "카카오"])
+    assert list(news_map) == ["20260227000001", "20260227000002", "20260227000003"]
+    assert news_map["20260227000001"][0].title == "삼성전자 기사"
+    assert news_map["20260227000002"] == []
+    assert news_map["20260227000003"][0].title == "카카오 기사"
@@ -0,0 +1,122 @@
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Callable, Iterator
+
+import pytest
+import requests
+from urllib3.exceptions import ReadTimeoutError
+
+import dart_digest.article_writer as article_writer_module
+from dart_digest.article_writer import ArticleWriter
+from dart_digest.config import Settings
+from dart_digest.models import ScoredDisclosure
+
+
+class _FakeStream:
+    def __init__(self, lines: list[str], delay: float = 0.0) -> None:
+        self.lines = lines
+        self.delay = delay
+
+    def __enter__(self) -> "_FakeStream":
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def iter_lines(self) -> Iterator[bytes]:
+        for line in self.lines:
+            time.sleep(self.delay)
+            yield line.encode("utf-8")
+
+
+def _sse(event: dict) -> list[str]:
+    return [f"event: {event['type']}", f"data: {json.dumps(event, ensure_ascii=False)}", ""]
+
+
+@pytest.fixture
+def write_with_stream(
+    make_settings: Callable[..., Settings], make_scored: Callable[..., ScoredDisclosure]
+) -> Callable[[_FakeStream], tuple[str, ArticleWriter]]:
+    settings = make_settings(
+        openai_api_key="sk-test",
+        news_cache_ttl_minutes=0,
+        openai_first_token_timeout_seconds=0.2,
+        openai_total_timeout_seconds=1.0,
+    )
+
+    def write(stream: _FakeStream) -> tuple[str, ArticleWriter]:
+        original_post = article_writer_module.requests.post
+        original_news = article_writer_module.search_related_news
+        article_writer_module.requests.post = lambda *_args, **_kwargs: stream
+        article_writer_module.search_related_news = lambda **_kwargs: []
+        try:
+            writer = ArticleWriter(settings)
+            article = writer.write([make_scored()], datetime(2026, 2, 27, 18, 10, 0))
+        finally:
+            article_writer_module.requests.post = original_post
+            article_writer_module.search_related_news = original_news
+        return article, writer
+
+    return write
+
+
+def test_streamed_article_is_assembled_from_deltas(write_with_stream: Callable) -> None:
+    lines = (
+        _sse({"type": "response.output_text.delta", "delta": "# 테스트전자 심층\n"})
+        + _sse({"type": "response.output_text.delta", "delta": "### 관련 뉴스 요약\n- 없음"})
+        + _sse({"type": "response.completed", "response": {}})
+    )
+    article, writer = write_with_stream(_FakeStream(lines))
+
+    assert article == "# 테스트전자 심층\n### 관련 뉴스 요약\n- 없음"
+    assert writer.last_generation.outcome == "completed"
+    assert writer.last_generation.first_token_seconds is not None
+
+
+def test_slow_first_token_falls_back_to_template(write_with_stream: Callable) -> None:
+    lines = _sse({"type": "response.output_text.delta", "delta": "늦은 응답"})
+    article, writer = write_with_stream(_FakeStream(lines, delay=0.15))
+
+    assert writer.last_generation.outcome == "first_token_timeout"
+    assert "투자자 관점 해석" in article
+
+
+class _Socket:
+    def __init__(self) -> None:
+        self.timeouts: list[float] = []
+
+    def settimeout(self, seconds: float) -> None:
+        self.timeouts.append(seconds)
+
+
+class _StalledStream(_FakeStream):
+    # Delivers some lines, then the socket read times out the way requests reports it.
+    def __init__(self, lines: list[str]) -> None:
+        super().__init__(lines)
+        self.sock = _Socket()
+        self.raw = SimpleNamespace(connection=SimpleNamespace(sock=self.sock))
+
+    def iter_lines(self) -> Iterator[bytes]:
+        yield from super().iter_lines()
+        try:
+            raise ReadTimeoutError(None, "/responses", "Read timed out.")
+        except ReadTimeoutError as exc:
+            raise requests.ConnectionError(exc)
+
+
+def test_stalled_stream_is_a_timeout_not_an_http_error(write_with_stream: Callable) -> None:
+    stream = _StalledStream(_sse({"type": "response.output_text.delta", "delta": "일부"}))
+    article, writer = write_with_stream(stream)
+
+    assert writer.last_generation.outcome == "total_timeout"
+    assert "투자자 관점 해석" in article
+    # Each read is bounded by what is left of the 1s total budget.
+    assert stream.sock.timeouts and all(0 < value <= 1.0 for value in stream.sock.timeouts)
+
+    _, writer = write_with_stream(_StalledStream([]))
+    assert writer.last_generation.outcome == "first_token_timeout"
@@ -0,0 +1,98 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+import dart_digest.backtest as backtest_module
+from benchmarks import synthetic
+from benchmarks.hot_paths import bench_settings
+from dart_digest.backtest import compare_reports, format_report, load_fixture, run_backtest
+from dart_digest.cli import main
+
+
+DATES = ["20260302", "20260303", "20260304"]
+
+
+def _write_fixtures(fixture_dir: Path) -> None:
+    fixture_dir.mkdir()
+    for seed, target_date in enumerate(DATES[:2]):
+        pages = synthetic.make_opendart_pages(300, page_count=100, seed=seed)
+        (fixture_dir / f"{target_date}.json").write_text(
+            json.dumps(pages, ensure_ascii=False), encoding="utf-8"
+        )
+    (fixture_dir / f"{DATES[2]}.xml").write_text(synthetic.make_rss_xml(200), encoding="utf-8")
+
+
+def test_backtest_replays_fixtures_across_workers(tmp_path: Path) -> None:
+    settings = bench_settings(tmp_path)
+    fixture_dir = tmp_path / "fixtures"
+    _write_fixtures(fixture_dir)
+
+    report = run_backtest(settings, fixture_dir, DATES + ["20260305"], workers=2)
+
+    assert report["workers"] == 2
+    assert report["missing_dates"] == ["20260305"]
+    assert [day["date"] for day in report["days"]] == DATES
+    assert [day["disclosures"] for day in report["days"]] == [300, 300, 200]
+    summary = report["summary"]
+    assert summary["days_with_picks"] == 3
+    assert summary["scored"] == sum(day["scored"] for day in report["days"])
+    assert sum(summary["event_mix_scored"].values()) == summary["scored"]
+    assert summary["disclosures_per_second"] > 0
+    assert "20260302" in format_report(report)
+    assert not (tmp_path / "bench.db").exists()
+
+    serial = run_backtest(settings, fixture_dir, DATES, workers=1)
+    assert [day["picks"] for day in serial["days"]] == [day["picks"] for day in report["days"]]
+
+
+def test_backtest_compare_flags_days_whose_picks_changed(tmp_path: Path) -> None:
+    settings = bench_settings(tmp_path)
+    fixture_dir = tmp_path / "fixtures"
+    _write_fixtures(fixture_dir)
+
+    baseline = run_backtest(settings, fixture_dir, DATES, workers=1)
+    stricter = run_backtest(replace(settings, top_n_max=1), fixture_dir, DATES, workers=1)
+
+    diff = compare_reports(baseline, stricter)
+    assert diff["days_compared"] == 3
+    assert diff["days_changed"] == 3
+    assert diff["picks"] == -3
+    assert compare_reports(baseline, baseline)["agreement"] == 1.0
+
+
+def test_load_fixture_dedups_receipts_across_pages(tmp_path: Path) -> None:
+    page = synthetic.make_opendart_pages(5)[0]
+    path = tmp_path / "20260302.json"
+    path.write_text(json.dumps([page, page], ensure_ascii=False), encoding="utf-8")
+
+    assert len(load_fixture(path, "20260302")) == 5
+
+
+def test_backtest_cli_rejects_a_bad_baseline_before_replaying(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / "baseline.json").write_text('{"not": "a report"}', encoding="utf-8")
+    original_run = backtest_module.run_backtest
+    backtest_module.run_backtest = lambda *_args, **_kwargs: pytest.fail("replayed anyway")
+    try:
+        for baseline in (tmp_path / "missing.json", tmp_path / "baseline.json"):
+            code = main(
+                [
+                    "backtest",
+                    "--from",
+                    DATES[0],
+                    "--fixtures",
+                    str(tmp_path),
+                    "--compare",
+                    str(baseline),
+                ]
+            )
+            assert code == 1
+    finally:
+        backtest_module.run_backtest = original_run
+
+    errors = capsys.readouterr().err.splitlines()
+    assert len(errors) == 2 and all(line.startswith("[error] ") for line in errors)
+    assert "not a backtest report" in errors[1]
@@ -0,0 +1,16 @@
+from benchmarks.hot_paths import compare, run_suite
+
+
+def test_benchmark_suite_runs_offline_and_flags_regressions() -> None:
+    report = run_suite(sizes=(10,), repeat=1)
+    names = {row["name"] for row in report["results"]}
+    assert {"parse_disclosures", "market_filter", "score_disclosures", "pick_top"} <= names
+
+    slower = {
+        "results": [
+            {**row, "median_s": row["median_s"] * 2 + 0.001} for row in report["results"]
+        ]
+    }
+    rows = compare(report, slower, threshold=0.2)
+    assert rows and all(row["regression"] for row in rows)
+    assert not any(row["regression"] for row in compare(report, report))
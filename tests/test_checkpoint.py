@@ -0,0 +1,220 @@
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+import dart_digest.article_writer as article_writer_module
+import dart_digest.pipeline as pipeline_module
+from dart_digest.checkpoint import DONE, FETCHED, SELECTED, STAGES, WRITTEN, CheckpointStore
+from dart_digest.config import Settings
+from dart_digest.dart_client import parse_disclosures
+from dart_digest.pipeline import DigestPipeline
+from dart_digest.scoring import score_disclosures
+from dart_digest.slack_client import SlackPublisher
+
+
+SAMPLE_XML = """<?xml version=\"1.0\" encoding=\"utf-8\"?>
+<rss><channel>
+  <item>
+    <title>삼성전자 (유상증자결정)</title>
+    <link>https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20260228000001</link>
+    <description>1.2조원 규모 자금 조달, 신주 발행비율 20%</description>
+    <pubDate>Sat, 28 Feb 2026 09:00:00 +0900</pubDate>
+  </item>
+</channel></rss>"""
+
+
+def _live_settings(make_settings: Callable[..., Settings]) -> Settings:
+    return make_settings(
+        second_pick_min_score=70.0,
+        second_pick_min_gap=15.0,
+        slack_webhook_url="https://hooks.example/digest",
+        dry_run=False,
+    )
+
+
+def test_checkpoint_round_trips_selected_items(tmp_path: Path) -> None:
+    store = CheckpointStore(tmp_path / "digest.db")
+    run_dt = datetime(2026, 2, 28, 18, 10)
+    checkpoint = store.start(CheckpointStore.run_key_for(run_dt, "20260228"), run_dt)
+    scored = score_disclosures(parse_disclosures(SAMPLE_XML))
+    checkpoint.scoring_since = "2026-02-28T09:10:00"
+    checkpoint.selections = {"": scored, "kospi": []}
+    store.save(checkpoint, SELECTED)
+
+    loaded = store.load("date:20260228")
+    assert loaded is not None
+    assert loaded.stage == SELECTED and not loaded.reached(DONE)
+    assert loaded.run_dt == run_dt
+    assert loaded.scoring_since == "2026-02-28T09:10:00"
+    assert loaded.selections == {"": scored, "kospi": []}
+
+
+def test_fetched_disclosures_are_stored_once_and_dropped_after_selection(
+    tmp_path: Path,
+) -> None:
+    store = CheckpointStore(tmp_path / "digest.db")
+    run_dt = datetime(2026, 2, 28, 18, 10)
+    checkpoint = store.start("rss:20260228", run_dt)
+    disclosures = parse_disclosures(SAMPLE_XML)
+    checkpoint.disclosures = disclosures
+    store.save(checkpoint, FETCHED)
+
+    def stored() -> tuple[str, str | None]:
+        with sqlite3.connect(tmp_path / "digest.db") as conn:
+            return conn.execute(
+                "SELECT payload, disclosures FROM run_checkpoints WHERE run_key = ?",
+                ("rss:20260228",),
+            ).fetchone()
+
+    payload, column = stored()
+    assert "disclosures" not in json.loads(payload)
+    assert column is not None
+
+    # Small updates leave the stored list alone; resume still gets it back.
+    checkpoint.scoring_since = "2026-02-28T09:10:00"
+    store.save(checkpoint)
+    assert stored()[1] == column
+    assert store.load("rss:20260228").disclosures == disclosures
+
+    checkpoint.selections = {"": []}
+    store.save(checkpoint, SELECTED)
+    assert stored()[1] is None
+    assert checkpoint.disclosures is None
+    assert store.load("rss:20260228").disclosures is None
+
+
+def test_resume_skips_finished_stages(make_settings: Callable[..., Settings]) -> None:
+    settings = _live_settings(make_settings)
+    fetches: list[str] = []
+    writes: list[int] = []
+    posts: list[dict] = []
+    fail_posts = [True]
+
+    def fake_fetch(url: str, **_kwargs: object) -> str:
+        fetches.append(url)
+        return SAMPLE_XML
+
+    def fake_post(self: SlackPublisher, payload: dict, timeout: float, _deadline=None) -> None:
+        if fail_posts[0]:
+            raise RuntimeError("503 slack unavailable")
+        posts.append(payload)
+
+    original_write = article_writer_module.ArticleWriter.write
+
+    def counting_write(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        writes.append(1)
+        return original_write(self, *args, **kwargs)
+
+    original_fetch = pipeline_module.fetch_today_rss
+    original_search = article_writer_module.search_related_news
+    original_post = SlackPublisher._post
+    pipeline_module.fetch_today_rss = fake_fetch
+    article_writer_module.search_related_news = lambda **_kwargs: []
+    article_writer_module.ArticleWriter.write = counting_write
+    SlackPublisher._post = fake_post
+    try:
+        with pytest.raises(RuntimeError):
+            DigestPipeline(settings).run(force=False)
+
+        fail_posts[0] = False
+        resumed = DigestPipeline(settings).run(force=False, resume=True)
+        again = DigestPipeline(settings).run(force=False, resume=True)
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+        article_writer_module.search_related_news = original_search
+        article_writer_module.ArticleWriter.write = original_write
+        SlackPublisher._post = original_post
+
+    assert resumed.status == "completed"
+    assert resumed.selection is not None
+    assert resumed.selection.selected[0].disclosure.company_name == "삼성전자"
+    assert len(fetches) == 1
+    assert len(writes) == 1
+    assert len(posts) == 1
+    counters = resumed.metrics.to_dict()["counters"]
+    assert counters["checkpoint_resumed_stage"] >= STAGES.index(WRITTEN)
+    stages = {stage.name for stage in resumed.metrics.stages}
+    assert not {"fetch", "score", "select", "news"} & stages
+
+    assert again.status == "skipped"
+    assert "nothing to resume" in again.message
+
+
+def test_resume_rescores_items_marked_by_the_failed_run(
+    make_settings: Callable[..., Settings],
+) -> None:
+    settings = _live_settings(make_settings)
+    original_fetch = pipeline_module.fetch_today_rss
+    original_select = pipeline_module.TopKSelector.select
+    original_search = article_writer_module.search_related_news
+    original_post = SlackPublisher._post
+
+    def failing_select(self):  # type: ignore[no-untyped-def]
+        raise RuntimeError("crashed after marking")
+
+    pipeline_module.fetch_today_rss = lambda _url, **_kwargs: SAMPLE_XML
+    pipeline_module.TopKSelector.select = failing_select
+    article_writer_module.search_related_news = lambda **_kwargs: []
+    SlackPublisher._post = lambda self, payload, timeout, _deadline=None: None
+    try:
+        with pytest.raises(RuntimeError):
+            DigestPipeline(settings).run(force=False)
+        pipeline_module.TopKSelector.select = original_select
+        resumed = DigestPipeline(settings).run(force=False, resume=True)
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+        pipeline_module.TopKSelector.select = original_select
+        article_writer_module.search_related_news = original_search
+        SlackPublisher._post = original_post
+
+    assert resumed.status == "completed"
+    assert resumed.selection is not None
+    assert resumed.selection.selected[0].disclosure.receipt_no == "20260228000001"
+
+
+def test_fresh_start_drops_an_earlier_attempts_fetched_list(
+    make_settings: Callable[..., Settings],
+) -> None:
+    settings = _live_settings(make_settings)
+    fetches: list[str] = []
+    feeds = [SAMPLE_XML, None, SAMPLE_XML]
+
+    def fake_fetch(url: str, **_kwargs: object) -> str:
+        feed = feeds[len(fetches)]
+        fetches.append(url)
+        if feed is None:
+            raise RuntimeError("DART unavailable")
+        return feed
+
+    def failing_select(self):  # type: ignore[no-untyped-def]
+        raise RuntimeError("crashed after fetching")
+
+    original_fetch = pipeline_module.fetch_today_rss
+    original_select = pipeline_module.TopKSelector.select
+    original_search = article_writer_module.search_related_news
+    original_post = SlackPublisher._post
+    pipeline_module.fetch_today_rss = fake_fetch
+    article_writer_module.search_related_news = lambda **_kwargs: []
+    SlackPublisher._post = lambda self, payload, timeout, _deadline=None: None
+    try:
+        pipeline_module.TopKSelector.select = failing_select
+        with pytest.raises(RuntimeError):
+            DigestPipeline(settings).run(force=False)
+        pipeline_module.TopKSelector.select = original_select
+        # A fresh (non-resume) run starts over and fails before its fetch finishes.
+        with pytest.raises(RuntimeError):
+            DigestPipeline(settings).run(force=False)
+        resumed = DigestPipeline(settings).run(force=False, resume=True)
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+        pipeline_module.TopKSelector.select = original_select
+        article_writer_module.search_related_news = original_search
+        SlackPublisher._post = original_post
+
+    # The resume fetched again instead of reusing the first attempt's list.
+    assert len(fetches) == 3
+    assert "fetch" in {stage.name for stage in resumed.metrics.stages}
@@ -0,0 +1,158 @@
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+import dart_digest.article_writer as article_writer_module
+import dart_digest.pipeline as pipeline_module
+from dart_digest.article_writer import ArticleWriter
+from dart_digest.circuit_breaker import CircuitBreaker, CircuitOpenError
+from dart_digest.config import Settings
+from dart_digest.models import ScoredDisclosure
+from dart_digest.pipeline import DigestPipeline
+from dart_digest.slack_client import SlackPublisher
+
+
+def _failing() -> None:
+    raise RuntimeError("upstream down")
+
+
+def test_breaker_opens_on_failure_rate_and_persists(tmp_path: Path) -> None:
+    breaker = CircuitBreaker("news", tmp_path / "digest.db", failure_rate=0.5, min_calls=4)
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.allow()
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+    # A later cron run reads the open state back and skips the call without running it.
+    reloaded = CircuitBreaker("news", tmp_path / "digest.db", failure_rate=0.5, min_calls=4)
+    with pytest.raises(CircuitOpenError):
+        reloaded.call(lambda: pytest.fail("call should have been skipped"))
+    assert reloaded.stats()["rejected"] == 1
+
+
+def test_half_open_lets_one_probe_through(tmp_path: Path) -> None:
+    db_path = tmp_path / "digest.db"
+    breaker = CircuitBreaker("dart", db_path, min_calls=1, cooldown_seconds=0)
+    with pytest.raises(RuntimeError):
+        breaker.call(_failing)
+    assert breaker.state == "open"
+
+    # Cooldown elapsed: the first caller probes, the next one is held back.
+    breaker.cooldown_seconds = 60
+    breaker.opened_at = 0.0
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    breaker.opened_at = 0.0
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == "closed"
+    assert CircuitBreaker("dart", db_path).state == "closed"
+
+
+def test_open_openai_breaker_skips_the_request(
+    make_settings: Callable[..., Settings], make_scored: Callable[..., ScoredDisclosure]
+) -> None:
+    settings = make_settings(openai_api_key="sk-test")
+    breaker = CircuitBreaker.from_settings("openai", settings)
+    for _ in range(settings.breaker_min_calls):
+        breaker.record_failure()
+
+    selected = [make_scored()]
+
+    original_post = article_writer_module.requests.post
+    original_news = article_writer_module.search_related_news
+    article_writer_module.requests.post = lambda *_a, **_k: pytest.fail("OpenAI was called")
+    article_writer_module.search_related_news = lambda **_kwargs: []
+    try:
+        writer = ArticleWriter(settings, openai_breaker=breaker)
+        article = writer.write(selected, datetime(2026, 2, 27, 18, 10, 0))
+    finally:
+        article_writer_module.requests.post = original_post
+        article_writer_module.search_related_news = original_news
+
+    assert writer.last_generation.outcome == "circuit_open"
+    assert "투자자 관점 해석" in article
+
+
+def test_open_slack_breaker_does_not_turn_a_skip_into_an_error(
+    make_settings: Callable[..., Settings],
+) -> None:
+    settings = make_settings(
+        slack_webhook_url="https://hooks.slack.example/T", notify_on_skip=True, dry_run=False
+    )
+    breaker = CircuitBreaker.from_settings("slack", settings)
+    for _ in range(settings.breaker_min_calls):
+        breaker.record_failure()
+
+    empty_feed = '<?xml version="1.0" encoding="utf-8"?><rss><channel></channel></rss>'
+    original_fetch = pipeline_module.fetch_today_rss
+    pipeline_module.fetch_today_rss = lambda _url, **_kwargs: empty_feed
+    try:
+        pipe = DigestPipeline(settings)
+        result = pipe.run(force=False)
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+
+    assert result.status == "skipped"
+    assert pipe.last_metrics.counters["notify_skipped_breaker_open"] == 1
+
+
+def test_open_slack_breaker_queues_the_report_instead_of_losing_it(
+    make_settings: Callable[..., Settings],
+) -> None:
+    settings = make_settings(
+        second_pick_min_score=70.0,
+        second_pick_min_gap=15.0,
+        slack_webhook_url="https://hooks.slack.example/T",
+        dry_run=False,
+    )
+    breaker = CircuitBreaker.from_settings("slack", settings)
+    for _ in range(settings.breaker_min_calls):
+        breaker.record_failure()
+
+    feed = """<?xml version="1.0" encoding="utf-8"?>
+<rss><channel>
+  <item>
+    <title>삼성전자 (유상증자결정)</title>
+    <link>https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20260228000001</link>
+    <description>1.2조원 규모 자금 조달, 신주 발행비율 20%</description>
+    <pubDate>Sat, 28 Feb 2026 09:00:00 +0900</pubDate>
+  </item>
+</channel></rss>"""
+    posts: list[dict] = []
+    original_fetch = pipeline_module.fetch_today_rss
+    original_search = article_writer_module.search_related_news
+    original_post = SlackPublisher._post
+    pipeline_module.fetch_today_rss = lambda _url, **_kwargs: feed
+    article_writer_module.search_related_news = lambda **_kwargs: []
+    SlackPublisher._post = lambda self, payload, timeout, _deadline=None: posts.append(payload)
+    try:
+        pipe = DigestPipeline(settings)
+        result = pipe.run(force=False)
+        assert result.status == "completed"
+        assert "queued" in result.message
+        assert posts == []
+        assert pipe.outbox.stats()["pending"] >= 1
+        assert pipe.last_metrics.counters["publish_deferred_breaker_open"] == 1
+
+        # Slack recovers: the next run's outbox resume posts the queued report.
+        later = DigestPipeline(replace(settings, breaker_cooldown_minutes=0))
+        assert later.run(force=False).status == "skipped"
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+        article_writer_module.search_related_news = original_search
+        SlackPublisher._post = original_post
+
+    assert posts and "삼성전자" in posts[0]["text"]
+    assert later.outbox.stats()["pending"] == 0
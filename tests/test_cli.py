@@ -0,0 +1,77 @@
+import os
+import sqlite3
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from benchmarks.import_time import DEFAULT_FORBIDDEN, measure
+from dart_digest.cli import main
+from dart_digest.config import Settings
+from dart_digest.pipeline import DigestPipeline
+
+
+def test_importing_cli_skips_network_stack_and_pipeline() -> None:
+    loaded = measure("dart_digest.cli")["modules"]
+    assert "dart_digest.cli" in loaded
+    assert not [name for name in DEFAULT_FORBIDDEN if name in loaded]
+
+
+def test_version_and_config_commands_run_without_data_files(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    overrides = {
+        "DART_DB_PATH": str(tmp_path / "missing" / "digest.db"),
+        "DART_COMPANY_MAP_PATH": str(tmp_path / "missing.csv"),
+        "DART_TIMEZONE": "Asia/Seoul",
+    }
+    original = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    try:
+        assert main(["version"]) == 0
+        assert main(["config"]) == 0
+        os.environ["DART_TIMEZONE"] = "Nowhere/Atlantis"
+        assert main(["config"]) == 1
+    finally:
+        for name, value in original.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+    captured = capsys.readouterr()
+    assert captured.out.startswith("dart-digest ")
+    assert "DART_TIMEZONE" in captured.err
+    assert not (tmp_path / "missing").exists()
+
+
+def test_pipeline_loads_company_map_on_first_use(
+    tmp_path: Path, make_settings: Callable[..., Settings]
+) -> None:
+    settings = make_settings(company_map_path=tmp_path / "late.csv")
+    pipe = DigestPipeline(settings)
+    assert not settings.db_path.exists()
+    assert pipe.flush().status == "skipped"
+    # flush opens the outbox and nothing else: no caches, checkpoints or news threads.
+    with sqlite3.connect(settings.db_path) as conn:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+    assert "slack_outbox" in tables
+    assert not tables & {"score_cache", "news_cache", "llm_responses", "run_checkpoints"}
+    assert "writer" not in pipe.__dict__
+
+    settings.company_map_path.write_text(
+        "company_name,ticker,market\n삼성전자,005930,KOSPI\n", encoding="utf-8"
+    )
+    assert pipe.universe is pipe.market_filter.universe
+
+
+def test_offline_requires_a_recorded_feed(capsys: pytest.CaptureFixture[str]) -> None:
+    for argv in (
+        ["run", "--offline"],
+        ["run", "--offline", "--rss-file", "feed.xml", "--date", "20260227"],
+        ["backfill", "--offline", "--from", "20260227"],
+    ):
+        with pytest.raises(SystemExit) as exc:
+            main(argv)
+        assert exc.value.code == 2
+    assert "--rss-file" in capsys.readouterr().err
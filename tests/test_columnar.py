@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from benchmarks import synthetic
+from benchmarks.hot_paths import bench_settings
+from dart_digest.columnar import DisclosureBatch
+from dart_digest.market_filter import CompanyUniverse, MarketFilter
+from dart_digest.open_dart_client import parse_list_page, parse_list_page_batch
+from dart_digest.scoring import score_batch, score_disclosures
+
+
+def test_batch_round_trip_shares_field_objects() -> None:
+    disclosures = synthetic.make_disclosures(50)
+    batch = DisclosureBatch.from_disclosures(disclosures)
+    assert len(batch) == 50
+
+    back = batch.to_disclosures()
+    assert back == disclosures
+    assert back[7].title is disclosures[7].title
+    assert back[7].published_at is disclosures[7].published_at
+    assert batch.row(7) == disclosures[7]
+    assert batch.take([3, 1]).receipt_no == [disclosures[3].receipt_no, disclosures[1].receipt_no]
+    assert [len(part) for part in batch.slices(20)] == [20, 20, 10]
+
+
+def test_pages_filter_and_score_natively_as_batches(tmp_path: Path) -> None:
+    settings = bench_settings(tmp_path)
+    market_filter = MarketFilter(
+        CompanyUniverse.from_csv(settings.company_map_path), settings.fetch_markets
+    )
+    pages = synthetic.make_opendart_pages(300, page_count=100)
+
+    batch = DisclosureBatch()
+    for page in pages:
+        parse_list_page_batch(page, "20260227", "Y", into=batch)
+    rows = [item for page in pages for item in parse_list_page(page, "20260227", "Y")]
+    assert batch.to_disclosures() == rows
+    assert set(batch.market) == {"KOSPI"}
+
+    filtered = market_filter.filter(batch)
+    expected = market_filter.filter(rows)
+    assert filtered.to_disclosures() == expected
+    # The input batch is left as it was; markets and tickers come from the universe.
+    assert set(batch.market) == {"KOSPI"} and set(filtered.market) == {"KOSPI", "KOSDAQ"}
+
+    scored = score_batch(filtered)
+    assert scored.to_scored() == score_disclosures(expected)
+    assert [item.total_score for item in scored.rows(min_score=80)] == [
+        total for total in scored.total_score if total >= 80
+    ]
@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import Callable
+
+import pytest
+
+import dart_digest.article_writer as article_writer_module
+import dart_digest.pipeline as pipeline_module
+from dart_digest.article_writer import ArticleWriter, shorten_article
+from dart_digest.config import Settings
+from dart_digest.deadline import Deadline
+from dart_digest.models import ScoredDisclosure
+from dart_digest.pipeline import DigestPipeline
+from dart_digest.slack_client import SlackPublisher
+
+
+def test_deadline_caps_call_timeouts() -> None:
+    unbounded = Deadline()
+    assert unbounded.timeout(12) == 12
+    assert not unbounded.expired()
+
+    deadline = Deadline(10)
+    assert deadline.timeout(12) <= 10
+    assert deadline.timeout(12, reserve=30) == 0.0
+
+
+def test_short_budget_skips_news_and_llm(
+    make_settings: Callable[..., Settings], make_scored: Callable[..., ScoredDisclosure]
+) -> None:
+    original_post = article_writer_module.requests.post
+    original_news = article_writer_module.search_related_news
+    article_writer_module.requests.post = lambda *_a, **_k: pytest.fail("OpenAI was called")
+    article_writer_module.search_related_news = lambda **_k: pytest.fail("news was searched")
+    try:
+        writer = ArticleWriter(make_settings(openai_api_key="sk-test"))
+        article = writer.write([make_scored()], datetime(2026, 2, 27, 18, 10), Deadline(20))
+    finally:
+        article_writer_module.requests.post = original_post
+        article_writer_module.search_related_news = original_news
+
+    assert writer.last_generation.outcome == "deadline_skipped"
+    assert "관련 보도를 찾지 못했습니다" in article
+
+
+def test_shorten_article_fits_one_message_and_keeps_disclaimer() -> None:
+    article = "# 제목\n" + "\n".join(f"- 항목 {idx} " + "가" * 80 for idx in range(100))
+
+    short = shorten_article(article, max_chars=1000)
+
+    assert len(short) < 1300
+    assert short.startswith("# 제목")
+    assert "요약본만 전송" in short
+    assert "투자 판단과 책임은 투자자 본인에게 있습니다." in short
+
+
+def test_skip_notification_uses_the_run_deadline(
+    make_settings: Callable[..., Settings],
+) -> None:
+    settings = make_settings(
+        slack_webhook_url="https://hooks.slack.example/T",
+        notify_on_skip=True,
+        dry_run=False,
+    )
+    calls: list[dict] = []
+
+    def fake_publish_text(self: SlackPublisher, text: str, **kwargs: object) -> bool:
+        calls.append(kwargs)
+        return True
+
+    empty_feed = '<?xml version="1.0" encoding="utf-8"?><rss><channel></channel></rss>'
+    original_fetch = pipeline_module.fetch_today_rss
+    original_publish = SlackPublisher.publish_text
+    pipeline_module.fetch_today_rss = lambda _url, **_kwargs: empty_feed
+    SlackPublisher.publish_text = fake_publish_text
+    try:
+        result = DigestPipeline(settings).run(deadline_seconds=5)
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+        SlackPublisher.publish_text = original_publish
+
+    assert result.status == "skipped"
+    assert len(calls) == 1
+    assert calls[0]["timeout"] <= 5
+    assert isinstance(calls[0]["deadline"], Deadline)
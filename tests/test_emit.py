@@ -0,0 +1,80 @@
+import io
+import json
+import os
+from pathlib import Path
+
+import dart_digest.pipeline as pipeline_module
+from benchmarks import synthetic
+from benchmarks.hot_paths import bench_settings
+from dart_digest.cli import main
+from dart_digest.emit import CandidateEmitter
+from dart_digest.pipeline import DigestPipeline
+
+
+def test_emitter_streams_each_candidate_once_with_selection_flag(tmp_path: Path) -> None:
+    settings = bench_settings(tmp_path)
+    settings.news_enabled = False
+    settings.stream_batch_size = 32
+    out = io.BytesIO()
+
+    original_fetch = pipeline_module.fetch_today_rss
+    pipeline_module.fetch_today_rss = lambda _url, **_kwargs: synthetic.make_rss_xml(300)
+    try:
+        pipe = DigestPipeline(settings, emitter=CandidateEmitter(out))
+        result = pipe.run(force=False)
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+
+    assert result.status == "completed"
+    records = [json.loads(line) for line in out.getvalue().decode("utf-8").splitlines()]
+    receipts = [record["receipt_no"] for record in records]
+    assert len(receipts) == len(set(receipts)) == pipe.last_metrics.counters["emitted_candidates"]
+    assert len(records) > 100
+
+    selected = [record["receipt_no"] for record in records if record["selected"]]
+    assert sorted(selected) == sorted(
+        item.disclosure.receipt_no for item in result.selection.selected
+    )
+    record = records[0]
+    assert set(record) >= {"event_score", "financial_score", "market_bonus", "total_score"}
+    assert isinstance(record["reasons"], list) and record["reasons"]
+    assert "selected_profiles" not in record
+
+
+def test_cli_emit_keeps_stdout_pure_jsonl(tmp_path: Path, capsys) -> None:
+    rss_path = tmp_path / "feed.xml"
+    rss_path.write_text(synthetic.make_rss_xml(40), encoding="utf-8")
+    out_path = tmp_path / "out" / "candidates.jsonl"
+    settings = bench_settings(tmp_path)
+
+    env = {
+        "DART_DB_PATH": str(settings.db_path),
+        "DART_COMPANY_MAP_PATH": str(settings.company_map_path),
+        "DART_TARGET_MARKETS": "KOSPI,KOSDAQ",
+    }
+    saved = {key: os.environ.get(key) for key in env}
+    os.environ.update(env)
+    try:
+        code = main(
+            [
+                "run",
+                "--offline",
+                "--rss-file",
+                str(rss_path),
+                "--emit",
+                "jsonl",
+                "--emit-out",
+                str(out_path),
+            ]
+        )
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+    assert code == 0
+    lines = out_path.read_text(encoding="utf-8").splitlines()
+    assert lines and all(json.loads(line)["receipt_no"] for line in lines)
+    assert "[completed]" in capsys.readouterr().out
@@ -0,0 +1,177 @@
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+import dart_digest.article_writer as article_writer_module
+import dart_digest.pipeline as pipeline_module
+from dart_digest.config import OutputProfile, Settings, load_profiles
+from dart_digest.pipeline import DigestPipeline
+from dart_digest.slack_client import SlackPublisher
+
+
+SAMPLE_XML = """<?xml version=\"1.0\" encoding=\"utf-8\"?>
+<rss><channel>
+  <item>
+    <title>삼성전자 (유상증자결정)</title>
+    <link>https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20260228000001</link>
+    <description>1.2조원 규모 자금 조달, 신주 발행비율 20%</description>
+    <pubDate>Sat, 28 Feb 2026 09:00:00 +0900</pubDate>
+  </item>
+  <item>
+    <title>카카오 (단일판매ㆍ공급계약 체결)</title>
+    <link>https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20260228000002</link>
+    <description>500억원 규모 계약</description>
+    <pubDate>Sat, 28 Feb 2026 09:10:00 +0900</pubDate>
+  </item>
+</channel></rss>"""
+
+
+def _fanout_settings(
+    make_settings: Callable[..., Settings], profiles: tuple[OutputProfile, ...]
+) -> Settings:
+    # Every item qualifies, so each profile's selection depends only on its markets.
+    return make_settings(
+        second_pick_min_score=0.0,
+        second_pick_min_gap=100.0,
+        dry_run=False,
+        primary_min_score=0.0,
+        max_per_event_type=2,
+        profiles=profiles,
+    )
+
+
+def test_profiles_share_fetch_score_news_and_identical_articles(
+    make_settings: Callable[..., Settings],
+) -> None:
+    profiles = (
+        OutputProfile(name="kospi", slack_webhook_url="https://hooks.example/kospi"),
+        OutputProfile(name="kospi-copy", slack_webhook_url="https://hooks.example/copy"),
+        OutputProfile(
+            name="all",
+            target_markets=("KOSPI", "KOSDAQ"),
+            slack_webhook_url="https://hooks.example/all",
+            slack_channel="#all",
+        ),
+    )
+    fetches: list[str] = []
+    searches: list[str] = []
+    posts: list[tuple[str, dict]] = []
+
+    def fake_fetch(url: str, **_kwargs: object) -> str:
+        fetches.append(url)
+        return SAMPLE_XML
+
+    def fake_search(**kwargs: object) -> list:
+        searches.append(str(kwargs["company_name"]))
+        return []
+
+    def fake_post(self: SlackPublisher, payload: dict, timeout: float, _deadline=None) -> None:
+        posts.append((str(self.webhook_url), payload))
+
+    original_fetch = pipeline_module.fetch_today_rss
+    original_search = article_writer_module.search_related_news
+    original_post = SlackPublisher._post
+    pipeline_module.fetch_today_rss = fake_fetch
+    article_writer_module.search_related_news = fake_search
+    SlackPublisher._post = fake_post
+    try:
+        result = DigestPipeline(_fanout_settings(make_settings, profiles)).run(force=False)
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+        article_writer_module.search_related_news = original_search
+        SlackPublisher._post = original_post
+
+    assert result.status == "completed"
+    assert len(fetches) == 1
+    assert sorted(searches) == ["삼성전자", "카카오"]
+
+    outputs = {output.profile: output for output in result.outputs}
+    assert [item.disclosure.company_name for item in outputs["kospi"].selection.selected] == [
+        "삼성전자"
+    ]
+    assert {item.market for item in outputs["all"].selection.selected} == {"KOSPI", "KOSDAQ"}
+    assert (
+        outputs["kospi"].selection.generated_article
+        == outputs["kospi-copy"].selection.generated_article
+    )
+
+    counters = result.metrics.to_dict()["counters"]
+    assert counters["fanout_profiles"] == 3
+    assert counters["fanout_articles_written"] == 2
+    assert {webhook for webhook, _ in posts} == {
+        "https://hooks.example/kospi",
+        "https://hooks.example/copy",
+        "https://hooks.example/all",
+    }
+    assert all(
+        payload.get("channel") == "#all"
+        for webhook, payload in posts
+        if webhook.endswith("/all")
+    )
+    assert counters["slack_outbox_pending"] == 0
+
+
+def test_load_profiles_reads_webhooks_from_env(
+    tmp_path: Path, make_settings: Callable[..., Settings]
+) -> None:
+    path = tmp_path / "profiles.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"name": "kospi", "target_markets": ["kospi"], "slack_webhook_env": "DESK_HOOK"},
+                {"name": "all", "top_n_max": 3},
+            ]
+        ),
+        encoding="utf-8",
+    )
+    original = os.environ.get("DESK_HOOK")
+    os.environ["DESK_HOOK"] = "https://hooks.example/desk"
+    try:
+        profiles = load_profiles(path)
+    finally:
+        if original is None:
+            os.environ.pop("DESK_HOOK", None)
+        else:
+            os.environ["DESK_HOOK"] = original
+
+    assert profiles[0].target_markets == ("KOSPI",)
+    assert profiles[0].slack_webhook_url == "https://hooks.example/desk"
+
+    base = _fanout_settings(make_settings, profiles)
+    assert base.fetch_markets == ("KOSPI",)
+    merged = base.for_profile(profiles[1])
+    assert merged.top_n_max == 3
+    assert merged.target_markets == ("KOSPI",)
+    assert merged.profiles == ()
+
+
+def test_flush_reports_chunks_queued_for_removed_profiles(
+    make_settings: Callable[..., Settings],
+) -> None:
+    profiles = (OutputProfile(name="kospi", slack_webhook_url="https://hooks.example/kospi"),)
+    pipe = DigestPipeline(_fanout_settings(make_settings, profiles))
+    pipe.outbox.enqueue([{"text": "old report"}], destination="retired")
+
+    result = pipe.flush()
+
+    assert result.status == "skipped"
+    assert "1 queued Slack message(s)" in result.message and "retired" in result.message
+    assert pipe.last_metrics.counters["slack_outbox_orphaned"] == 1
+
+
+def test_profile_with_an_unset_webhook_env_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "profiles.json"
+    path.write_text(
+        json.dumps([{"name": "kosdaq", "slack_webhook_env": "DART_TEST_UNSET_HOOK"}]),
+        encoding="utf-8",
+    )
+    original = os.environ.pop("DART_TEST_UNSET_HOOK", None)
+    try:
+        with pytest.raises(ValueError, match="'kosdaq'.*DART_TEST_UNSET_HOOK"):
+            load_profiles(path)
+    finally:
+        if original is not None:
+            os.environ["DART_TEST_UNSET_HOOK"] = original
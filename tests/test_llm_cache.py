@@ -0,0 +1,67 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import dart_digest.article_writer as article_writer_module
+from dart_digest.article_writer import ArticleWriter
+from dart_digest.config import Settings
+from dart_digest.llm_cache import ResponseCache
+from dart_digest.models import ScoredDisclosure
+
+
+def test_openai_response_is_cached_and_replayed(
+    tmp_path: Path,
+    make_settings: Callable[..., Settings],
+    make_scored: Callable[..., ScoredDisclosure],
+) -> None:
+    selected = [make_scored()]
+    cache = ResponseCache(tmp_path / "digest.db")
+    calls: list[str] = []
+    llm_article = "# 테스트전자 심층\n\n### 관련 뉴스 요약\n- 없음"
+
+    def fake_request(
+        self: ArticleWriter,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        _budget: object = None,
+    ) -> str:
+        calls.append(user_prompt)
+        return llm_article
+
+    original = ArticleWriter._request_openai
+    ArticleWriter._request_openai = fake_request
+    try:
+        writer = ArticleWriter(make_settings(openai_api_key="sk-test"), response_cache=cache)
+        first = writer._write_with_openai(selected, datetime(2026, 2, 27, 10, 10), {})
+        rerun = writer._write_with_openai(selected, datetime(2026, 2, 27, 10, 25), {})
+    finally:
+        ArticleWriter._request_openai = original
+
+    assert first == rerun == llm_article
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+    def no_network(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("replay mode must not call the API")
+
+    original_post = article_writer_module.requests.post
+    article_writer_module.requests.post = no_network
+    try:
+        replay = ArticleWriter(
+            make_settings(openai_replay=True),
+            response_cache=ResponseCache(tmp_path / "digest.db", max_age_seconds=None),
+        )
+        assert replay._write_with_openai(selected, datetime(2026, 2, 27, 18, 10), {}) == llm_article
+        assert replay._write_with_openai(selected, datetime(2026, 2, 28, 10, 10), {}) == ""
+    finally:
+        article_writer_module.requests.post = original_post
+
+
+def test_response_cache_evicts_by_size(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "digest.db", max_entries=2)
+    for idx in range(3):
+        cache.put(f"hash-{idx}", "gpt-4.1-mini", f"article {idx}")
+
+    assert cache.get("hash-0") is None
+    assert cache.get("hash-2") == "article 2"
@@ -0,0 +1,32 @@
+import pickle
+from dataclasses import asdict
+
+from benchmarks import synthetic
+from benchmarks.memory_models import build_current, build_legacy, bytes_per_item
+from dart_digest.scoring import score_disclosures
+
+
+def test_models_are_slotted_and_share_reason_strings() -> None:
+    scored = score_disclosures(synthetic.make_disclosures(200))
+    assert not hasattr(scored[0], "__dict__")
+    assert not hasattr(scored[0].disclosure, "__dict__")
+    assert scored[0].disclosure.market in ("KOSPI", "KOSDAQ")
+
+    by_reasons = {}
+    for item in scored:
+        first = by_reasons.setdefault(item.reasons, item.reasons)
+        # Equal reason tuples are the same object, as are equal event types.
+        assert item.reasons is first
+        assert item.event_type is next(
+            other.event_type for other in scored if other.event_type == item.event_type
+        )
+    assert len(by_reasons) < len(scored) / 2
+
+    copy = pickle.loads(pickle.dumps(scored[0]))
+    assert copy == scored[0]
+    assert asdict(copy.disclosure)["market"] == scored[0].disclosure.market
+
+
+def test_slotted_models_retain_less_memory_per_item() -> None:
+    sources = synthetic.make_disclosures(2000)
+    assert bytes_per_item(build_current, sources) < bytes_per_item(build_legacy, sources) * 0.6
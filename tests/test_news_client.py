@@ -1,4 +1,9 @@
-from dart_digest.news_client import parse_google_news_rss
+import sqlite3
+import threading
+from pathlib import Path
+
+import dart_digest.news_client as news_client_module
+from dart_digest.news_client import NewsCache, NewsItem, parse_google_news_rss
 
 
 def test_parse_google_news_rss_extracts_items() -> None:
@@ -18,3 +23,63 @@ def test_parse_google_news_rss_extracts_items() -> None:
     assert items[0].link == "https://news.example.com/a"
     assert items[0].source == "예시뉴스"
     assert items[0].published_at == "2026-02-27"
+
+
+def test_news_cache_serves_fresh_then_stale_and_revalidates(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def fake_fetch(query: str, _timeout: float = 12.0) -> list[NewsItem]:
+        calls.append(query)
+        return [NewsItem(f"기사 {len(calls)}", f"https://news.example.com/{len(calls)}", "", "", 1.0)]
+
+    original = news_client_module._fetch_news
+    news_client_module._fetch_news = fake_fetch
+    try:
+        cache = NewsCache(tmp_path / "digest.db", ttl_seconds=3600, stale_seconds=3600)
+        assert cache.lookup("삼성전자  유상증자")[0].title == "기사 1"
+        assert cache.lookup("삼성전자 유상증자")[0].title == "기사 1"
+        assert len(calls) == 1
+
+        with sqlite3.connect(tmp_path / "digest.db") as conn:
+            conn.execute("UPDATE news_cache SET fetched_at = fetched_at - 5000")
+
+        assert cache.lookup("삼성전자 유상증자")[0].title == "기사 1"
+        cache.close()
+        assert len(calls) == 2
+        assert cache.lookup("삼성전자 유상증자")[0].title == "기사 2"
+    finally:
+        news_client_module._fetch_news = original
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (2, 1, 1)
+    assert stats["hit_rate"] == 0.75
+
+
+def test_revalidation_is_bounded_and_dropped_on_close(tmp_path: Path) -> None:
+    timeouts: list[float] = []
+    release = threading.Event()
+
+    def slow_fetch(query: str, timeout: float = 12.0) -> list[NewsItem]:
+        timeouts.append(timeout)
+        release.wait(timeout=5)
+        return [NewsItem(query, "https://news.example.com/a", "", "", 1.0)]
+
+    original = news_client_module._fetch_news
+    news_client_module._fetch_news = slow_fetch
+    try:
+        cache = NewsCache(tmp_path / "digest.db", ttl_seconds=0, stale_seconds=3600)
+        for query in ("가", "나", "다"):
+            cache.store(query, [NewsItem(query, "https://news.example.com/old", "", "", 1.0)])
+        # Two workers take the first refreshes; the third waits in the queue.
+        for query in ("가", "나", "다"):
+            assert cache.lookup(query, timeout=0.5)[0].link.endswith("/old")
+        executor = cache._executor
+        cache.close(wait=False)
+        release.set()
+        executor.shutdown(wait=True)
+    finally:
+        news_client_module._fetch_news = original
+
+    # Refreshes get the caller's (deadline-capped) timeout, and the queued one never runs.
+    assert timeouts and all(value == 0.5 for value in timeouts)
+    assert len(timeouts) <= 2
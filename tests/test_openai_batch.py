@@ -0,0 +1,72 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import dart_digest.article_writer as article_writer_module
+from dart_digest.article_writer import ArticleWriter
+from dart_digest.config import Settings
+from dart_digest.models import ScoredDisclosure
+from dart_digest.openai_batch import parse_results
+
+
+def _output_line(custom_id: str, text: str, status_code: int = 200) -> str:
+    body = {"output": [{"content": [{"type": "output_text", "text": text}]}]}
+    return json.dumps(
+        {"custom_id": custom_id, "response": {"status_code": status_code, "body": body}},
+        ensure_ascii=False,
+    )
+
+
+def test_write_batch_joins_results_and_falls_back_per_item(
+    tmp_path: Path,
+    make_settings: Callable[..., Settings],
+    make_scored: Callable[..., ScoredDisclosure],
+) -> None:
+    def selected(company: str, receipt_no: str) -> list[ScoredDisclosure]:
+        return [make_scored(company, receipt_no, published_at=datetime(2026, 2, 2, 10, 0, 0))]
+
+    submitted: list[Path] = []
+
+    def fake_run_batch(job_path: Path, **_kwargs: object) -> dict[str, dict]:
+        submitted.append(job_path)
+        return parse_results(
+            "\n".join(
+                [
+                    _output_line("20260202", "# 알파전자 심층\n### 관련 뉴스 요약\n- 없음"),
+                    _output_line("20260203", "게이트를 통과하지 못하는 기사"),
+                    _output_line("20260204", "", status_code=500),
+                ]
+            )
+        )
+
+    original_run = article_writer_module.run_batch
+    original_news = article_writer_module.search_related_news
+    article_writer_module.run_batch = fake_run_batch
+    article_writer_module.search_related_news = lambda **_kwargs: []
+    try:
+        writer = ArticleWriter(
+            make_settings(
+                openai_api_key="sk-test", openai_base_url="http://127.0.0.1:9999/v1"
+            )
+        )
+        articles = writer.write_batch(
+            {
+                "20260202": (selected("알파전자", "20260202000001"), datetime(2026, 2, 2, 18, 10)),
+                "20260203": (selected("베타화학", "20260203000001"), datetime(2026, 2, 3, 18, 10)),
+                "20260204": (selected("감마바이오", "20260204000001"), datetime(2026, 2, 4, 18, 10)),
+            },
+            tmp_path / "jobs.jsonl",
+        )
+    finally:
+        article_writer_module.run_batch = original_run
+        article_writer_module.search_related_news = original_news
+
+    jobs = [json.loads(line) for line in submitted[0].read_text(encoding="utf-8").splitlines()]
+    assert [job["custom_id"] for job in jobs] == ["20260202", "20260203", "20260204"]
+    assert all(job["url"] == "/v1/responses" and job["method"] == "POST" for job in jobs)
+    assert "stream" not in jobs[0]["body"]
+
+    assert articles["20260202"].startswith("# 알파전자 심층")
+    assert "투자자 관점 해석" in articles["20260203"]
+    assert "투자자 관점 해석" in articles["20260204"]
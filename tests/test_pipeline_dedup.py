@@ -1,38 +1,17 @@
-from pathlib import Path
+from typing import Callable
 
+import dart_digest.article_writer as article_writer_module
 import dart_digest.pipeline as pipeline_module
 from dart_digest.config import Settings
+from dart_digest.news_client import NewsCache
 from dart_digest.pipeline import DigestPipeline
 
 
-def test_pipeline_skips_already_processed_disclosures(tmp_path: Path) -> None:
-    csv_path = tmp_path / "companies.csv"
-    csv_path.write_text(
-        "company_name,ticker,market\n"
-        "삼성전자,005930,KOSPI\n"
-        "카카오,035720,KOSDAQ\n",
-        encoding="utf-8",
-    )
-
-    db_path = tmp_path / "digest.db"
-
-    settings = Settings(
-        rss_url="https://example.com/rss.xml",
-        db_path=db_path,
-        company_map_path=csv_path,
-        target_markets=("KOSPI", "KOSDAQ"),
-        dart_api_key=None,
-        timezone="Asia/Seoul",
-        top_n_max=2,
-        second_pick_min_score=70.0,
-        second_pick_min_gap=15.0,
-        openai_api_key=None,
-        openai_model="gpt-4.1-mini",
-        slack_webhook_url=None,
-        slack_channel=None,
-        notify_on_skip=False,
-        require_slack_webhook=False,
-        dry_run=True,
+def test_pipeline_skips_already_processed_disclosures(
+    make_settings: Callable[..., Settings],
+) -> None:
+    settings = make_settings(
+        target_markets=("KOSPI", "KOSDAQ"), second_pick_min_score=70.0, second_pick_min_gap=15.0
     )
 
     sample_xml = """<?xml version=\"1.0\" encoding=\"utf-8\"?>
@@ -52,7 +31,7 @@ def test_pipeline_skips_already_processed_disclosures(tmp_path: Path) -> None:
 </channel></rss>"""
 
     original_fetch = pipeline_module.fetch_today_rss
-    pipeline_module.fetch_today_rss = lambda _url: sample_xml
+    pipeline_module.fetch_today_rss = lambda _url, **_kwargs: sample_xml
     try:
         pipe = DigestPipeline(settings)
         first = pipe.run(force=False)
@@ -63,3 +42,41 @@ def test_pipeline_skips_already_processed_disclosures(tmp_path: Path) -> None:
         assert second.message == "No new disclosures after deduplication."
     finally:
         pipeline_module.fetch_today_rss = original_fetch
+
+
+def test_pipeline_reports_stage_metrics(make_settings: Callable[..., Settings]) -> None:
+    settings = make_settings(second_pick_min_score=70.0, second_pick_min_gap=15.0)
+    sample_xml = """<?xml version=\"1.0\" encoding=\"utf-8\"?>
+<rss><channel>
+  <item>
+    <title>삼성전자 (유상증자결정)</title>
+    <link>https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20260228000001</link>
+    <description>1.2조원 규모 자금 조달</description>
+    <pubDate>Sat, 28 Feb 2026 09:00:00 +0900</pubDate>
+  </item>
+</channel></rss>"""
+
+    closed: list[bool] = []
+    original_fetch = pipeline_module.fetch_today_rss
+    original_news = article_writer_module.search_related_news
+    original_close = NewsCache.close
+    pipeline_module.fetch_today_rss = lambda _url, **_kwargs: sample_xml
+    article_writer_module.search_related_news = lambda **_kwargs: []
+    NewsCache.close = lambda self, wait=True: closed.append(wait)
+    try:
+        result = DigestPipeline(settings).run(force=False)
+    finally:
+        pipeline_module.fetch_today_rss = original_fetch
+        article_writer_module.search_related_news = original_news
+        NewsCache.close = original_close
+
+    # Background news refreshes are let go rather than waited on when the run ends.
+    assert closed == [False]
+
+    stages = {stage.name: stage for stage in result.metrics.stages}
+    assert result.metrics.status == "completed"
+    assert {"fetch", "filter", "dedup", "score", "select", "news", "template"} <= set(stages)
+    assert stages["fetch"].items_out == 1
+    assert stages["score"].items_in == 1
+    assert 'dart_digest_stage_seconds{stage="score"}' in result.metrics.to_prometheus()
+    assert result.metrics.to_dict()["counters"]["score_cache_misses"] == 1
@@ -0,0 +1,63 @@
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from dart_digest.config import Settings
+from dart_digest.pipeline import DigestPipeline
+from dart_digest.profiling import run_profiled
+
+
+SAMPLE_XML = """<?xml version=\"1.0\" encoding=\"utf-8\"?>
+<rss><channel>
+  <item>
+    <title>삼성전자 (유상증자결정)</title>
+    <link>https://dart.fss.or.kr/dsaf001/main.do?rcpNo=20260228000001</link>
+    <description>1.2조원 규모 자금 조달, 신주 발행비율 20%</description>
+    <pubDate>Sat, 28 Feb 2026 09:00:00 +0900</pubDate>
+  </item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def offline_pipeline(tmp_path: Path, make_settings: Callable[..., Settings]) -> DigestPipeline:
+    rss_path = tmp_path / "today.xml"
+    rss_path.write_text(SAMPLE_XML, encoding="utf-8")
+    return DigestPipeline(
+        make_settings(
+            rss_url=rss_path.resolve().as_uri(),
+            second_pick_min_score=70.0,
+            second_pick_min_gap=15.0,
+            news_enabled=False,
+        )
+    )
+
+
+def test_cpu_profile_writes_one_file_per_stage(
+    tmp_path: Path, offline_pipeline: DigestPipeline
+) -> None:
+    pipe = offline_pipeline
+    out_path = tmp_path / "profile.prof"
+
+    result, written = run_profiled("cpu", lambda: pipe.run(force=True), out_path)
+
+    assert result.status == "completed"
+    assert written[0] == out_path
+    names = {path.name for path in written}
+    assert "profile.other.prof" in names
+    assert "profile.select.prof" in names
+    assert all(path.exists() for path in written)
+
+
+def test_memory_profile_reports_per_stage_allocations(
+    tmp_path: Path, offline_pipeline: DigestPipeline
+) -> None:
+    pipe = offline_pipeline
+    out_path = tmp_path / "profile_mem.txt"
+
+    result, written = run_profiled("mem", lambda: pipe.run(force=True), out_path, top_n=5)
+
+    assert result.status == "completed"
+    report = written[0].read_text(encoding="utf-8")
+    assert report.startswith("peak traced memory:")
+    assert "== stage select:" in report
@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Callable
+
+import pytest
+
+from dart_digest.article_writer import _build_user_prompt, _issue_context, estimate_tokens
+from dart_digest.models import ScoredDisclosure
+from dart_digest.news_client import NewsItem
+
+
+@pytest.fixture
+def scored(make_scored: Callable[..., ScoredDisclosure]) -> Callable[[str], ScoredDisclosure]:
+    reasons = ["자본구조 변화", "공시 내 금액 단서", "신뢰도 판단: 숫자 단서 포함"]
+    return lambda description: make_scored(description=description, reasons=reasons)
+
+
+def test_compact_prompt_lists_keys_once(scored: Callable) -> None:
+    news = {
+        "20260227000001": [
+            NewsItem("테스트전자 유상증자 기사", "https://news.example.com/a", "예시", "2026-02-27", 1.0)
+        ]
+    }
+    prompt = _build_user_prompt([scored("1.2조원 규모")] * 2, datetime(2026, 2, 27), news)
+
+    assert prompt.count('"company"') == 1
+    assert '\n  ' not in prompt
+    assert "https://news.example.com/a" in prompt
+
+
+def test_prompt_is_truncated_to_token_budget(scored: Callable) -> None:
+    long_description = "신사업 투자와 증설 계획에 대한 상세 설명 " * 200
+    selected = [scored(long_description)]
+    unbounded = _build_user_prompt(selected, datetime(2026, 2, 27), {})
+    bounded = _build_user_prompt(selected, datetime(2026, 2, 27), {}, token_budget=1200)
+
+    assert estimate_tokens(unbounded) > 1200
+    assert estimate_tokens(bounded) <= 1200
+    assert "테스트전자 (유상증자결정)" in bounded
+
+
+def test_issue_context_is_extracted_once_per_item_and_news_set(scored: Callable) -> None:
+    item = scored("영업손실 확대 속 신사업 투자와 환율 부담")
+    news = [NewsItem("테스트전자 적자 전환", "https://news.example.com/a", "예시", "2026-02-27", 1.0)]
+
+    ctx = _issue_context(item, news)
+
+    assert {"유상증자", "영업손실", "영업손실확대", "신사업", "투자", "환율"} <= ctx.disclosure_hits
+    assert "적자전환" in ctx.profitability_signal
+    assert ctx.company_plan_signal.startswith("신사업, 투자 중심")
+    assert ctx.news_title_hits == (frozenset({"적자전환"}),)
+    assert _issue_context(item, news) is ctx
+    assert _issue_context(item, []) is not ctx
@@ -0,0 +1,78 @@
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+from dart_digest.models import Disclosure
+from dart_digest.score_cache import ScoreCache
+from dart_digest.scoring import score_disclosures
+
+
+def _build_disclosure(receipt_no: str, description: str) -> Disclosure:
+    return Disclosure(
+        company_name="테스트회사",
+        title="테스트회사 (유상증자결정)",
+        link=f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={receipt_no}",
+        receipt_no=receipt_no,
+        published_at=datetime(2026, 2, 27, 9, 0, 0),
+        description=description,
+        market="KOSPI",
+    )
+
+
+def test_score_cache_hits_on_identical_content() -> None:
+    cache = ScoreCache(max_entries=8)
+    items = [_build_disclosure("20260227000001", "1.2조원 규모")]
+
+    first = score_disclosures(items, cache=cache)
+    second = score_disclosures(items, cache=cache)
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert second[0].total_score == first[0].total_score
+    assert second[0].disclosure is items[0]
+
+    changed = [_build_disclosure("20260227000001", "300억원 규모")]
+    score_disclosures(changed, cache=cache)
+    assert cache.misses == 2
+
+
+def test_score_cache_is_bounded_and_persists(tmp_path: Path) -> None:
+    db_path = tmp_path / "digest.db"
+    items = [_build_disclosure(f"2026022700000{i}", "20% 증가") for i in range(5)]
+
+    cache = ScoreCache(max_entries=2, db_path=db_path)
+    expected = score_disclosures(items, cache=cache)
+    assert cache.stats()["entries"] == 2
+
+    reloaded = ScoreCache(max_entries=2, db_path=db_path)
+    result = score_disclosures(items, cache=reloaded)
+    assert reloaded.hits == 5
+    assert reloaded.misses == 0
+    assert [x.total_score for x in result] == [x.total_score for x in expected]
+
+
+def test_persisted_cache_trims_least_recently_used(tmp_path: Path) -> None:
+    db_path = tmp_path / "digest.db"
+    first, second, third = [_build_disclosure(f"2026022700001{i}", "20% 증가") for i in range(3)]
+
+    cache = ScoreCache(db_path=db_path, persist_limit=2)
+    score_disclosures([first], cache=cache)
+    score_disclosures([second], cache=cache)
+    # A hit on `first` makes `second` the oldest row, so it is the one trimmed.
+    score_disclosures([first], cache=cache)
+    score_disclosures([third], cache=cache)
+
+    reloaded = ScoreCache(db_path=db_path)
+    assert reloaded.get(first) is not None
+    assert reloaded.get(second) is None
+    assert reloaded.get(third) is not None
+
+    # The trim reads the oldest rows off the updated_at index instead of sorting the table.
+    with sqlite3.connect(db_path) as conn:
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT cache_key FROM score_cache ORDER BY updated_at LIMIT 1"
+            )
+        )
+    assert "score_cache_updated_at" in plan
@@ -1,7 +1,7 @@
 from datetime import datetime
 
 from dart_digest.models import Disclosure
-from dart_digest.scoring import score_disclosure
+from dart_digest.scoring import score_disclosure, score_disclosures
 
 
 def _build_disclosure(title: str, description: str) -> Disclosure:
@@ -45,10 +45,39 @@ def test_kospi_market_bonus_added() -> None:
         "테스트회사 (잠정실적 공시)",
         "매출액 30% 증가, 영업이익 15% 감소",
     )
-    kospi.raw["market"] = "KOSPI"
-    kosdaq.raw["market"] = "KOSDAQ"
+    kospi.market = "KOSPI"
+    kosdaq.market = "KOSDAQ"
 
     scored_kosdaq = score_disclosure(kosdaq)
     scored_kospi = score_disclosure(kospi)
 
     assert scored_kospi.total_score == round(scored_kosdaq.total_score + 5.0, 2)
+
+
+def test_parallel_scoring_matches_serial_order() -> None:
+    disclosures = [
+        _build_disclosure(title, f"{idx * 10}억원 규모, {idx}% 증가")
+        for idx, title in enumerate(
+            [
+                "테스트회사 (유상증자결정)",
+                "테스트회사 (단일판매ㆍ공급계약 체결)",
+                "테스트회사 (임시주주총회 소집결의)",
+                "테스트회사 (회사합병 결정)",
+                "테스트회사 (현금ㆍ현물배당 결정)",
+            ],
+            start=1,
+        )
+    ]
+
+    serial = score_disclosures(disclosures)
+    parallel = score_disclosures(
+        disclosures,
+        workers=2,
+        chunk_size=2,
+        parallel_threshold=1,
+    )
+
+    assert [x.disclosure for x in parallel] == disclosures
+    assert [(x.event_type, x.total_score, x.reasons) for x in parallel] == [
+        (x.event_type, x.total_score, x.reasons) for x in serial
+    ]
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from typing import Callable
+
+import pytest
+
+from dart_digest.models import ScoredDisclosure
+from dart_digest.selection import SelectionRules, TopKSelector
+
+
+@pytest.fixture
+def ranked(make_scored: Callable[..., ScoredDisclosure]) -> Callable[..., ScoredDisclosure]:
+    # Only rank inputs matter here: total score, event type, company and publish order.
+    def make(idx: int, score: float, event_type: str, company: str = "") -> ScoredDisclosure:
+        company = company or f"회사{idx}"
+        return make_scored(
+            company,
+            f"2026022700000{idx}",
+            title=f"{company} (공시)",
+            published_at=datetime(2026, 2, 27, 9, 0, 0) + timedelta(minutes=idx),
+            description="",
+            event_type=event_type,
+            event_score=0.0,
+            financial_score=0.0,
+            persistence_score=0.0,
+            confidence_score=0.0,
+            market_bonus=0.0,
+            total_score=score,
+        )
+
+    return make
+
+
+def test_diversity_rule_looks_past_same_event_type(ranked: Callable) -> None:
+    selector = TopKSelector(SelectionRules(top_n=3, follow_min_score=78.0, max_gap=6.0))
+    selector.extend(
+        [
+            ranked(1, 90.0, "수주/계약"),
+            ranked(2, 89.0, "수주/계약"),
+            ranked(3, 88.0, "실적/전망"),
+            ranked(4, 86.0, "주주환원"),
+            ranked(5, 70.0, "감사/리스크"),
+        ]
+    )
+
+    picked = [item.disclosure.receipt_no[-1] for item in selector.select()]
+    assert picked == ["1", "3", "4"]
+
+
+def test_company_cap_and_primary_threshold(ranked: Callable) -> None:
+    rules = SelectionRules(top_n=3, max_per_event_type=3, max_per_company=1)
+    selector = TopKSelector(rules)
+    selector.extend(
+        [
+            ranked(1, 90.0, "수주/계약", company="삼성전자"),
+            ranked(2, 89.0, "실적/전망", company="삼성전자"),
+            ranked(3, 88.0, "실적/전망", company="카카오"),
+        ]
+    )
+    assert [item.disclosure.company_name for item in selector.select()] == ["삼성전자", "카카오"]
+
+    low = TopKSelector(SelectionRules())
+    low.extend([ranked(1, 59.0, "기타")])
+    assert low.select() == []
+
+
+def test_pool_stays_bounded(ranked: Callable) -> None:
+    selector = TopKSelector(SelectionRules(top_n=1), pool_size=4)
+    for idx in range(50):
+        selector.push(ranked(idx, 60.0 + idx * 0.1, "기타"))
+
+    assert len(selector.pool()) == 4
+    assert selector.select()[0].total_score == round(60.0 + 49 * 0.1, 10)
+
+
+def test_zero_event_type_cap_means_unlimited(ranked: Callable) -> None:
+    selector = TopKSelector(
+        SelectionRules(top_n=3, follow_min_score=0.0, max_gap=10.0, max_per_event_type=0)
+    )
+    selector.extend([ranked(idx, 90.0 - idx, "수주/계약") for idx in range(1, 5)])
+    assert len(selector.select()) == 3
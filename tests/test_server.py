@@ -0,0 +1,97 @@
+import http.client
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+from urllib.parse import quote
+
+from benchmarks.load_score import run_suite
+from dart_digest.market_filter import CompanyUniverse
+from dart_digest.server import ScoringService, make_server
+
+
+def _request(base_url: str, path: str, body: object = None) -> tuple[int, dict]:
+    data = None if body is None else json.dumps(body, ensure_ascii=False).encode("utf-8")
+    request = urllib.request.Request(base_url + path, data=data)
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def test_score_and_classify_endpoints(tmp_path: Path) -> None:
+    csv_path = tmp_path / "companies.csv"
+    csv_path.write_text(
+        "company_name,ticker,market\n삼성전자,005930,KOSPI\n카카오,035720,KOSDAQ\n",
+        encoding="utf-8",
+    )
+    service = ScoringService(CompanyUniverse.from_csv(csv_path), ("KOSPI",))
+    server = make_server(service, "127.0.0.1", 0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        status, single = _request(
+            base_url,
+            "/score",
+            {"title": "삼성전자 (유상증자결정)", "description": "1.2조원 규모, 신주 발행비율 20%"},
+        )
+        assert status == 200
+        assert single["market"] == "KOSPI" and single["ticker"] == "005930"
+        assert single["event_type"] == "지배구조/자본변동" and single["in_target_markets"]
+        assert single["total_score"] > 0 and single["reasons"]
+
+        status, batch = _request(
+            base_url,
+            "/score",
+            {
+                "items": [
+                    {"title": "카카오 (단일판매ㆍ공급계약 체결)"},
+                    {"title": "비상장사 (기타경영사항)", "market": "konex"},
+                ]
+            },
+        )
+        assert status == 200
+        assert [row["market"] for row in batch["results"]] == ["KOSDAQ", "KONEX"]
+        assert not batch["results"][0]["in_target_markets"]
+
+        status, known = _request(base_url, f"/classify-company?name={quote('삼성전자')}")
+        assert status == 200 and known["found"] and known["market"] == "KOSPI"
+        status, many = _request(base_url, "/classify-company", {"names": ["카카오", "없는회사"]})
+        assert status == 200
+        assert [row["found"] for row in many["results"]] == [True, False]
+
+        assert _request(base_url, "/score", {"description": "제목 없음"})[0] == 400
+        assert _request(base_url, "/score", {"items": "nope"})[0] == 400
+        status, body = _request(base_url, "/score", {"title": "공시", "company_name": 123})
+        assert status == 400 and "company_name" in body["error"]
+        batch = {"items": [{"title": "공시", "description": ["1.2조원"]}]}
+        assert _request(base_url, "/score", batch)[0] == 400
+        assert _request(base_url, "/classify-company", {})[0] == 400
+        assert _request(base_url, "/nowhere")[0] == 404
+        assert _request(base_url, "/healthz")[1]["companies"] == 2
+
+        port = server.server_address[1]
+        for length in ("abc", "-5"):
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+            try:
+                connection.putrequest("POST", "/score")
+                connection.putheader("Content-Length", length)
+                connection.endheaders()
+                response = connection.getresponse()
+                assert response.status == 400
+                assert "Content-Length" in json.loads(response.read())["error"]
+            finally:
+                connection.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_load_script_reports_rps_and_p99() -> None:
+    report = run_suite(count=20, concurrency=2, batch_size=5)
+    assert set(report["results"]) == {"score", "score-batch", "classify"}
+    for row in report["results"].values():
+        assert row["requests"] == 20 and row["errors"] == 0
+        assert row["rps"] > 0 and row["p99_ms"] >= row["p50_ms"] > 0
@@ -0,0 +1,138 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+import dart_digest.slack_client as slack_client_module
+from dart_digest.deadline import Deadline
+from dart_digest.slack_client import SlackPublisher
+from dart_digest.slack_outbox import SlackOutbox
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = b"ok"
+        self.text = "ok" if status_code < 400 else "error"
+
+
+class _FakeSession:
+    def __init__(self, statuses: list[_FakeResponse]) -> None:
+        self.statuses = statuses
+        self.sent: list[str] = []
+
+    def post(self, _url: str, json: dict, timeout: float) -> _FakeResponse:
+        response = self.statuses.pop(0) if self.statuses else _FakeResponse(200)
+        if response.status_code < 400:
+            self.sent.append(json["text"])
+        return response
+
+
+def test_failed_chunk_resumes_in_order_without_resending(tmp_path: Path) -> None:
+    sleeps: list[float] = []
+    original_sleep = slack_client_module.time.sleep
+    slack_client_module.time.sleep = sleeps.append
+    try:
+        outbox = SlackOutbox(tmp_path / "digest.db")
+        publisher = SlackPublisher("https://hooks.slack.example/T", outbox=outbox)
+        article = "\n".join(["가" * 500] * 20)
+
+        # Chunk 1 is delivered after a rate-limit retry; chunk 2 keeps failing.
+        publisher._session = _FakeSession(
+            [_FakeResponse(429, {"Retry-After": "3"}), _FakeResponse(200)]
+            + [_FakeResponse(503)] * 3
+        )
+        with pytest.raises(RuntimeError, match="chunk 2"):
+            publisher.publish(article, [], datetime(2026, 2, 27, 18, 10))
+        first_sent = publisher._session.sent
+        assert len(first_sent) == 1
+        assert sleeps[0] == 3.0
+        pending = outbox.stats()["pending"]
+        assert pending >= 2
+
+        # The next run re-publishes the same report: only the undelivered chunks go out.
+        publisher._session = _FakeSession([])
+        assert publisher.publish(article, [], datetime(2026, 2, 27, 18, 10))
+        assert len(publisher._session.sent) == pending
+        assert publisher._session.sent[0] != first_sent[0]
+        assert outbox.stats()["pending"] == 0
+        assert publisher.flush() == 0
+    finally:
+        slack_client_module.time.sleep = original_sleep
+
+
+def test_rejected_chunk_fails_for_good_and_does_not_block_later_reports(tmp_path: Path) -> None:
+    outbox = SlackOutbox(tmp_path / "digest.db")
+    publisher = SlackPublisher("https://hooks.slack.example/T", outbox=outbox)
+
+    run_dt = datetime(2026, 2, 27, 18, 10)
+
+    publisher._session = _FakeSession([_FakeResponse(400)])
+    with pytest.raises(RuntimeError, match="rejected"):
+        publisher.publish("poisoned", [], run_dt)
+    assert outbox.stats()["pending"] == 0
+    assert outbox.stats()["failed"] == 1
+
+    # The next report goes straight out; the rejected chunk is never retried.
+    publisher._session = _FakeSession([])
+    assert publisher.publish("next report", [], run_dt)
+    assert len(publisher._session.sent) == 1
+    assert publisher._session.sent[0].endswith("next report")
+    assert outbox.stats()["failed"] == 1
+
+
+def test_chunk_out_of_attempts_fails_with_the_rest_of_its_report(tmp_path: Path) -> None:
+    original_sleep = slack_client_module.time.sleep
+    slack_client_module.time.sleep = lambda _seconds: None
+    try:
+        outbox = SlackOutbox(tmp_path / "digest.db", max_attempts=2)
+        publisher = SlackPublisher("https://hooks.slack.example/T", outbox=outbox)
+        outbox.enqueue([{"text": "a1"}, {"text": "a2"}])
+        outbox.enqueue([{"text": "b1"}])
+
+        publisher._session = _FakeSession([_FakeResponse(503)] * 3)
+        with pytest.raises(RuntimeError, match="chunk 1"):
+            publisher.flush()
+        assert outbox.stats()["pending"] == 3
+
+        # Second failed flush hits the cap: report a is dropped and report b delivered.
+        publisher._session = _FakeSession([_FakeResponse(503)] * 3)
+        assert publisher.flush() == 1
+        assert publisher._session.sent == ["b1"]
+        assert outbox.stats() == {"pending": 0, "failed": 2, "delivered": 1}
+    finally:
+        slack_client_module.time.sleep = original_sleep
+
+
+def test_retry_after_beyond_the_deadline_is_not_slept(tmp_path: Path) -> None:
+    sleeps: list[float] = []
+    original_sleep = slack_client_module.time.sleep
+    slack_client_module.time.sleep = sleeps.append
+    try:
+        outbox = SlackOutbox(tmp_path / "digest.db")
+        publisher = SlackPublisher("https://hooks.slack.example/T", outbox=outbox)
+        publisher._session = _FakeSession([_FakeResponse(429, {"Retry-After": "30"})])
+        with pytest.raises(RuntimeError, match="deadline"):
+            publisher.publish("later", [], datetime(2026, 2, 27, 18, 10), deadline=Deadline(5))
+        assert sleeps == []
+        assert outbox.stats()["pending"] == 1
+    finally:
+        slack_client_module.time.sleep = original_sleep
+
+
+def test_notices_are_sent_directly_and_never_queued(tmp_path: Path) -> None:
+    outbox = SlackOutbox(tmp_path / "digest.db")
+    publisher = SlackPublisher("https://hooks.slack.example/T", outbox=outbox)
+
+    publisher._session = _FakeSession([_FakeResponse(400)])
+    with pytest.raises(RuntimeError):
+        publisher.publish_text("no new disclosures")
+    assert outbox.stats()["pending"] == 0 and outbox.stats()["failed"] == 0
+
+    # The same notice again is sent again, not dropped as an already-queued duplicate.
+    publisher._session = _FakeSession([])
+    assert publisher.publish_text("no new disclosures")
+    assert publisher.publish_text("no new disclosures")
+    assert publisher._session.sent == ["no new disclosures"] * 2
+    assert outbox.stats() == {"pending": 0, "failed": 0, "delivered": 0}
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import dart_digest.pipeline as pipeline_module
+from benchmarks import synthetic
+from benchmarks.hot_paths import bench_settings
+from benchmarks.memory_stream import measure, run_materialized, run_pipeline
+from dart_digest.market_filter import CompanyUniverse, MarketFilter
+from dart_digest.pipeline import DigestPipeline
+from dart_digest.scoring import score_disclosures
+from dart_digest.selection import SelectionRules, TopKSelector
+from dart_digest.storage import Storage
+from dart_digest.streaming import (
+    StreamCounts,
+    batched,
+    drop_processed,
+    filter_markets,
+    mark_processed,
+    score_batches,
+)
+
+
+def test_streamed_stages_match_materialized_selection(tmp_path: Path) -> None:
+    settings = bench_settings(tmp_path)
+    market_filter = MarketFilter(
+        CompanyUniverse.from_csv(settings.company_map_path), settings.fetch_markets
+    )
+    storage = Storage(settings.db_path)
+    rules = SelectionRules.from_settings(settings)
+
+    expected = TopKSelector(rules)
+    expected.extend(score_disclosures(market_filter.filter(synthetic.make_disclosures(600))))
+
+    counts = StreamCounts()
+    streamed = TopKSelector(rules)
+    stream = mark_processed(
+        score_batches(
+            drop_processed(
+                filter_markets(batched(synthetic.iter_disclosures(600), 64), market_filter, counts),
+                storage,
+                counts,
+            ),
+            counts,
+        ),
+        storage,
+    )
+    for batch in stream:
+        streamed.extend(batch)
+
+    assert [item.disclosure.receipt_no for item in streamed.select()] == [
+        item.disclosure.receipt_no for item in expected.select()
+    ]
+    assert counts.fetched == 600
+    assert counts.scored == counts.candidates == counts.in_market > 0
+
+    # Marked in batches, so a second pass over the same input finds nothing new.
+    again = StreamCounts()
+    replay = drop_processed(
+        filter_markets(batched(synthetic.iter_disclosures(600), 64), market_filter, again),
+        storage,
+        again,
+    )
+    assert list(replay) == [] and again.candidates == 0
+
+
+def test_memory_benchmark_measures_the_real_pipeline() -> None:
+    pipeline = measure(run_pipeline, 600, 50, cache_size=100)
+    materialized = measure(run_materialized, 600, 50, cache_size=100)
+    assert pipeline["scored"] == materialized["scored"] > 0
+    assert pipeline["peak_bytes"] > 0
+
+
+def test_parallel_scoring_reaches_one_shared_pool(tmp_path: Path) -> None:
+    settings = bench_settings(tmp_path)
+    settings.news_enabled = False
+    settings.score_workers = 2
+    settings.score_parallel_threshold = 100
+    settings.stream_batch_size = 64
+
+    pools: list["_CountingPool"] = []
+
+    class _CountingPool(pipeline_module.ProcessPoolExecutor):
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            super().__init__(*args, **kwargs)
+            self.mapped = 0
+            pools.append(self)
+
+        def map(self, *args: object, **kwargs: object):  # type: ignore[override]
+            self.mapped += 1
+            return super().map(*args, **kwargs)
+
+    original_pool = pipeline_module.ProcessPoolExecutor
+    original_fetch = pipeline_module.fetch_today_rss
+    pipeline_module.ProcessPoolExecutor = _CountingPool
+    pipeline_module.fetch_today_rss = lambda _url, **_kwargs: synthetic.make_rss_xml(400)
+    try:
+        result = DigestPipeline(settings).run(force=False)
+    finally:
+        pipeline_module.ProcessPoolExecutor = original_pool
+        pipeline_module.fetch_today_rss = original_fetch
+
+    assert result.status == "completed"
+    # One pool for the whole run, used by every (post-dedup, sub-threshold) batch.
+    assert len(pools) == 1
+    assert pools[0].mapped > 1